@@ -12,6 +12,8 @@ from amatino.am_type import AMType
 from amatino.ledger import Ledger
 from amatino.recursive_ledger import RecursiveLedger
 from amatino.ledger_row import LedgerRow
+from amatino.columnar_ledger import ColumnarLedger
+from amatino.columnar_ledger import ColumnarRecursiveLedger
 from amatino.user import User
 from amatino.balance import Balance
 from amatino.recursive_balance import RecursiveBalance
@@ -19,8 +21,23 @@ from amatino.performance import Performance
 from amatino.position import Position
 from amatino.tree_node import TreeNode
 from amatino.tree import Tree
+from amatino.chart_of_accounts import ChartOfAccounts
 from amatino.state import State
 from amatino.user_list import UserList
 from amatino.tx_version_list import TransactionVersionList
 from amatino.amatino_error import AmatinoError
+from amatino.batch_error import BatchError
 from amatino.internal.errors.not_found import ResourceNotFound
+from amatino.internal.connection_pool import ConnectionPool
+from amatino.internal.unit_cache import UnitCache
+from amatino.internal.account_cache import AccountCache
+from amatino.internal.response_cache import ResponseCache
+from amatino.internal.retry_policy import RetryPolicy
+from amatino.internal.rate_limiter import RateLimiter
+from amatino.internal.compression import Compression
+from amatino.internal.transport import Transport
+from amatino.internal.in_process_server import InProcessServer
+from amatino.internal.instrumentation import Instrumentation
+from amatino.internal.histogram_collector import HistogramCollector
+from amatino.internal.prometheus_exporter import PrometheusExporter
+from amatino.internal.cassette import Cassette
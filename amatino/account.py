@@ -15,9 +15,11 @@ from typing import Optional
 from typing import Type
 from typing import Any
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
 from amatino.internal.immutable import Immutable
 from amatino.internal.encodable import Encodable
 from amatino.internal.api_request import ApiRequest
+from amatino.internal.response_cache import ResponseCache
 from amatino.internal.constrained_string import ConstrainedString
 from amatino.internal.data_package import DataPackage
 from amatino.internal.http_method import HTTPMethod
@@ -26,6 +28,8 @@ from amatino.internal.url_target import UrlTarget
 from amatino.api_error import ApiError
 from amatino.missing_key import MissingKey
 from amatino.denominated import Denominated
+from amatino.internal.account_cache import AccountCache
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Account')
 
@@ -39,6 +43,7 @@ class Account(Denominated):
     _PATH = '/accounts'
     MAX_DESCRIPTION_LENGTH = 1024
     MAX_NAME_LENGTH = 1024
+    MAX_RETRIEVE_BATCH_SIZE = 100
     _URL_KEY = 'account_id'
 
     def __init__(
@@ -118,6 +123,8 @@ class Account(Denominated):
         )
 
         account = cls._decode(entity, request.response_data)
+        AccountCache.shared().store([account])
+        ResponseCache.entity_changed(entity)
 
         return account
 
@@ -142,9 +149,114 @@ class Account(Denominated):
         )
 
         account = cls._decode(entity, request.response_data)
+        AccountCache.shared().store([account])
 
         return account
 
+    @classmethod
+    def retrieve_many(
+        cls: Type[T],
+        entity: Entity,
+        account_ids: List[int],
+        max_workers: int = 4
+    ) -> List[T]:
+        """
+        Return many existing Accounts, ordered as their ids were supplied.
+        Ids are sent in batches of up to MAX_RETRIEVE_BATCH_SIZE per
+        request, with up to `max_workers` requests in flight at once.
+        """
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        if not isinstance(account_ids, list):
+            raise TypeError('account_ids must be of type `List[int]`')
+
+        if False in [isinstance(i, int) for i in account_ids]:
+            raise TypeError('account_ids must be of type `List[int]`')
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise TypeError('max_workers must be a positive `int`')
+
+        unique = list(dict.fromkeys(account_ids))
+        size = cls.MAX_RETRIEVE_BATCH_SIZE
+        batches = [unique[i:i + size] for i in range(0, len(unique), size)]
+
+        def retrieve(batch: List[int]) -> List[T]:
+            return cls._retrieve_batch(entity, batch)
+
+        if len(batches) < 2 or max_workers < 2:
+            outcomes = [retrieve(b) for b in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(retrieve, batches))
+
+        accounts = {a.id_: a for o in outcomes for a in o}
+        AccountCache.shared().store(accounts.values())
+
+        missing = [i for i in unique if i not in accounts]
+        if len(missing) > 0:
+            raise ApiError('Accounts not returned: {}'.format(missing))
+
+        return [accounts[i] for i in account_ids]
+
+    @classmethod
+    def _retrieve_batch(
+        cls: Type[T],
+        entity: Entity,
+        account_ids: List[int]
+    ) -> List[T]:
+        """Retrieve a batch of Accounts in a single request"""
+        targets = UrlTarget.from_many_integers(Account._URL_KEY, account_ids)
+        url_parameters = UrlParameters(entity_id=entity.id_, targets=targets)
+
+        request = ApiRequest(
+            path=Account._PATH,
+            method=HTTPMethod.GET,
+            credentials=entity.session,
+            data=None,
+            url_parameters=url_parameters
+        )
+
+        return cls._decode_many(entity, request.response_data)
+
+    @classmethod
+    def lookup(
+        cls: Type[T],
+        entity: Entity,
+        account_id: int,
+        batch: Optional[List[int]] = None
+    ) -> T:
+        """
+        Return an Account from the shared AccountCache, retrieving it if it
+        is not cached. Optionally supply the ids of other Accounts likely to
+        be needed soon, in `batch`. Those not cached are retrieved in the
+        same request. The batch is then emptied, whether or not it could be
+        retrieved, such that callers sharing it attempt it only once.
+        """
+        cache = AccountCache.shared()
+        account = cache.lookup(entity, account_id)
+        if account is not None:
+            return account
+
+        ids = [account_id]
+        if batch is not None:
+            ids = cache.missing(entity, [account_id] + list(batch))
+
+        if len(ids) > 1:
+            try:
+                cls.retrieve_many(entity, ids)
+            except Exception:
+                # Some of the batch may be unreadable by this User, which
+                # need not prevent retrieval of the Account requested.
+                pass
+            finally:
+                del batch[:]
+            account = cache.lookup(entity, account_id)
+            if account is not None:
+                return account
+
+        return cls.retrieve(entity, account_id)
+
     def update(
         self: T,
         name: Optional[str] = None,
@@ -189,6 +301,9 @@ class Account(Denominated):
         if account.id_ != self.id_:
             raise ApiError('Returned Account ID does not match request ID')
 
+        AccountCache.shared().store([account])
+        ResponseCache.entity_changed(self.entity)
+
         return account
 
     def delete(self):
@@ -254,6 +369,7 @@ class Account(Denominated):
             return data
 
     @classmethod
+    @Instrumentation.decoder
     def _decode(
         cls: Type[T],
         entity: Entity,
@@ -263,6 +379,7 @@ class Account(Denominated):
         return cls._decode_many(entity, data)[0]
 
     @classmethod
+    @Instrumentation.decoder
     def _decode_many(
         cls: Type[T],
         entity: Entity,
@@ -305,7 +422,7 @@ class Account(Denominated):
         if self.parent_id is None:
             return None
         assert isinstance(self.parent_id, int)
-        return Account.retrieve(self.entity, self.parent_id)
+        return Account.lookup(self.entity, self.parent_id)
 
     class UpdateArguments(Encodable):
         def __init__(
@@ -0,0 +1,542 @@
+"""
+Amatino API Python Bindings
+Asyncio Module
+Author: hugh@amatino.io
+
+Awaitable equivalents of the Amatino classes that perform I/O. Each class
+here is a subclass of its blocking counterpart, differing only in that the
+classmethods which communicate with the Amatino API are coroutines. For
+example:
+
+    from amatino import aio
+
+    ledger = await aio.Ledger.retrieve(entity, account)
+
+Requests are sent over non-blocking connections, such that a single event
+loop may drive many concurrent requests. Instances returned by these
+classmethods otherwise behave exactly as their blocking counterparts do, and
+their instance methods and properties remain blocking.
+"""
+import amatino
+from datetime import datetime
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+from amatino.am_type import AMType
+from amatino.color import Color
+from amatino.denomination import Denomination
+from amatino.entity import Entity
+from amatino.entry import Entry
+from amatino.ledger_order import LedgerOrder
+from amatino.session import Session
+from amatino.internal.async_api_request import AsyncApiRequest
+from amatino.internal.data_package import DataPackage
+from amatino.internal.http_method import HTTPMethod
+from amatino.internal.url_parameters import UrlParameters
+from amatino.internal.url_target import UrlTarget
+from amatino.internal.unit_cache import UnitCache
+from amatino.internal.account_cache import AccountCache
+from amatino.internal.response_cache import ResponseCache
+
+T = TypeVar('T')
+
+
+class GlobalUnit(amatino.GlobalUnit):
+    """An awaitable equivalent of amatino.GlobalUnit"""
+
+    @classmethod
+    async def retrieve(cls: Type[T], session: Session, id_: int) -> T:
+        """Retrieve a Global Unit"""
+        if not isinstance(id_, int):
+            raise TypeError('id_ must be of type `int`')
+        return (await cls.retrieve_many(session, [id_]))[0]
+
+    @classmethod
+    async def retrieve_many(
+        cls: Type[T],
+        session: Session,
+        ids: List[int]
+    ) -> List[T]:
+        """Retrieve a set of Global Units"""
+
+        if not isinstance(session, Session):
+            raise TypeError('session must be of type `Session`')
+
+        if not isinstance(ids, list):
+            raise TypeError('ids must be of type `List[int]`')
+
+        if False in [isinstance(i, int) for i in ids]:
+            raise TypeError('ids must be of type `List[int]`')
+
+        targets = UrlTarget.from_many_integers(cls._URL_KEY, ids)
+        parameters = UrlParameters.from_targets(targets)
+
+        request = await AsyncApiRequest.send(
+            path=cls._PATH,
+            url_parameters=parameters,
+            credentials=session,
+            method=HTTPMethod.GET
+        )
+
+        return cls._decode_many(request.response_data)
+
+
+class CustomUnit(amatino.CustomUnit):
+    """An awaitable equivalent of amatino.CustomUnit"""
+
+    @classmethod
+    async def retrieve(
+        cls: Type[T],
+        entity: Entity,
+        custom_unit_id: int
+    ) -> T:
+
+        target = UrlTarget.from_integer(cls._URL_KEY, custom_unit_id)
+        parameters = UrlParameters(entity_id=entity.id_, targets=[target])
+
+        request = await AsyncApiRequest.send(
+            path=cls._PATH,
+            method=HTTPMethod.GET,
+            data=None,
+            url_parameters=parameters,
+            credentials=entity.session
+        )
+
+        return cls._decode(entity, request.response_data)
+
+
+class Account(amatino.Account):
+    """An awaitable equivalent of amatino.Account"""
+
+    @classmethod
+    async def create(
+        cls: Type[T],
+        entity: Entity,
+        name: str,
+        am_type: AMType,
+        denomination: Denomination,
+        description: Optional[str] = None,
+        parent: Optional[amatino.Account] = None,
+        counter_party: Optional[Entity] = None,
+        color: Optional[Color] = None
+    ) -> T:
+
+        arguments = cls.CreateArguments(
+            name,
+            description,
+            am_type,
+            parent,
+            denomination,
+            counter_party,
+            color
+        )
+
+        data = DataPackage.from_object(arguments)
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        request = await AsyncApiRequest.send(
+            path=cls._PATH,
+            method=HTTPMethod.POST,
+            credentials=entity.session,
+            data=data,
+            url_parameters=parameters
+        )
+
+        account = cls._decode(entity, request.response_data)
+        AccountCache.shared().store([account])
+        ResponseCache.entity_changed(entity)
+
+        return account
+
+    @classmethod
+    async def retrieve(
+        cls: Type[T],
+        entity: Entity,
+        account_id: int
+    ) -> T:
+        """
+        Return an existing Account
+        """
+        target = UrlTarget.from_integer(key=cls._URL_KEY, value=account_id)
+        url_parameters = UrlParameters(entity_id=entity.id_, targets=[target])
+
+        request = await AsyncApiRequest.send(
+            path=cls._PATH,
+            method=HTTPMethod.GET,
+            credentials=entity.session,
+            data=None,
+            url_parameters=url_parameters
+        )
+
+        return cls._decode(entity, request.response_data)
+
+
+class Transaction(amatino.Transaction):
+    """An awaitable equivalent of amatino.Transaction"""
+
+    @classmethod
+    async def create(
+        cls: Type[T],
+        entity: Entity,
+        time: datetime,
+        entries: List[Entry],
+        denomination: Denomination,
+        description: Optional[str] = None,
+    ) -> T:
+
+        arguments = cls.CreateArguments(
+            time,
+            entries,
+            denomination,
+            description
+        )
+
+        data = DataPackage.from_object(arguments)
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        request = await AsyncApiRequest.send(
+            path=cls._PATH,
+            method=HTTPMethod.POST,
+            credentials=entity.session,
+            data=data,
+            url_parameters=parameters
+        )
+
+        ResponseCache.entity_changed(entity)
+
+        return cls._decode(entity, request.response_data)
+
+    @classmethod
+    async def retrieve(
+        cls: Type[T],
+        entity: Entity,
+        id_: int,
+        denomination: Denomination
+    ) -> T:
+        """Return a retrieved Transaction"""
+        return (await cls.retrieve_many(entity, [id_], denomination))[0]
+
+    @classmethod
+    async def retrieve_many(
+        cls: Type[T],
+        entity: Entity,
+        ids: List[int],
+        denomination: Denomination
+    ) -> List[T]:
+        """Return many retrieved Transactions"""
+
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        if not isinstance(ids, list):
+            raise TypeError('ids must be of type `list`')
+
+        if False in [isinstance(i, int) for i in ids]:
+            raise TypeError('ids must be of type `int`')
+
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        data = DataPackage(list_data=[cls.RetrieveArguments(
+            i, denomination, None
+        ) for i in ids])
+
+        request = await AsyncApiRequest.send(
+            path=cls._PATH,
+            method=HTTPMethod.GET,
+            credentials=entity.session,
+            data=data,
+            url_parameters=parameters
+        )
+
+        return cls.decode_many(entity, request.response_data)
+
+
+class Ledger(amatino.Ledger):
+    """An awaitable equivalent of amatino.Ledger"""
+
+    @classmethod
+    async def retrieve(
+        cls: Type[T],
+        entity: Entity,
+        account: amatino.Account,
+        order: LedgerOrder = LedgerOrder.YOUNGEST_FIRST,
+        page: int = 1,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        denomination: Optional[Denomination] = None
+    ) -> T:
+        """
+        Retrieve a Ledger for the supplied account. Optionally specify order,
+        page, denomination, start time, and end time.
+        """
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        if denomination is None:
+            denomination = await _denomination(account)
+
+        arguments = cls.RetrieveArguments(
+            account,
+            order,
+            page,
+            start_time,
+            end_time,
+            denomination
+        )
+        data = DataPackage(object_data=arguments, override_listing=True)
+
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        request = await AsyncApiRequest.send(
+            path=cls._PATH,
+            method=HTTPMethod.GET,
+            credentials=entity.session,
+            data=data,
+            url_parameters=parameters
+        )
+
+        return cls._decode(entity, request.response_data)
+
+
+class RecursiveLedger(amatino.RecursiveLedger, Ledger):
+    """An awaitable equivalent of amatino.RecursiveLedger"""
+    pass
+
+
+class _BalanceRetrieval:
+    """Awaitable retrieval shared by Balance and RecursiveBalance"""
+
+    @classmethod
+    async def retrieve_many(
+        cls: Type[T],
+        entity: Entity,
+        arguments: List[Any]
+    ) -> List[T]:
+        """Retrieve several Balances."""
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        if False in [isinstance(a, cls.RetrieveArguments) for a in arguments]:
+            raise TypeError(
+                'arguments must be of type List[Balance.RetrieveArguments]'
+            )
+
+        data = DataPackage(list_data=arguments)
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        async def retrieve() -> Any:
+            return (await AsyncApiRequest.send(
+                path=cls.PATH,
+                method=HTTPMethod.GET,
+                credentials=entity.session,
+                data=data,
+                url_parameters=parameters
+            )).response_data
+
+        response_data = await _fetch(
+            entity,
+            cls.PATH,
+            data,
+            cls._as_of(arguments),
+            retrieve
+        )
+
+        return cls._decode_many(entity, response_data)
+
+    @classmethod
+    async def retrieve(
+        cls: Type[T],
+        entity: Entity,
+        account: amatino.Account,
+        balance_time: Optional[datetime] = None,
+        denomination: Optional[Denomination] = None
+    ) -> T:
+        """Retrieve a Balance"""
+        if denomination is None:
+            denomination = await _denomination(account)
+        arguments = cls.RetrieveArguments(
+            account,
+            balance_time,
+            denomination
+        )
+        return (await cls.retrieve_many(entity, [arguments]))[0]
+
+
+class Balance(_BalanceRetrieval, amatino.Balance):
+    """An awaitable equivalent of amatino.Balance"""
+    pass
+
+
+class RecursiveBalance(_BalanceRetrieval, amatino.RecursiveBalance):
+    """An awaitable equivalent of amatino.RecursiveBalance"""
+    pass
+
+
+class _DerivedRetrieval:
+    """Awaitable retrieval shared by Tree, Position, and Performance"""
+
+    @classmethod
+    async def _retrieve(cls: Type[T], entity: Entity, arguments: Any) -> T:
+
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        if not isinstance(arguments, cls.RetrieveArguments):
+            raise TypeError(
+                'arguments must be of type {}.RetrieveArguments'.format(
+                    cls.__name__
+                )
+            )
+
+        data = DataPackage(object_data=arguments, override_listing=True)
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        async def retrieve() -> Any:
+            return (await AsyncApiRequest.send(
+                path=cls._PATH,
+                method=HTTPMethod.GET,
+                credentials=entity.session,
+                data=data,
+                url_parameters=parameters
+            )).response_data
+
+        response_data = await _fetch(
+            entity,
+            cls._PATH,
+            data,
+            cls._as_of(arguments),
+            retrieve
+        )
+
+        return cls.decode(entity, response_data)
+
+
+class Tree(_DerivedRetrieval, amatino.Tree):
+    """An awaitable equivalent of amatino.Tree"""
+
+    @classmethod
+    async def retrieve(
+        cls: Type[T],
+        entity: Entity,
+        balance_time: datetime,
+        denomination: Denomination
+    ) -> T:
+
+        arguments = cls.RetrieveArguments(
+            balance_time=balance_time,
+            denomination=denomination
+        )
+
+        return await cls._retrieve(entity, arguments)
+
+
+class Position(_DerivedRetrieval, amatino.Position):
+    """An awaitable equivalent of amatino.Position"""
+
+    @classmethod
+    async def retrieve(
+        cls: Type[T],
+        entity: Entity,
+        balance_time: datetime,
+        denomination: Denomination,
+        depth: Optional[int] = None
+    ) -> T:
+
+        arguments = cls.RetrieveArguments(
+            balance_time=balance_time,
+            denomination=denomination,
+            depth=depth
+        )
+
+        return await cls._retrieve(entity, arguments)
+
+
+class Performance(_DerivedRetrieval, amatino.Performance):
+    """An awaitable equivalent of amatino.Performance"""
+
+    @classmethod
+    async def retrieve(
+        cls: Type[T],
+        entity: Entity,
+        start_time: datetime,
+        end_time: datetime,
+        denomination: Denomination,
+        depth: Optional[int] = None
+    ) -> T:
+
+        arguments = cls.RetrieveArguments(
+            start_time=start_time,
+            end_time=end_time,
+            denomination=denomination,
+            depth=depth
+        )
+
+        return await cls._retrieve(entity, arguments)
+
+
+async def _fetch(
+    entity: Entity,
+    path: str,
+    data: DataPackage,
+    as_of: Optional[datetime],
+    retrieve: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Return response data for a view of an Entity, from the installed
+    ResponseCache if possible, otherwise by awaiting `retrieve`
+    """
+    cache = ResponseCache.shared()
+    if cache is None or not ResponseCache.settled(as_of):
+        return await retrieve()
+
+    key = cache.key(entity, path, data)
+    response_data = cache.lookup(entity, key)
+    if response_data is not None:
+        return response_data
+
+    response_data = await retrieve()
+    cache.store(entity, key, response_data)
+    return response_data
+
+
+async def _denomination(account: amatino.Account) -> Denomination:
+    """
+    Return the unit denominating an Account without blocking, using the
+    Account's cached unit, or the shared UnitCache, if either has it
+    """
+    if account.global_unit_id is not None:
+        if account._denominated_cached_global_unit is not None:
+            return account._denominated_cached_global_unit
+    elif account._denominated_cached_custom_unit is not None:
+        return account._denominated_cached_custom_unit
+
+    cache = UnitCache.shared()
+    unit = cache.lookup(
+        account.entity,
+        account.global_unit_id,
+        account.custom_unit_id
+    )
+
+    if unit is None and account.global_unit_id is not None:
+        unit = await GlobalUnit.retrieve(
+            account.entity.session,
+            account.global_unit_id
+        )
+        cache.store(account.entity, unit)
+    elif unit is None:
+        unit = await CustomUnit.retrieve(
+            account.entity,
+            account.custom_unit_id
+        )
+        cache.store(account.entity, unit)
+
+    if account.global_unit_id is not None:
+        account._denominated_cached_global_unit = unit
+    else:
+        account._denominated_cached_custom_unit = unit
+
+    return unit
@@ -0,0 +1,44 @@
+"""
+Amatino API Python Bindings
+Batch Error Module
+Author: hugh@amatino.io
+"""
+from amatino.amatino_error import AmatinoError
+from amatino.internal.immutable import Immutable
+from typing import Any
+from typing import Dict
+from typing import List
+
+
+class BatchError(AmatinoError):
+    """
+    An error raised when one or more items in a batch operation fail. Items
+    that did not fail may nonetheless have succeeded, and are available in
+    .results, which is ordered as the input to the batch operation was, with
+    None in place of each failed item. The error causing each failure is
+    available in .errors, keyed by the index of the failed item.
+    """
+    _MESSAGE = '{} of {} items in batch failed. First failure at index {}: {}'
+
+    def __init__(
+        self,
+        results: List[Any],
+        errors: Dict[int, Exception]
+    ) -> None:
+
+        first = min(errors)
+
+        super().__init__(self._MESSAGE.format(
+            len(errors),
+            len(results),
+            first,
+            repr(errors[first])
+        ))
+
+        self._results = results
+        self._errors = errors
+
+        return
+
+    results = Immutable(lambda s: s._results)
+    errors = Immutable(lambda s: s._errors)
@@ -0,0 +1,2 @@
+from amatino.benchmarks.benchmark import Benchmark
+from amatino.benchmarks.payloads import Payloads
@@ -0,0 +1,102 @@
+"""
+Amatino API Python Bindings
+Benchmark Module
+Author: hugh@amatino.io
+
+Base class for benchmarks of the library's hot paths.
+"""
+import time
+from statistics import median
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+
+class Benchmark:
+    """
+    Abstract class measuring the throughput of one operation. Concrete
+    benchmarks implement .run(), performing `operations` units of work, and
+    optionally .prepare() and .finish(), which are not timed.
+
+    Runs are repeated until at least `minimum_time` seconds have passed in
+    each of `repeats` samples. Throughput is reported from the fastest
+    sample, which is least disturbed by other activity on the machine.
+    """
+
+    def __init__(self, name: str, operations: int) -> None:
+
+        if not isinstance(name, str):
+            raise TypeError('name must be of type `str`')
+
+        if not isinstance(operations, int) or operations < 1:
+            raise TypeError('operations must be a positive `int`')
+
+        self._name = name
+        self._operations = operations
+
+        return
+
+    name = property(lambda s: s._name)
+    operations = property(lambda s: s._operations)
+
+    def prepare(self) -> None:
+        """Build any data the benchmark requires"""
+        return
+
+    def run(self) -> Any:
+        """Perform `operations` units of work"""
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        """Release any resources acquired in .prepare()"""
+        return
+
+    def execute(
+        self,
+        repeats: int = 5,
+        minimum_time: float = 0.2
+    ) -> Dict[str, Any]:
+        """Return a dictionary describing the measured throughput"""
+        self.prepare()
+        try:
+            self.run()
+            samples = [self._sample(minimum_time) for _ in range(repeats)]
+        finally:
+            self.finish()
+
+        best = min(samples)
+
+        return {
+            'name': self._name,
+            'operations': self._operations,
+            'repeats': repeats,
+            'best_seconds': best,
+            'median_seconds': median(samples),
+            'operations_per_second': self._operations / best
+        }
+
+    def _sample(self, minimum_time: float) -> float:
+        """Return the mean seconds taken by runs totalling minimum_time"""
+        runs = 0
+        elapsed = 0.0
+        while elapsed < minimum_time:
+            start = time.perf_counter()
+            self.run()
+            elapsed += time.perf_counter() - start
+            runs += 1
+        return elapsed / runs
+
+    @staticmethod
+    def select(
+        sequence: List[Any],
+        names: Optional[List[str]]
+    ) -> List['Benchmark']:
+        """
+        Return instances of the benchmarks in a sequence, optionally only
+        those with the supplied names
+        """
+        instances = [b() for b in sequence]
+        if names is None:
+            return instances
+        return [b for b in instances if b.name in names]
@@ -0,0 +1,36 @@
+"""
+Amatino API Python Bindings
+Benchmark Sequence Module
+Author: hugh@amatino.io
+
+Provides a constant manifest of benchmarks to execute
+"""
+from amatino.benchmarks.decode import LedgerRowsDecodeBenchmark
+from amatino.benchmarks.decode import LedgerRowsReadBenchmark
+from amatino.benchmarks.decode import TreeNodeDecodeBenchmark
+from amatino.benchmarks.decode import TransactionDecodeBenchmark
+from amatino.benchmarks.decode import AmatinoTimeDecodeBenchmark
+from amatino.benchmarks.decode import AmatinoAmountDecodeBenchmark
+from amatino.benchmarks.encode import EntrySerialiseBenchmark
+from amatino.benchmarks.encode import DataPackageEncodeBenchmark
+from amatino.benchmarks.signing import SignatureBenchmark
+from amatino.benchmarks.signing import SignerBenchmark
+from amatino.benchmarks.signing import RequestHeadersBenchmark
+from amatino.benchmarks.request_rate import TransactionRequestRateBenchmark
+from amatino.benchmarks.request_rate import LedgerRequestRateBenchmark
+
+SEQUENCE = [
+    LedgerRowsDecodeBenchmark,
+    LedgerRowsReadBenchmark,
+    TreeNodeDecodeBenchmark,
+    TransactionDecodeBenchmark,
+    AmatinoTimeDecodeBenchmark,
+    AmatinoAmountDecodeBenchmark,
+    EntrySerialiseBenchmark,
+    DataPackageEncodeBenchmark,
+    SignatureBenchmark,
+    SignerBenchmark,
+    RequestHeadersBenchmark,
+    TransactionRequestRateBenchmark,
+    LedgerRequestRateBenchmark
+]
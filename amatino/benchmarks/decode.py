@@ -0,0 +1,132 @@
+"""
+Amatino API Python Bindings
+Decode Benchmark Module
+Author: hugh@amatino.io
+"""
+from amatino import Entity
+from amatino import Ledger
+from amatino import Session
+from amatino import Transaction
+from amatino import TreeNode
+from amatino.internal.am_amount import AmatinoAmount
+from amatino.internal.am_time import AmatinoTime
+from amatino.benchmarks.benchmark import Benchmark
+from amatino.benchmarks.payloads import Payloads
+
+_ENTITY = Entity(
+    Session(1, 1, 'benchmark'),
+    'benchmark',
+    'Benchmark',
+    '',
+    1,
+    1,
+    None,
+    None
+)
+
+
+class LedgerRowsDecodeBenchmark(Benchmark):
+    """Decode a page of raw Ledger rows"""
+
+    def __init__(self) -> None:
+        super().__init__('decode_ledger_rows', 1000)
+        return
+
+    def prepare(self) -> None:
+        self._rows = Payloads.ledger(self.operations)['ledger_rows']
+        return
+
+    def run(self) -> None:
+        Ledger._decode_rows(self._rows)
+        return
+
+
+class LedgerRowsReadBenchmark(Benchmark):
+    """Decode a page of raw Ledger rows and read every field of each"""
+
+    def __init__(self) -> None:
+        super().__init__('decode_ledger_rows_and_fields', 1000)
+        return
+
+    def prepare(self) -> None:
+        self._rows = Payloads.ledger(self.operations)['ledger_rows']
+        return
+
+    def run(self) -> None:
+        AmatinoTime._parse.cache_clear()
+        for row in Ledger._decode_rows(self._rows):
+            row.transaction_time
+            row.debit
+            row.credit
+            row.balance
+        return
+
+
+class TreeNodeDecodeBenchmark(Benchmark):
+    """Decode a Tree's hierarchy of raw TreeNodes"""
+
+    def __init__(self) -> None:
+        super().__init__('decode_tree_nodes', 1000)
+        return
+
+    def prepare(self) -> None:
+        self._nodes = Payloads.tree(self.operations)['tree']
+        return
+
+    def run(self) -> None:
+        TreeNode.decode_many(_ENTITY, self._nodes)
+        return
+
+
+class TransactionDecodeBenchmark(Benchmark):
+    """Decode a list of raw Transactions"""
+
+    def __init__(self) -> None:
+        super().__init__('decode_transactions', 100)
+        return
+
+    def prepare(self) -> None:
+        self._transactions = Payloads.transactions(self.operations)
+        return
+
+    def run(self) -> None:
+        AmatinoTime._parse.cache_clear()
+        Transaction.decode_many(_ENTITY, self._transactions)
+        return
+
+
+class AmatinoTimeDecodeBenchmark(Benchmark):
+    """Decode distinct raw times, bypassing the parse memo"""
+
+    def __init__(self) -> None:
+        super().__init__('decode_amatino_time', 10000)
+        return
+
+    def prepare(self) -> None:
+        self._times = Payloads.times(self.operations)
+        return
+
+    def run(self) -> None:
+        AmatinoTime._parse.cache_clear()
+        decode = AmatinoTime.decode
+        for time in self._times:
+            decode(time)
+        return
+
+
+class AmatinoAmountDecodeBenchmark(Benchmark):
+    """Decode raw amounts"""
+
+    def __init__(self) -> None:
+        super().__init__('decode_amatino_amount', 10000)
+        return
+
+    def prepare(self) -> None:
+        self._amounts = Payloads.amounts(self.operations)
+        return
+
+    def run(self) -> None:
+        decode = AmatinoAmount.decode
+        for amount in self._amounts:
+            decode(amount)
+        return
@@ -0,0 +1,62 @@
+"""
+Amatino API Python Bindings
+Encode Benchmark Module
+Author: hugh@amatino.io
+"""
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+from amatino import Entry
+from amatino import GlobalUnitConstants
+from amatino import Side
+from amatino import Transaction
+from amatino.internal.data_package import DataPackage
+from amatino.benchmarks.benchmark import Benchmark
+
+
+class EntrySerialiseBenchmark(Benchmark):
+    """Serialise Entries"""
+
+    def __init__(self) -> None:
+        super().__init__('serialise_entries', 10000)
+        return
+
+    def prepare(self) -> None:
+        self._entries = [Entry(
+            Side(i % 2),
+            Decimal(i) / 100,
+            account_id=(i % 200) + 1,
+            description='Entry {}'.format(i)
+        ) for i in range(self.operations)]
+        return
+
+    def run(self) -> None:
+        for entry in self._entries:
+            entry.serialise()
+        return
+
+
+class DataPackageEncodeBenchmark(Benchmark):
+    """Encode a batch of Transaction creation arguments as request bytes"""
+
+    def __init__(self) -> None:
+        super().__init__('encode_data_package', 10)
+        return
+
+    def prepare(self) -> None:
+        start = datetime(2018, 1, 1)
+        self._arguments = [Transaction.CreateArguments(
+            start + timedelta(hours=i),
+            [
+                Entry(Side.debit, Decimal('10.50'), account_id=1),
+                Entry(Side.debit, Decimal('4.50'), account_id=2),
+                Entry(Side.credit, Decimal('15.00'), account_id=3)
+            ],
+            GlobalUnitConstants.USD,
+            'Transaction {}'.format(i)
+        ) for i in range(self.operations)]
+        return
+
+    def run(self) -> None:
+        DataPackage(list_data=self._arguments).as_json_bytes()
+        return
@@ -0,0 +1,192 @@
+"""
+Amatino API Python Bindings
+Benchmark Payloads Module
+Author: hugh@amatino.io
+
+Deterministic synthetic API response data, in the shapes the Amatino API
+returns, optionally replaced by responses recorded to disk.
+"""
+import json
+import os
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+from random import Random
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from amatino.internal.am_time import AmatinoTime
+
+_SEED = 1998
+_START = datetime(2018, 1, 1)
+
+
+class Payloads:
+    """
+    Raw response data used by benchmarks. By default, data is generated from
+    a fixed seed, such that results are comparable between runs. Call
+    Payloads.load() with a directory holding any of `ledger.json`,
+    `tree.json`, or `transactions.json` to benchmark recorded responses
+    instead.
+    """
+    _recorded = dict()  # type: Dict[str, Any]
+
+    @classmethod
+    def load(cls, directory: Optional[str]) -> None:
+        """Use responses recorded in the supplied directory, where present"""
+        cls._recorded = dict()
+        if directory is None:
+            return
+        for name in ('ledger', 'tree', 'transactions'):
+            path = os.path.join(directory, name + '.json')
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r') as file:
+                cls._recorded[name] = json.load(file)
+        return
+
+    @classmethod
+    def ledger(cls, rows: int = 1000) -> Dict[str, Any]:
+        """Return raw data describing a page of a Ledger"""
+        if 'ledger' in cls._recorded:
+            return cls._recorded['ledger']
+
+        random = Random(_SEED)
+        balance = Decimal(0)
+        ledger_rows = list()
+        for index in range(rows):
+            amount = Decimal(random.randint(1, 1000000)) / 100
+            debit = Decimal(0)
+            credit = Decimal(0)
+            if random.random() < 0.5:
+                debit = amount
+            else:
+                credit = amount
+            balance += debit - credit
+            ledger_rows.append([
+                index + 1,
+                cls._time(random, index),
+                'Transaction {}'.format(index + 1),
+                random.randint(1, 200),
+                'Account {}'.format(random.randint(1, 200)),
+                cls._amount(debit),
+                cls._amount(credit),
+                cls._amount(balance)
+            ])
+
+        return {
+            'account_id': 1,
+            'start_time': AmatinoTime(_START).serialise(),
+            'end_time': AmatinoTime(_START + timedelta(days=365)).serialise(),
+            'recursive': False,
+            'generated_time': AmatinoTime(_START).serialise(),
+            'global_unit_denomination': 5,
+            'custom_unit_denomination': None,
+            'ledger_rows': ledger_rows,
+            'page': 1,
+            'number_of_pages': 1,
+            'ordered_oldest_first': True
+        }
+
+    @classmethod
+    def tree(cls, accounts: int = 1000, fanout: int = 4) -> Dict[str, Any]:
+        """Return raw data describing a Tree of the supplied size"""
+        if 'tree' in cls._recorded:
+            return cls._recorded['tree']
+
+        random = Random(_SEED)
+        nodes = list()  # type: List[Dict[str, Any]]
+        roots = list()  # type: List[Dict[str, Any]]
+        for index in range(accounts):
+            parent = None
+            if index >= 5:
+                parent = nodes[(index - 5) // fanout]
+            node = {
+                'account_id': index + 1,
+                'depth': 0 if parent is None else parent['depth'] + 1,
+                'account_balance': cls._amount(
+                    Decimal(random.randint(-100000, 100000)) / 100
+                ),
+                'recursive_balance': cls._amount(
+                    Decimal(random.randint(-100000, 100000)) / 100
+                ),
+                'name': 'Account {}'.format(index + 1),
+                'type': (index % 5) + 1 if parent is None else parent['type'],
+                'children': list()
+            }
+            nodes.append(node)
+            if parent is None:
+                roots.append(node)
+            else:
+                parent['children'].append(node)
+
+        return {
+            'balance_time': AmatinoTime(_START).serialise(),
+            'generated_time': AmatinoTime(_START).serialise(),
+            'global_unit_denomination': 5,
+            'custom_unit_denomination': None,
+            'tree': roots
+        }
+
+    @classmethod
+    def transactions(
+        cls,
+        count: int = 100,
+        entries: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Return raw data describing a list of Transactions"""
+        if 'transactions' in cls._recorded:
+            return cls._recorded['transactions']
+
+        random = Random(_SEED)
+        transactions = list()
+        for index in range(count):
+            amount = Decimal(random.randint(1, 1000000)) / 100
+            time = cls._time(random, index)
+            transactions.append({
+                'transaction_id': index + 1,
+                'transaction_time': time,
+                'version_time': time,
+                'description': 'Transaction {}'.format(index + 1),
+                'entries': [{
+                    'account_id': random.randint(1, 200),
+                    'amount': cls._amount(amount),
+                    'description': '',
+                    'side': entry % 2
+                } for entry in range(entries)],
+                'global_unit_denomination': 5,
+                'custom_unit_denomination': None
+            })
+
+        return transactions
+
+    @classmethod
+    def times(cls, count: int = 10000) -> List[str]:
+        """Return distinct raw AmatinoTime strings"""
+        random = Random(_SEED)
+        return [cls._time(random, i) for i in range(count)]
+
+    @classmethod
+    def amounts(cls, count: int = 10000) -> List[str]:
+        """Return raw amount strings, a share negative and parenthesised"""
+        random = Random(_SEED)
+        amounts = list()
+        for _ in range(count):
+            amount = cls._amount(Decimal(random.randint(1, 10 ** 9)) / 100)
+            if random.random() < 0.2:
+                amount = '(' + amount + ')'
+            amounts.append(amount)
+        return amounts
+
+    @staticmethod
+    def _time(random: Random, index: int) -> str:
+        offset = timedelta(
+            hours=index,
+            microseconds=random.randint(0, 999999)
+        )
+        return AmatinoTime(_START + offset).serialise()
+
+    @staticmethod
+    def _amount(value: Decimal) -> str:
+        return '{0:,.2f}'.format(value)
@@ -0,0 +1,93 @@
+"""
+Amatino API Python Bindings
+Request Rate Benchmark Module
+Author: hugh@amatino.io
+"""
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+from typing import List
+from amatino import Account
+from amatino import AMType
+from amatino import Entity
+from amatino import Entry
+from amatino import GlobalUnitConstants
+from amatino import InProcessServer
+from amatino import Ledger
+from amatino import Session
+from amatino import Side
+from amatino import Transaction
+from amatino import Transport
+from amatino.benchmarks.benchmark import Benchmark
+
+_USD = GlobalUnitConstants.USD
+
+
+class RequestRateBenchmark(Benchmark):
+    """
+    Abstract benchmark of end-to-end requests, served by an InProcessServer
+    populated with an Entity holding `transactions` Transactions. The
+    previously installed Transport is restored when the benchmark finishes.
+    """
+
+    def __init__(self, name: str, operations: int, transactions: int) -> None:
+        super().__init__(name, operations)
+        self._transaction_count = transactions
+        return
+
+    def prepare(self) -> None:
+        self._previous = Transport.installed()
+        Transport.set_shared(InProcessServer())
+
+        session = Session.create_with_email('benchmark@example.com', 'secret')
+        self._entity = Entity.create(session, 'Benchmark', None)
+        self._cash = Account.create(self._entity, 'Cash', AMType.asset, _USD)
+        self._income = Account.create(
+            self._entity,
+            'Income',
+            AMType.income,
+            _USD
+        )
+
+        start = datetime(2018, 1, 1)
+        self._transactions = Transaction.create_many(self._entity, [(
+            start + timedelta(hours=i),
+            [
+                Entry(Side.debit, Decimal('10.00'), self._cash),
+                Entry(Side.credit, Decimal('10.00'), self._income)
+            ],
+            _USD,
+            'Sale {}'.format(i)
+        ) for i in range(self._transaction_count)])  # type: List[Transaction]
+
+        return
+
+    def finish(self) -> None:
+        Transport.set_shared(self._previous)
+        return
+
+
+class TransactionRequestRateBenchmark(RequestRateBenchmark):
+    """Retrieve Transactions one request at a time"""
+
+    def __init__(self) -> None:
+        super().__init__('request_transaction_retrieve', 100, 100)
+        return
+
+    def run(self) -> None:
+        for transaction in self._transactions:
+            Transaction.retrieve(self._entity, transaction.id_, _USD)
+        return
+
+
+class LedgerRequestRateBenchmark(RequestRateBenchmark):
+    """Retrieve and decode full 1,000 row Ledger pages"""
+
+    def __init__(self) -> None:
+        super().__init__('request_ledger_page', 1, 1000)
+        return
+
+    def run(self) -> None:
+        for row in Ledger.retrieve(self._entity, self._cash):
+            row.balance
+        return
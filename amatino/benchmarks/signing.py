@@ -0,0 +1,67 @@
+"""
+Amatino API Python Bindings
+Signing Benchmark Module
+Author: hugh@amatino.io
+"""
+from amatino import Session
+from amatino.internal.request_headers import RequestHeaders
+from amatino.internal.signature import Signature
+from amatino.internal.signer import Signer
+from amatino.benchmarks.benchmark import Benchmark
+
+_PATHS = ('/transactions', '/accounts', '/accounts/ledger', '/trees')
+
+
+class SignatureBenchmark(Benchmark):
+    """Compute request signatures"""
+
+    def __init__(self) -> None:
+        super().__init__('compute_signature', 10000)
+        return
+
+    def prepare(self) -> None:
+        self._key = 'k' * 64
+        return
+
+    def run(self) -> None:
+        for index in range(self.operations):
+            Signature(self._key, _PATHS[index % len(_PATHS)])
+        return
+
+
+class SignerBenchmark(Benchmark):
+    """Compute request signatures with a pre-keyed, memoising Signer"""
+
+    def __init__(self) -> None:
+        super().__init__('compute_signature_signer', 10000)
+        return
+
+    def prepare(self) -> None:
+        self._signer = Signer('k' * 64)
+        return
+
+    def run(self) -> None:
+        sign = self._signer.sign
+        for index in range(self.operations):
+            sign(_PATHS[index % len(_PATHS)])
+        return
+
+
+class RequestHeadersBenchmark(Benchmark):
+    """Compute signed request headers"""
+
+    def __init__(self) -> None:
+        super().__init__('compute_request_headers', 10000)
+        return
+
+    def prepare(self) -> None:
+        self._session = Session(1, 1, 'k' * 64)
+        return
+
+    def run(self) -> None:
+        for index in range(self.operations):
+            RequestHeaders(
+                _PATHS[index % len(_PATHS)],
+                self._session
+            ).dictionary()
+        return
@@ -0,0 +1,243 @@
+"""
+Amatino API Python Bindings
+Chart of Accounts Module
+Author: hugh@amatino.io
+"""
+from amatino.entity import Entity
+from amatino.account import Account
+from amatino.am_type import AMType
+from amatino.tree_node import TreeNode
+from amatino.internal.immutable import Immutable
+from typing import TypeVar
+from typing import Type
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+T = TypeVar('T', bound='ChartOfAccounts')
+
+
+class ChartOfAccounts:
+    """
+    A Chart of Accounts is an in-memory index of the Account hierarchy of an
+    Entity. It answers questions about the shape of that hierarchy - which
+    Account is the parent of which, whether one Account falls under
+    another, and so on - without communicating with the Amatino API.
+
+    Build a Chart of Accounts from a Tree, Position, or Performance via
+    ChartOfAccounts.from_tree(), or from a list of Accounts via
+    ChartOfAccounts.from_accounts().
+
+    Lookups of parent, children, ancestors, descendants, depth, and subtree
+    membership take constant time, save for the cost of copying the list
+    returned. Accounts whose parent is not present, for example because the
+    requesting User may not read it, are treated as roots.
+    """
+
+    def __init__(
+        self,
+        entity: Entity,
+        parents: Dict[int, Optional[int]],
+        names: Dict[int, str],
+        types: Dict[int, AMType]
+    ) -> None:
+
+        assert isinstance(entity, Entity)
+
+        self._entity = entity
+        self._parents = parents
+        self._names = names
+        self._types = types
+
+        children = {i: list() for i in parents}  # type: Dict[int, List[int]]
+        roots = list()  # type: List[int]
+        for account_id, parent_id in parents.items():
+            if parent_id in children:
+                children[parent_id].append(account_id)
+                continue
+            roots.append(account_id)
+
+        # Lay accounts out in depth-first order, such that the descendants of
+        # an account occupy a contiguous run following it. Its ancestors are
+        # recorded as it is reached, nearest first.
+        order = list()  # type: List[int]
+        spans = dict()  # type: Dict[int, Tuple[int, int]]
+        ancestors = dict()  # type: Dict[int, Tuple[int, ...]]
+        stack = [(r, ()) for r in reversed(roots)]
+
+        while len(stack) > 0:
+            account_id, lineage = stack.pop()
+            if account_id in spans:
+                raise ValueError('Account hierarchy contains a cycle')
+            spans[account_id] = (len(order), 0)
+            ancestors[account_id] = lineage
+            order.append(account_id)
+            descendant_lineage = (account_id,) + lineage
+            stack.extend([
+                (c, descendant_lineage) for c in reversed(children[account_id])
+            ])
+
+        if len(order) != len(parents):
+            raise ValueError('Account hierarchy contains a cycle')
+
+        # A run ends where the next account not descended from it begins
+        for account_id in reversed(order):
+            start = spans[account_id][0]
+            end = start + 1
+            if len(children[account_id]) > 0:
+                end = spans[children[account_id][-1]][1]
+            spans[account_id] = (start, end)
+
+        self._children = children
+        self._roots = roots
+        self._order = order
+        self._spans = spans
+        self._ancestors = ancestors
+
+        return
+
+    entity = Immutable(lambda s: s._entity)
+    account_ids = Immutable(lambda s: list(s._order))
+    root_ids = Immutable(lambda s: list(s._roots))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, account_id: Any) -> bool:
+        return account_id in self._parents
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def parent_id(self, account_id: int) -> Optional[int]:
+        """
+        Return the id of the parent of an Account, or None if it is a root
+        """
+        self._require(account_id)
+        if len(self._ancestors[account_id]) < 1:
+            return None
+        return self._ancestors[account_id][0]
+
+    def children_ids(self, account_id: int) -> List[int]:
+        """Return the ids of the immediate children of an Account"""
+        self._require(account_id)
+        return list(self._children[account_id])
+
+    def ancestor_ids(self, account_id: int) -> List[int]:
+        """
+        Return the ids of the ancestors of an Account, nearest first, ending
+        with its root
+        """
+        self._require(account_id)
+        return list(self._ancestors[account_id])
+
+    def descendant_ids(self, account_id: int) -> List[int]:
+        """
+        Return the ids of all Accounts descended from an Account, in
+        depth-first order
+        """
+        self._require(account_id)
+        start, end = self._spans[account_id]
+        return self._order[start + 1:end]
+
+    def depth(self, account_id: int) -> int:
+        """Return the depth of an Account, where roots have depth zero"""
+        self._require(account_id)
+        return len(self._ancestors[account_id])
+
+    def name(self, account_id: int) -> str:
+        """Return the name of an Account"""
+        self._require(account_id)
+        return self._names[account_id]
+
+    def am_type(self, account_id: int) -> AMType:
+        """Return the AMType of an Account"""
+        self._require(account_id)
+        return self._types[account_id]
+
+    def is_descendant(self, account_id: int, ancestor_id: int) -> bool:
+        """
+        Return True if an Account is descended from, or is, the supplied
+        ancestor Account
+        """
+        self._require(account_id)
+        self._require(ancestor_id)
+        start, end = self._spans[ancestor_id]
+        return start <= self._spans[account_id][0] < end
+
+    def subtree_ids(self, account_id: int) -> List[int]:
+        """Return the ids of an Account and all its descendants"""
+        self._require(account_id)
+        start, end = self._spans[account_id]
+        return self._order[start:end]
+
+    def _require(self, account_id: int) -> None:
+        if account_id not in self._parents:
+            raise KeyError(
+                'Account {} is not in this Chart of Accounts'.format(
+                    account_id
+                )
+            )
+        return
+
+    @classmethod
+    def from_tree(cls: Type[T], tree: Any) -> T:
+        """
+        Return a Chart of Accounts describing the Accounts in a Tree,
+        Position, or Performance. Note that Positions and Performances
+        retrieved to a limited depth describe only part of the hierarchy.
+        """
+        if not hasattr(tree, 'entity') or not hasattr(tree, 'nodes'):
+            raise TypeError('tree must be a Tree, Position, or Performance')
+        return cls.from_nodes(tree.entity, tree.nodes)
+
+    @classmethod
+    def from_nodes(cls: Type[T], entity: Entity, nodes: List[TreeNode]) -> T:
+        """Return a Chart of Accounts describing a hierarchy of TreeNodes"""
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        if False in [isinstance(n, TreeNode) for n in nodes]:
+            raise TypeError('nodes must be of type `List[TreeNode]`')
+
+        parents = dict()  # type: Dict[int, Optional[int]]
+        names = dict()  # type: Dict[int, str]
+        types = dict()  # type: Dict[int, AMType]
+        stack = [(n, None) for n in reversed(nodes)]
+
+        while len(stack) > 0:
+            node, parent_id = stack.pop()
+            parents[node.account_id] = parent_id
+            names[node.account_id] = node.name
+            types[node.account_id] = node.am_type
+            if node.children is not None:
+                stack.extend([
+                    (c, node.account_id) for c in reversed(node.children)
+                ])
+
+        return cls(entity, parents, names, types)
+
+    @classmethod
+    def from_accounts(cls: Type[T], accounts: List[Account]) -> T:
+        """
+        Return a Chart of Accounts describing a list of Accounts, all
+        belonging to the same Entity
+        """
+        if not isinstance(accounts, list) or len(accounts) < 1:
+            raise TypeError('accounts must be a non-empty `List[Account]`')
+
+        if False in [isinstance(a, Account) for a in accounts]:
+            raise TypeError('accounts must be of type `List[Account]`')
+
+        entity = accounts[0].entity
+        if False in [a.entity.id_ == entity.id_ for a in accounts]:
+            raise ValueError('accounts must all belong to the same Entity')
+
+        return cls(
+            entity,
+            {a.id_: a.parent_id for a in accounts},
+            {a.id_: a.name for a in accounts},
+            {a.id_: a.am_type for a in accounts}
+        )
@@ -0,0 +1,54 @@
+"""
+Amatino API Python Bindings
+Columnar Ledger Module
+Author: hugh@amatino.io
+"""
+from typing import Any
+from typing import List
+from typing import Type
+from typing import TypeVar
+from amatino.ledger import Ledger
+from amatino.recursive_ledger import RecursiveLedger
+from amatino.internal.immutable import Immutable
+from amatino.internal.ledger_columns import LedgerColumns
+
+T = TypeVar('T', bound='ColumnarLedger')
+
+
+class ColumnarLedger(Ledger):
+    """
+    A Columnar Ledger is a Ledger whose rows are stored column-wise in
+    contiguous arrays, rather than as one LedgerRow object per row. It is
+    retrieved and used exactly as a Ledger is, and consumes far less memory
+    per row.
+
+    Indexing or iterating a Columnar Ledger creates LedgerRows on demand.
+    The underlying columns are available via the .columns property. When
+    NumPy is installed, integer columns are NumPy arrays suitable for
+    vectorised operations. Amount columns hold integers scaled by
+    10 ** columns.scale.
+    """
+
+    columns = Immutable(lambda s: s._rows)
+    total_debits = Immutable(lambda s: s._rows.total_debits)
+    total_credits = Immutable(lambda s: s._rows.total_credits)
+
+    @classmethod
+    def _decode_rows(cls: Type[T], rows: List[Any]) -> LedgerColumns:
+        """Return LedgerColumns decoded from raw API response data"""
+        return LedgerColumns.decode(rows)
+
+    @classmethod
+    def _concatenate_rows(
+        cls: Type[T],
+        parts: List[LedgerColumns]
+    ) -> LedgerColumns:
+        """Return the columns of several Ledger pages joined in order"""
+        return LedgerColumns.concatenate(parts)
+
+
+class ColumnarRecursiveLedger(ColumnarLedger, RecursiveLedger):
+    """
+    A Columnar Recursive Ledger is a Recursive Ledger whose rows are stored
+    column-wise in contiguous arrays. See ColumnarLedger.
+    """
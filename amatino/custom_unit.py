@@ -22,6 +22,7 @@ from amatino.internal.api_request import ApiRequest
 from amatino.internal.http_method import HTTPMethod
 from amatino.internal.data_package import DataPackage
 from amatino.api_error import ApiError
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='CustomUnit')
 
@@ -154,6 +155,7 @@ class CustomUnit(Denomination):
         return unit
 
     @classmethod
+    @Instrumentation.decoder
     def _decode(
         cls: Type[T],
         entity: Entity,
@@ -162,6 +164,7 @@ class CustomUnit(Denomination):
         return cls._decodeMany(entity, data)[0]
 
     @classmethod
+    @Instrumentation.decoder
     def _decodeMany(
         cls: Type[T],
         entity: Entity,
@@ -247,10 +250,15 @@ class CustomUnit(Denomination):
             credentials=self.entity.session
         )
 
-        return CustomUnit._decode(
-            self.entity,
-            request.response_data
-        )
+        updated = CustomUnit._decode(self.entity, request.response_data)
+
+        # Imported here as the UnitCache module depends on this one
+        from amatino.internal.unit_cache import UnitCache
+        cache = UnitCache.shared()
+        cache.invalidate(self.entity, self.id_)
+        cache.store(self.entity, updated)
+
+        return updated
 
     def delete(
         self,
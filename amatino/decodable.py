@@ -10,6 +10,7 @@ from typing import Type
 from typing import List
 from typing import Any
 from amatino.unexpected_response_type import UnexpectedResponseType
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Decodable')
 
@@ -25,6 +26,7 @@ class Decodable:
         raise NotImplementedError
 
     @classmethod
+    @Instrumentation.decoder
     def decode_many(cls: Type[T], entity: Entity, data: Any) -> List[T]:
         if not isinstance(data, list):
             raise UnexpectedResponseType(data, list)
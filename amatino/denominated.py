@@ -4,9 +4,9 @@ Denominated Module
 Author: hugh@amatino.io
 """
 from amatino.denomination import Denomination
-from amatino.custom_unit import CustomUnit
 from amatino.global_unit import GlobalUnit
 from amatino.internal.immutable import Immutable
+from amatino.internal.unit_cache import UnitCache
 from amatino.entity import Entity
 from typing import TypeVar
 
@@ -50,22 +50,20 @@ class Denominated:
             assert isinstance(self.custom_unit_id, int)
 
         if self.global_unit_id is not None:
-            assert isinstance(self.global_unit_id, int)
             if self._denominated_cached_global_unit is not None:
                 return self._denominated_cached_global_unit
-            global_unit = GlobalUnit.retrieve(
-                self.entity.session,
-                self.global_unit_id
-            )
-            self._denominated_cached_global_unit = global_unit
-            return global_unit
-
-        if self._denominated_cached_custom_unit is not None:
+        elif self._denominated_cached_custom_unit is not None:
             return self._denominated_cached_custom_unit
-        custom_unit = CustomUnit.retrieve(
+
+        unit = UnitCache.shared().denomination(
             self.entity,
-            self.entity.session,
+            self.global_unit_id,
             self.custom_unit_id
         )
-        self._denominated_cached_custom_unit = custom_unit
-        return custom_unit
+
+        if isinstance(unit, GlobalUnit):
+            self._denominated_cached_global_unit = unit
+        else:
+            self._denominated_cached_custom_unit = unit
+
+        return unit
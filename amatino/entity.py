@@ -19,6 +19,7 @@ from amatino.internal.immutable import Immutable
 from amatino.internal.session_decodable import SessionDecodable
 from amatino.internal.disposition import Disposition
 from amatino.internal.url_target import UrlTarget
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Entity')
 
@@ -101,6 +102,7 @@ class Entity(SessionDecodable):
         return created_entity
 
     @classmethod
+    @Instrumentation.decoder
     def decode(cls: Type[T], data: Any, session: Session) -> T:
         """
         Return an Entity instance decoded from API response data
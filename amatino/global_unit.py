@@ -16,6 +16,7 @@ from typing import TypeVar
 from typing import Type
 from typing import Any
 from typing import List
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='GlobalUnit')
 
@@ -84,6 +85,7 @@ class GlobalUnit(Denomination):
         return units
 
     @classmethod
+    @Instrumentation.decoder
     def _decode_many(cls: Type[T], data: Any) -> List[T]:
         """Return a list of Global Units decoded from raw API response data"""
 
@@ -0,0 +1,137 @@
+"""
+Amatino API Python Bindings
+Account Cache Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import time
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from amatino.entity import Entity
+from amatino.internal.immutable import Immutable
+
+T = TypeVar('T', bound='AccountCache')
+AccountKey = Tuple[Any, str, int]
+CachedAccount = Tuple[float, Any]
+
+
+class AccountCache:
+    """
+    A thread-safe, process-wide cache of Accounts, scoped by Entity, shared
+    by the lazy properties that resolve an Account from its id. For example,
+    TreeNode.account, Balance.account, and Account.parent.
+
+    Accounts are also scoped by the Session that retrieved them, such that a
+    Session is only ever returned Accounts it was permitted to read, bound
+    to its own credentials.
+
+    Accounts may be modified, and so are cached for at most ttl seconds.
+    Accounts created, updated, or retrieved via the Account class are
+    placed in the cache, replacing any earlier version.
+
+    A single shared cache is used by all Amatino objects, unless it is
+    replaced via AccountCache.set_shared().
+    """
+    _DEFAULT_TTL = 60.0
+
+    _shared = None
+    _shared_lock = Lock()
+
+    def __init__(self, ttl: float = _DEFAULT_TTL) -> None:
+
+        if not isinstance(ttl, (int, float)) or ttl < 0:
+            raise TypeError('ttl must be a non-negative number')
+
+        self._ttl = float(ttl)
+        self._lock = Lock()
+        self._accounts = dict()  # type: Dict[AccountKey, CachedAccount]
+
+        return
+
+    ttl = Immutable(lambda s: s._ttl)
+
+    @classmethod
+    def shared(cls: Type[T]) -> T:
+        """Return the cache used by default by all Amatino objects"""
+        with cls._shared_lock:
+            if AccountCache._shared is None:
+                AccountCache._shared = cls()
+            return AccountCache._shared
+
+    @classmethod
+    def set_shared(cls: Type[T], cache: T) -> None:
+        """Replace the cache used by default by all Amatino objects"""
+        if not isinstance(cache, AccountCache):
+            raise TypeError('cache must be of type `AccountCache`')
+        with cls._shared_lock:
+            AccountCache._shared = cache
+        return
+
+    def lookup(self, entity: Entity, account_id: int) -> Optional[Any]:
+        """Return a cached Account, or None if it is not cached"""
+        key = self._key(entity, account_id)
+        with self._lock:
+            cached = self._accounts.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] > self._ttl:
+                del self._accounts[key]
+                return None
+            return cached[1]
+
+    def missing(self, entity: Entity, account_ids: Iterable[int]) -> List[int]:
+        """Return those of the supplied Account ids that are not cached"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                i for i in dict.fromkeys(account_ids)
+                if self._key(entity, i) not in self._accounts
+                or now - self._accounts[self._key(entity, i)][0] > self._ttl
+            ]
+
+    def store(self, accounts: Iterable[Any]) -> None:
+        """Cache the supplied Accounts"""
+        now = time.monotonic()
+        with self._lock:
+            for account in accounts:
+                key = self._key(account.entity, account.id_)
+                self._accounts[key] = (now, account)
+        return
+
+    def invalidate(
+        self,
+        entity: Entity,
+        account_id: Optional[int] = None
+    ) -> None:
+        """
+        Discard a cached Account belonging to the supplied Entity, or all of
+        that Entity's cached Accounts if account_id is None, as cached for
+        every Session
+        """
+        with self._lock:
+            for key in [
+                k for k in self._accounts
+                if k[1] == entity.id_
+                and (account_id is None or k[2] == account_id)
+            ]:
+                del self._accounts[key]
+        return
+
+    def clear(self) -> None:
+        """Discard all cached Accounts"""
+        with self._lock:
+            self._accounts = dict()
+        return
+
+    @staticmethod
+    def _key(entity: Entity, account_id: int) -> AccountKey:
+        return (entity.session.session_id, entity.id_, account_id)
@@ -7,6 +7,7 @@ This module is intended to be private, used indirectly
 by public classes, and should not be used directly.
 """
 import datetime
+from functools import lru_cache
 from amatino.internal.immutable import Immutable
 from amatino.internal.encodable import Encodable
 from amatino.api_error import ApiError
@@ -24,11 +25,14 @@ class AmatinoTime(Encodable):
     strings of the format expected by the Amatino API
     """
     _FORMAT_STRING = '%Y-%m-%d_%H:%M:%S.%f'
+    _MEMO_SIZE = 4096
 
     def __init__(self, date_time: datetime.datetime) -> None:
         if not isinstance(date_time, datetime.datetime):
             raise TypeError('Unexpected datetime type, `datetime` required')
-        self._raw_time = date_time.replace(tzinfo=AmatinoTime.UTC())
+        if date_time.tzinfo is not _UTC:
+            date_time = date_time.replace(tzinfo=_UTC)
+        self._raw_time = date_time
         return
 
     string = Immutable(lambda s: s.serialise())
@@ -56,6 +60,64 @@ class AmatinoTime(Encodable):
         if not isinstance(data, str):
             raise ApiError('Unexepected type when decoding AmatinoTime')
 
-        date_time = datetime.datetime.strptime(data, AmatinoTime._FORMAT_STRING)
+        date_time = AmatinoTime._parse(data)
         amatino_time = cls(date_time)
         return amatino_time
+
+    @staticmethod
+    @lru_cache(maxsize=_MEMO_SIZE)
+    def _parse(data: str) -> datetime.datetime:
+        """
+        Return a UTC datetime parsed from a string of the format produced by
+        serialise(). Results are memoised, as identical timestamps recur
+        frequently within API responses.
+
+        Strings of the standard fixed width are parsed by fromisoformat where
+        it is available, as it is implemented in C, or otherwise by slicing
+        their fixed positions. Any other string, or one fromisoformat reads
+        as carrying a timezone, is parsed, or rejected, by strptime.
+        """
+        if (
+                len(data) == 26
+                and data[4] == '-' and data[7] == '-' and data[10] == '_'
+                and data[13] == ':' and data[16] == ':' and data[19] == '.'
+        ):
+            try:
+                date_time = _parse_fixed_width(data)
+            except ValueError:
+                date_time = None
+            if date_time is not None and date_time.tzinfo is None:
+                return date_time.replace(tzinfo=_UTC)
+
+        date_time = datetime.datetime.strptime(data, AmatinoTime._FORMAT_STRING)
+        return date_time.replace(tzinfo=_UTC)
+
+
+def _parse_fixed_width(data: str) -> datetime.datetime:
+    """
+    Return a naive datetime parsed from a string of the form
+    YYYY-MM-DD_HH:MM:SS.ffffff, or raise ValueError.
+    """
+    if _FROM_ISO_FORMAT is not None:
+        return _FROM_ISO_FORMAT(data[:10] + 'T' + data[11:])
+
+    digits = (
+        data[0:4] + data[5:7] + data[8:10] + data[11:13]
+        + data[14:16] + data[17:19] + data[20:26]
+    )
+    if digits.strip('0123456789') != '':
+        raise ValueError('Non-digit character in time string')
+
+    return datetime.datetime(
+        int(data[0:4]),
+        int(data[5:7]),
+        int(data[8:10]),
+        int(data[11:13]),
+        int(data[14:16]),
+        int(data[17:19]),
+        int(data[20:26])
+    )
+
+
+_FROM_ISO_FORMAT = getattr(datetime.datetime, 'fromisoformat', None)
+_UTC = AmatinoTime.UTC()
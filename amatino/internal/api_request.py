@@ -7,16 +7,28 @@ This module is intended to be private, used indirectly
 by public classes, and should not be used directly.
 """
 import sys
+import time
+import weakref
+from io import BytesIO
 from json import loads
-from urllib.request import Request
-from urllib.request import urlopen
 from urllib.error import HTTPError
 from amatino.internal.credentials import Credentials
 from amatino.internal.data_package import DataPackage
 from amatino.internal.url_parameters import UrlParameters
 from amatino.internal.request_headers import RequestHeaders
 from amatino.internal.http_method import HTTPMethod
+from amatino.internal.transport import Transport
+from amatino.internal.single_flight import SingleFlight
+from amatino.internal.retry_policy import RetryPolicy
+from amatino.internal.rate_limiter import RateLimiter
+from amatino.internal.compression import Compression
+from amatino.internal.instrumentation import Instrumentation
 from typing import Optional
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Tuple
+from email.message import Message
 from amatino.internal.immutable import Immutable
 from amatino.internal.errors.not_found import ResourceNotFound
 
@@ -25,12 +37,22 @@ class ApiRequest:
     """
     Private - Not intended to be used directly.
 
-    An instance of an http request to the Amatino API.
+    An instance of an http request to the Amatino API. Requests are carried
+    by the shared Transport, by default over persistent connections drawn
+    from the shared ConnectionPool.
+    Concurrent identical GET requests are coalesced into one. Requests that
+    fail transiently are retried as the shared RetryPolicy allows, and all
+    requests are paced by the shared RateLimiter, if one is installed.
+    Each phase of each request is reported to registered Instrumentation
+    hooks.
     """
 
     _ENDPOINT = 'https://api.amatino.io'
     _DEBUG_ENDPOINT = 'http://127.0.0.1:5000'
     _TIMEOUT = 10
+    _MIN_TIMEOUT = 1
+    _CHUNK_SIZE = 64 * 1024
+    _IN_FLIGHT = SingleFlight()
 
     def __init__(
         self,
@@ -47,6 +69,9 @@ class ApiRequest:
         if credentials is not None:
             assert isinstance(credentials, Credentials)
 
+        Instrumentation.began(path, method.value)
+        started = time.perf_counter()
+
         if data is not None:
             assert isinstance(data, DataPackage)
             request_data = data.as_json_bytes()
@@ -56,32 +81,348 @@ class ApiRequest:
         if url_parameters is not None:
             assert isinstance(url_parameters, UrlParameters)
 
-        if debug is True or '--amatino-debug' in sys.argv[1:]:
-            url = self._DEBUG_ENDPOINT
-        else:
-            url = self._ENDPOINT
+        url = self._url(path, url_parameters, debug)
+        body, content_encoding = self._encode(
+            path,
+            method,
+            request_data,
+            started
+        )
+        attempts = [0]
 
-        url += path
+        def attempt(remaining: float) -> Any:
+            # Wait for the limiter before signing, lest the signature go stale
+            RateLimiter.limit(credentials)
+            headers = self._sign(
+                path,
+                method,
+                credentials,
+                data,
+                content_encoding
+            )
+            retries = attempts[0]
+            attempts[0] += 1
+            return self._send(
+                path,
+                method,
+                url,
+                body,
+                headers,
+                min(self._TIMEOUT, max(remaining, self._MIN_TIMEOUT)),
+                retries
+            )
+
+        def send() -> Any:
+            return RetryPolicy.shared().perform(method, attempt)
+
+        if method != HTTPMethod.GET:
+            self._response_data = send()
+            return
+
+        # Identical GETs in flight at once, on behalf of the same session,
+        # share a single HTTP request and its decoded response data.
+        session_id = None
+        if credentials is not None:
+            session_id = credentials.session_id
+        key = (url, request_data, session_id)
+        self._response_data = self._IN_FLIGHT.do(key, send)
+
+        return
+
+    response_data = Immutable(lambda s: s._response_data)
+
+    @classmethod
+    def stream(
+        cls,
+        path: str,
+        method: HTTPMethod,
+        credentials: Optional[Credentials] = None,
+        data: Optional[DataPackage] = None,
+        url_parameters: Optional[UrlParameters] = None,
+        debug: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Send a request and return an iterator over its decompressed response
+        body, read from the connection in chunks as the iterator is
+        consumed. The request is retried until a successful response status
+        is received, but not once its body is being read. Streamed requests
+        are not coalesced. Close the iterator to abandon the response.
+        """
+        if credentials is not None:
+            assert isinstance(credentials, Credentials)
+
+        started = time.perf_counter()
+        request_data = None
+        if data is not None:
+            assert isinstance(data, DataPackage)
+            request_data = data.as_json_bytes()
 
         if url_parameters is not None:
-            url += url_parameters.parameter_string()
+            assert isinstance(url_parameters, UrlParameters)
 
-        headers = RequestHeaders(path, credentials, data)
-        request = Request(
-            url=url,
-            data=request_data,
-            headers=headers.dictionary(),
-            method=method.value,
+        url = cls._url(path, url_parameters, debug)
+        body, content_encoding = cls._encode(
+            path,
+            method,
+            request_data,
+            started
         )
-        try:
-            self._response = urlopen(request, timeout=self._TIMEOUT)
-        except HTTPError as error:
-            if error.code == 404:
-                raise ResourceNotFound
-            raise error
+        attempts = [0]
+
+        def attempt(remaining: float) -> Transport.Response:
+            RateLimiter.limit(credentials)
+            headers = cls._sign(
+                path,
+                method,
+                credentials,
+                data,
+                content_encoding
+            )
+            retries = attempts[0]
+            attempts[0] += 1
+            opened = time.perf_counter()
+            try:
+                response = Transport.shared().open(
+                    method=method.value,
+                    url=url,
+                    body=body,
+                    headers=headers,
+                    timeout=min(
+                        cls._TIMEOUT,
+                        max(remaining, cls._MIN_TIMEOUT)
+                    )
+                )
+            except Exception:
+                Instrumentation.emit(
+                    Instrumentation.NETWORK,
+                    path,
+                    method.value,
+                    time.perf_counter() - opened,
+                    retries=retries
+                )
+                raise
+            Instrumentation.emit(
+                Instrumentation.NETWORK,
+                path,
+                method.value,
+                time.perf_counter() - opened,
+                status=response.status,
+                retries=retries
+            )
+            Instrumentation.completed(
+                path,
+                method.value,
+                None,
+                response.status,
+                retries
+            )
+            if response.status >= 400:
+                cls._interpret(
+                    url,
+                    response.status,
+                    response.reason,
+                    response.headers,
+                    response.read()
+                )
+            return response
+
+        response = RetryPolicy.shared().perform(method, attempt)
+
+        # A generator dropped before it starts never runs its finally clause,
+        # so the response is also closed when the generator is collected.
+        chunks = cls._chunks(response)
+        weakref.finalize(chunks, response.close)
+
+        return chunks
 
-        self._response_data = loads(self._response.read().decode('utf-8'))
+    @classmethod
+    def _chunks(cls, response: Transport.Response) -> Iterator[bytes]:
+        """Yield the decompressed body of a response in chunks"""
+        def read() -> Iterator[bytes]:
+            while True:
+                chunk = response.read_chunk(cls._CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
 
+        try:
+            yield from Compression.decode_stream(
+                read(),
+                response.headers.get('Content-Encoding')
+            )
+        finally:
+            response.close()
         return
 
-    response_data = Immutable(lambda s: s._response_data)
+    @classmethod
+    def _send(
+        cls,
+        path: str,
+        method: HTTPMethod,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+        retries: int = 0
+    ) -> Any:
+        """Perform an HTTP request and return its decoded response data"""
+        started = time.perf_counter()
+        try:
+            response = Transport.shared().open(
+                method=method.value,
+                url=url,
+                body=body,
+                headers=headers,
+                timeout=timeout
+            )
+            body = response.read()
+        except Exception:
+            Instrumentation.emit(
+                Instrumentation.NETWORK,
+                path,
+                method.value,
+                time.perf_counter() - started,
+                retries=retries
+            )
+            raise
+        Instrumentation.emit(
+            Instrumentation.NETWORK,
+            path,
+            method.value,
+            time.perf_counter() - started,
+            len(body),
+            response.status,
+            retries
+        )
+
+        return cls._parse(
+            path,
+            method,
+            url,
+            response.status,
+            response.reason,
+            response.headers,
+            body,
+            retries
+        )
+
+    @staticmethod
+    def _encode(
+        path: str,
+        method: HTTPMethod,
+        request_data: Optional[bytes],
+        started: float
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Return a request body and its content encoding, reporting the time
+        spent encoding it since started
+        """
+        body, content_encoding = Compression.encode(request_data)
+        Instrumentation.emit(
+            Instrumentation.ENCODE,
+            path,
+            method.value,
+            time.perf_counter() - started,
+            0 if body is None else len(body)
+        )
+        return body, content_encoding
+
+    @staticmethod
+    def _sign(
+        path: str,
+        method: HTTPMethod,
+        credentials: Optional[Credentials],
+        data: Optional[DataPackage],
+        content_encoding: Optional[str]
+    ) -> Dict[str, str]:
+        """
+        Return headers signed for an attempt sent now, reporting the time
+        spent signing. The signature covers the current second, so each
+        attempt must be signed afresh.
+        """
+        started = time.perf_counter()
+        headers = RequestHeaders(path, credentials, data, content_encoding)
+        Instrumentation.emit(
+            Instrumentation.SIGN,
+            path,
+            method.value,
+            time.perf_counter() - started
+        )
+        return headers.dictionary()
+
+    @classmethod
+    def _parse(
+        cls,
+        path: str,
+        method: HTTPMethod,
+        url: str,
+        status: int,
+        reason: str,
+        headers: Message,
+        body: bytes,
+        retries: int = 0
+    ) -> Any:
+        """Interpret a response, reporting the time spent doing so"""
+        Instrumentation.completed(
+            path,
+            method.value,
+            len(body),
+            status,
+            retries
+        )
+        started = time.perf_counter()
+        try:
+            return cls._interpret(url, status, reason, headers, body)
+        finally:
+            Instrumentation.emit(
+                Instrumentation.PARSE,
+                path,
+                method.value,
+                time.perf_counter() - started,
+                len(body),
+                status,
+                retries
+            )
+
+    @classmethod
+    def _url(
+        cls,
+        path: str,
+        url_parameters: Optional[UrlParameters],
+        debug: bool
+    ) -> str:
+        """Return the full url targeted by a request"""
+        url = Transport.shared().endpoint
+        if url is None:
+            if debug is True or '--amatino-debug' in sys.argv[1:]:
+                url = cls._DEBUG_ENDPOINT
+            else:
+                url = cls._ENDPOINT
+
+        url += path
+
+        if url_parameters is not None:
+            url += url_parameters.parameter_string()
+
+        return url
+
+    @staticmethod
+    def _interpret(
+        url: str,
+        status: int,
+        reason: str,
+        headers: Message,
+        body: bytes
+    ) -> Any:
+        """
+        Return data decoded from a response body, or raise an error if the
+        response status indicates failure.
+        """
+        body = Compression.decode(body, headers.get('Content-Encoding'))
+
+        if status == 404:
+            raise ResourceNotFound
+        if status >= 400:
+            raise HTTPError(url, status, reason, headers, BytesIO(body))
+
+        return loads(body.decode('utf-8'))
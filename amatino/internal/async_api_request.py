@@ -0,0 +1,177 @@
+"""
+Amatino API Python Bindings
+Async API Request Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import asyncio
+import time
+from weakref import WeakKeyDictionary
+from amatino.internal.credentials import Credentials
+from amatino.internal.data_package import DataPackage
+from amatino.internal.url_parameters import UrlParameters
+from amatino.internal.http_method import HTTPMethod
+from amatino.internal.api_request import ApiRequest
+from amatino.internal.async_connection_pool import AsyncConnectionPool
+from amatino.internal.transport import Transport
+from amatino.internal.retry_policy import RetryPolicy
+from amatino.internal.rate_limiter import RateLimiter
+from amatino.internal.instrumentation import Instrumentation
+from amatino.internal.immutable import Immutable
+from typing import Any
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+
+T = TypeVar('T', bound='AsyncApiRequest')
+
+
+class AsyncApiRequest:
+    """
+    Private - Not intended to be used directly.
+
+    A non-blocking http request to the Amatino API. Unlike ApiRequest, an
+    AsyncApiRequest is not performed on initialisation. Instead, await
+    AsyncApiRequest.send(), which returns a completed request.
+
+    Requests are sent over persistent connections drawn from a pool
+    belonging to the running event loop, unless another Transport has been
+    installed via Transport.set_shared(). Requests that fail transiently are
+    retried as the shared RetryPolicy allows, and all requests are paced by
+    the shared RateLimiter, if one is installed. Each phase of each request
+    is reported to registered Instrumentation hooks.
+    """
+
+    _POOLS = WeakKeyDictionary()
+
+    def __init__(self, response_data: Any) -> None:
+        self._response_data = response_data
+        return
+
+    response_data = Immutable(lambda s: s._response_data)
+
+    @classmethod
+    async def send(
+        cls: Type[T],
+        path: str,
+        method: HTTPMethod,
+        credentials: Optional[Credentials] = None,
+        data: Optional[DataPackage] = None,
+        url_parameters: Optional[UrlParameters] = None,
+        debug: bool = False
+    ) -> T:
+        """Perform a request and return it once a response is received"""
+
+        if credentials is not None:
+            assert isinstance(credentials, Credentials)
+
+        Instrumentation.began(path, method.value)
+        started = time.perf_counter()
+
+        if data is not None:
+            assert isinstance(data, DataPackage)
+            request_data = data.as_json_bytes()
+        else:
+            request_data = None
+
+        if url_parameters is not None:
+            assert isinstance(url_parameters, UrlParameters)
+
+        url = ApiRequest._url(path, url_parameters, debug)
+        body, content_encoding = ApiRequest._encode(
+            path,
+            method,
+            request_data,
+            started
+        )
+        attempts = [0]
+
+        async def attempt(remaining: float) -> Any:
+            await RateLimiter.limit_async(credentials)
+            headers = ApiRequest._sign(
+                path,
+                method,
+                credentials,
+                data,
+                content_encoding
+            )
+            retries = attempts[0]
+            attempts[0] += 1
+            timeout = min(
+                ApiRequest._TIMEOUT,
+                max(remaining, ApiRequest._MIN_TIMEOUT)
+            )
+            opened = time.perf_counter()
+            try:
+                transport = Transport.installed()
+                if transport is not None:
+                    response = await transport.open_async(
+                        method=method.value,
+                        url=url,
+                        body=body,
+                        headers=headers,
+                        timeout=timeout
+                    )
+                    response_body = response.read()
+                else:
+                    response = await cls.pool().request(
+                        method=method.value,
+                        url=url,
+                        body=body,
+                        headers=headers,
+                        timeout=timeout
+                    )
+                    response_body = response.body
+            except Exception:
+                Instrumentation.emit(
+                    Instrumentation.NETWORK,
+                    path,
+                    method.value,
+                    time.perf_counter() - opened,
+                    retries=retries
+                )
+                raise
+            Instrumentation.emit(
+                Instrumentation.NETWORK,
+                path,
+                method.value,
+                time.perf_counter() - opened,
+                len(response_body),
+                response.status,
+                retries
+            )
+            return ApiRequest._parse(
+                path,
+                method,
+                url,
+                response.status,
+                response.reason,
+                response.headers,
+                response_body,
+                retries
+            )
+
+        response_data = await RetryPolicy.shared().perform_async(
+            method,
+            attempt
+        )
+
+        return cls(response_data)
+
+    @classmethod
+    def pool(cls) -> AsyncConnectionPool:
+        """Return the connection pool belonging to the running event loop"""
+        loop = asyncio.get_event_loop()
+        if loop not in cls._POOLS:
+            cls._POOLS[loop] = AsyncConnectionPool()
+        return cls._POOLS[loop]
+
+    @classmethod
+    def set_pool(cls, pool: AsyncConnectionPool) -> None:
+        """Replace the connection pool belonging to the running event loop"""
+        if not isinstance(pool, AsyncConnectionPool):
+            raise TypeError('pool must be of type `AsyncConnectionPool`')
+        cls._POOLS[asyncio.get_event_loop()] = pool
+        return
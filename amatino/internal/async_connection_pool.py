@@ -0,0 +1,284 @@
+"""
+Amatino API Python Bindings
+Async Connection Pool Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import asyncio
+import ssl
+from http.client import HTTPMessage
+from http.client import parse_headers
+from io import BytesIO
+from urllib.parse import urlsplit
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from amatino.internal.immutable import Immutable
+
+HostKey = Tuple[str, str, int]
+Stream = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncConnectionPool:
+    """
+    A pool of persistent, non-blocking HTTP/1.1 connections to the Amatino
+    API, for use from within a single asyncio event loop.
+
+    max_per_host limits the number of simultaneously open connections to any
+    one host. Coroutines beyond that limit wait until a connection is
+    returned to the pool, for no longer than their request's timeout.
+    max_size limits the number of idle connections retained across all
+    hosts.
+    """
+    _DEFAULT_MAX_SIZE = 32
+    _DEFAULT_MAX_PER_HOST = 16
+    _IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    def __init__(
+        self,
+        max_size: int = _DEFAULT_MAX_SIZE,
+        max_per_host: int = _DEFAULT_MAX_PER_HOST
+    ) -> None:
+
+        if not isinstance(max_size, int) or max_size < 0:
+            raise TypeError('max_size must be a non-negative `int`')
+
+        if not isinstance(max_per_host, int) or max_per_host < 1:
+            raise TypeError('max_per_host must be a positive `int`')
+
+        self._max_size = max_size
+        self._max_per_host = max_per_host
+        self._idle = dict()  # type: Dict[HostKey, List[Stream]]
+        self._limits = dict()  # type: Dict[HostKey, asyncio.Semaphore]
+        self._idle_count = 0
+        self._ssl_context = None  # type: Optional[ssl.SSLContext]
+
+        return
+
+    max_size = Immutable(lambda s: s._max_size)
+    max_per_host = Immutable(lambda s: s._max_per_host)
+    idle_connections = Immutable(lambda s: s._idle_count)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> 'AsyncConnectionPool.Response':
+        """Send a request and return its complete response"""
+        components = urlsplit(url)
+        scheme = components.scheme
+        host = components.hostname
+        if scheme not in ('http', 'https') or host is None:
+            raise ValueError('Unsupported url: ' + url)
+        port = components.port
+        if port is None:
+            port = 443 if scheme == 'https' else 80
+        key = (scheme, host, port)
+
+        target = components.path or '/'
+        if components.query:
+            target += '?' + components.query
+
+        message = self._encode_request(
+            method,
+            target,
+            components.netloc,
+            body,
+            headers
+        )
+
+        if key not in self._limits:
+            self._limits[key] = asyncio.Semaphore(self._max_per_host)
+
+        # The timeout covers waiting for a connection as well as using it,
+        # such that a saturated pool cannot delay a request indefinitely
+        return await asyncio.wait_for(
+            self._limited_exchange(key, message, method),
+            timeout
+        )
+
+    async def close(self) -> None:
+        """Close all idle connections held by this pool"""
+        idle = self._idle
+        self._idle = dict()
+        self._idle_count = 0
+        for connections in idle.values():
+            for _, writer in connections:
+                writer.close()
+        return
+
+    async def _limited_exchange(
+        self,
+        key: HostKey,
+        message: bytes,
+        method: str
+    ) -> 'AsyncConnectionPool.Response':
+        """Exchange a request once the host's connection limit allows"""
+        async with self._limits[key]:
+            return await self._exchange(key, message, method)
+
+    async def _exchange(
+        self,
+        key: HostKey,
+        message: bytes,
+        method: str
+    ) -> 'AsyncConnectionPool.Response':
+
+        stream, reused = await self._acquire(key)
+
+        try:
+            try:
+                response, reusable = await self._send(stream, message, method)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                # A reused connection may have been closed by the server
+                # while idle. Retry once on a fresh connection, unless the
+                # request may have been acted upon and is not idempotent.
+                if not reused or method not in self._IDEMPOTENT_METHODS:
+                    raise
+                stream[1].close()
+                stream = await self._connect(key)
+                response, reusable = await self._send(stream, message, method)
+        except BaseException:
+            stream[1].close()
+            raise
+
+        if reusable:
+            self._release(key, stream)
+        else:
+            stream[1].close()
+
+        return response
+
+    async def _acquire(self, key: HostKey) -> Tuple[Stream, bool]:
+        idle = self._idle.get(key, [])
+        while idle:
+            stream = idle.pop()
+            self._idle_count -= 1
+            if stream[0].at_eof() or stream[1].is_closing():
+                stream[1].close()
+                continue
+            return stream, True
+        return await self._connect(key), False
+
+    async def _connect(self, key: HostKey) -> Stream:
+        scheme, host, port = key
+        context = None
+        if scheme == 'https':
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            context = self._ssl_context
+        return await asyncio.open_connection(host, port, ssl=context)
+
+    def _release(self, key: HostKey, stream: Stream) -> None:
+        if self._idle_count >= self._max_size:
+            stream[1].close()
+            return
+        self._idle.setdefault(key, []).append(stream)
+        self._idle_count += 1
+        return
+
+    @staticmethod
+    def _encode_request(
+        method: str,
+        target: str,
+        host: str,
+        body: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> bytes:
+        lines = [method + ' ' + target + ' HTTP/1.1', 'Host: ' + host]
+        for name, value in headers.items():
+            lines.append(name + ': ' + str(value))
+        if body is not None:
+            lines.append('Content-Length: ' + str(len(body)))
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        if body is None:
+            return head
+        return head + body
+
+    @staticmethod
+    async def _send(
+        stream: Stream,
+        message: bytes,
+        method: str
+    ) -> Tuple['AsyncConnectionPool.Response', bool]:
+        """
+        Write a request to the supplied stream and read its response. Return
+        the response and whether the connection may be reused.
+        """
+        reader, writer = stream
+        writer.write(message)
+        await writer.drain()
+
+        status_line = await reader.readuntil(b'\r\n')
+        version, status, reason = (
+            status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + ['']
+        )[:3]
+
+        header_lines = list()
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            header_lines.append(line)
+            if line == b'\r\n':
+                break
+        headers = parse_headers(BytesIO(b''.join(header_lines)))
+
+        code = int(status)
+        reusable = (
+            version == 'HTTP/1.1'
+            and headers.get('Connection', '').lower() != 'close'
+        )
+        encoding = headers.get('Transfer-Encoding', '').lower()
+        length = headers.get('Content-Length')
+
+        if method == 'HEAD' or code in (204, 304) or 100 <= code < 200:
+            body = b''
+        elif 'chunked' in encoding:
+            chunks = list()
+            while True:
+                size_line = await reader.readuntil(b'\r\n')
+                size = int(size_line.split(b';', 1)[0].strip(), 16)
+                if size == 0:
+                    while (await reader.readuntil(b'\r\n')) != b'\r\n':
+                        continue
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(chunks)
+        elif length is not None:
+            body = await reader.readexactly(int(length))
+        else:
+            body = await reader.read()
+            reusable = False
+
+        response = AsyncConnectionPool.Response(code, reason, headers, body)
+
+        return response, reusable
+
+    class Response:
+        """A complete HTTP response received over a pooled connection"""
+
+        def __init__(
+            self,
+            status: int,
+            reason: str,
+            headers: HTTPMessage,
+            body: bytes
+        ) -> None:
+
+            self._status = status
+            self._reason = reason
+            self._headers = headers
+            self._body = body
+
+            return
+
+        status = Immutable(lambda s: s._status)
+        reason = Immutable(lambda s: s._reason)
+        headers = Immutable(lambda s: s._headers)
+        body = Immutable(lambda s: s._body)
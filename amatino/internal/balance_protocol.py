@@ -21,10 +21,12 @@ from amatino.internal.am_time import AmatinoTime
 from amatino.internal.immutable import Immutable
 from amatino.internal.encodable import Encodable
 from amatino.internal.api_request import ApiRequest
+from amatino.internal.response_cache import ResponseCache
 from amatino.internal.http_method import HTTPMethod
 from amatino.internal.data_package import DataPackage
 from amatino.internal.url_parameters import UrlParameters
 from amatino.denominated import Denominated
+from amatino.internal.instrumentation import Instrumentation
 
 
 T = TypeVar('T', bound='BalanceProtocol')
@@ -86,7 +88,7 @@ class BalanceProtocol(Denominated):
     is_recursive = Immutable(lambda s: s._recursive)
     account_id = Immutable(lambda s: s._account_id)
     account = Immutable(
-        lambda s: Account.retrieve(s.entity.session, s.entity, s.account_id)
+        lambda s: Account.lookup(s.entity, s.account_id)
     )
     global_unit_id = Immutable(lambda s: s._global_unit_id)
     custom_unit_id = Immutable(lambda s: s._custom_unit_id)
@@ -109,17 +111,38 @@ class BalanceProtocol(Denominated):
         data = DataPackage(list_data=arguments)
         parameters = UrlParameters(entity_id=entity.id_)
 
-        request = ApiRequest(
-            path=cls.PATH,
-            method=HTTPMethod.GET,
-            credentials=entity.session,
-            data=data,
-            url_parameters=parameters
+        def retrieve() -> Any:
+            return ApiRequest(
+                path=cls.PATH,
+                method=HTTPMethod.GET,
+                credentials=entity.session,
+                data=data,
+                url_parameters=parameters
+            ).response_data
+
+        response_data = ResponseCache.fetch(
+            entity,
+            cls.PATH,
+            data,
+            cls._as_of(arguments),
+            retrieve
         )
 
-        return cls._decode_many(entity, request.response_data)
+        return cls._decode_many(entity, response_data)
 
     @classmethod
+    def _as_of(cls: Type[T], arguments: List[K]) -> Optional[datetime]:
+        """
+        Return the latest balance time among the supplied arguments, or None
+        if any argument requests a current balance
+        """
+        times = [a._balance_time for a in arguments]
+        if len(times) < 1 or None in times:
+            return None
+        return max([t.raw for t in times])
+
+    @classmethod
+    @Instrumentation.decoder
     def _decode_many(
         cls: Type[T],
         entity: Entity,
@@ -0,0 +1,314 @@
+"""
+Amatino API Python Bindings
+Cassette Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import gzip
+import json
+from email.message import Message
+from threading import Lock
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from amatino.amatino_error import AmatinoError
+from amatino.internal.compression import Compression
+from amatino.internal.immutable import Immutable
+from amatino.internal.transport import Transport
+
+Key = Tuple[str, str, str, Optional[str]]
+
+
+class Cassette(Transport):
+    """
+    A Transport recording requests and their responses to a compact file,
+    or replaying responses from such a file, without any network access.
+
+    In RECORD mode, requests are carried by the shared Transport as it was
+    when recording began, typically the default ConnectionPool. Response
+    bodies are read in full before being returned, so streamed requests
+    are not streamed while recording. Call .save() to write the cassette,
+    or use it as a context manager, which installs it, and on exit saves
+    it and restores the previous Transport:
+
+        with Cassette('ledger.cassette', Cassette.RECORD):
+            ledger = Ledger.retrieve(entity, account)
+
+    In REPLAY mode, each request receives the recorded response to a request
+    matching its method, path, url parameters, and JSON body, compared
+    irrespective of key order, compression, and url parameter order.
+    Requests matching several recorded requests receive their responses
+    in the order they were recorded, the last being repeated once all have
+    been replayed. Requests matching no recorded request raise
+    Cassette.Unrecorded.
+
+        Transport.set_shared(Cassette('ledger.cassette'))
+
+    Request headers, including signatures, are neither recorded nor matched,
+    so a cassette may be replayed without credentials. Credentials in JSON
+    request and response bodies, namely secrets, email addresses, and API
+    keys, are recorded and matched as 'redacted', such that a cassette may
+    be shared without revealing them.
+    """
+    RECORD = 'record'
+    REPLAY = 'replay'
+    _FORMAT = 1
+    _OMITTED_HEADERS = ('content-encoding', 'content-length')
+    _REDACTED_FIELDS = ('account_email', 'api_key', 'email', 'secret')
+    _REDACTION = 'redacted'
+
+    class Unrecorded(AmatinoError):
+        """A replayed request matched no request recorded in the cassette"""
+
+        def __init__(self, method: str, url: str) -> None:
+            super().__init__(
+                'No recorded response to {m} {u}'.format(m=method, u=url)
+            )
+            return
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = REPLAY,
+        transport: Optional[Transport] = None
+    ) -> None:
+
+        if not isinstance(path, str):
+            raise TypeError('path must be of type `str`')
+
+        if mode not in (self.RECORD, self.REPLAY):
+            raise TypeError('mode must be Cassette.RECORD or Cassette.REPLAY')
+
+        if transport is not None and not isinstance(transport, Transport):
+            raise TypeError('transport must be of type `Transport` or None')
+
+        if mode == self.RECORD and transport is None:
+            transport = Transport.shared()
+
+        self._path = path
+        self._mode = mode
+        self._transport = transport
+        self._lock = Lock()
+        self._interactions = list()  # type: List[Dict[str, Any]]
+        self._responses = dict()  # type: Dict[Key, List[Dict[str, Any]]]
+        self._replayed = dict()  # type: Dict[Key, int]
+        self._previous = None  # type: Optional[Transport]
+
+        if mode == self.REPLAY:
+            self._load()
+
+        return
+
+    path = Immutable(lambda s: s._path)
+    mode = Immutable(lambda s: s._mode)
+    interactions = Immutable(lambda s: len(s._interactions))
+
+    @property
+    def endpoint(self) -> Optional[str]:
+        if self._transport is None:
+            return None
+        return self._transport.endpoint
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        """Record or replay a response to a request"""
+        key = self._key(method, url, body, headers)
+
+        if self._mode == self.REPLAY:
+            return self._replay(key, method, url)
+
+        response = self._transport.open(method, url, body, headers, timeout)
+        try:
+            response_body = Compression.decode(
+                response.read(),
+                response.headers.get('Content-Encoding')
+            )
+        finally:
+            response.close()
+
+        received = {
+            'status': response.status,
+            'reason': response.reason,
+            'headers': [
+                [k, v] for k, v in response.headers.items()
+                if k.lower() not in self._OMITTED_HEADERS
+            ],
+            'body': response_body.decode('utf-8', 'surrogateescape')
+        }
+
+        interaction = {
+            'request': {
+                'method': key[0],
+                'path': key[1],
+                'query': key[2],
+                'body': key[3]
+            },
+            'response': dict(received, body=self._redact_body(response_body))
+        }
+
+        with self._lock:
+            self._interactions.append(interaction)
+
+        return self._response(received)
+
+    async def open_async(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        """Record or replay a response to a request"""
+        if self._mode == self.REPLAY:
+            return self.open(method, url, body, headers, timeout)
+        return await super().open_async(method, url, body, headers, timeout)
+
+    def save(self) -> None:
+        """Write recorded interactions to the cassette's path"""
+        with self._lock:
+            document = {
+                'format': self._FORMAT,
+                'endpoint': self.endpoint,
+                'interactions': list(self._interactions)
+            }
+        with gzip.open(self._path, 'wt', encoding='utf-8') as file:
+            json.dump(document, file, separators=(',', ':'))
+        return
+
+    def __enter__(self) -> 'Cassette':
+        self._previous = Transport.installed()
+        Transport.set_shared(self)
+        return self
+
+    def __exit__(self, *_) -> None:
+        Transport.set_shared(self._previous)
+        self._previous = None
+        if self._mode == self.RECORD:
+            self.save()
+        return
+
+    def _load(self) -> None:
+        """Read recorded interactions from the cassette's path"""
+        with gzip.open(self._path, 'rt', encoding='utf-8') as file:
+            document = json.load(file)
+
+        if document.get('format') != self._FORMAT:
+            raise ValueError('Unsupported cassette format')
+
+        self._interactions = document['interactions']
+        for interaction in self._interactions:
+            request = interaction['request']
+            key = (
+                request['method'],
+                request['path'],
+                request['query'],
+                request['body']
+            )
+            self._responses.setdefault(key, list()).append(
+                interaction['response']
+            )
+        return
+
+    def _replay(self, key: Key, method: str, url: str) -> Transport.Response:
+        """Return the next recorded response to a request"""
+        responses = self._responses.get(key)
+        if responses is None:
+            raise Cassette.Unrecorded(method, url)
+        with self._lock:
+            index = self._replayed.get(key, 0)
+            self._replayed[key] = index + 1
+        return self._response(responses[min(index, len(responses) - 1)])
+
+    @staticmethod
+    def _response(recorded: Dict[str, Any]) -> Transport.Response:
+        headers = Message()
+        for name, value in recorded['headers']:
+            headers[name] = value
+        return Transport.Response(
+            recorded['status'],
+            recorded['reason'],
+            headers,
+            recorded['body'].encode('utf-8', 'surrogateescape')
+        )
+
+    @classmethod
+    def _redact(cls, data: Any) -> Any:
+        """Return JSON data with the values of credential fields replaced"""
+        if isinstance(data, dict):
+            return {
+                k: cls._REDACTION
+                if k in cls._REDACTED_FIELDS and v is not None
+                else cls._redact(v)
+                for k, v in data.items()
+            }
+        if isinstance(data, list):
+            return [cls._redact(d) for d in data]
+        return data
+
+    @classmethod
+    def _redact_body(cls, body: bytes) -> str:
+        """Return a response body as text, with credentials redacted"""
+        text = body.decode('utf-8', 'surrogateescape')
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return text
+        return json.dumps(cls._redact(data), separators=(',', ':'))
+
+    @classmethod
+    def _key(
+        cls,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> Key:
+        """
+        Return a key identifying a request by its method, path, url
+        parameters, and body, in canonical forms
+        """
+        components = urlsplit(url)
+
+        # Parameters sharing a name keep their relative order, which may be
+        # significant, while differently named parameters may be reordered
+        query = sorted(
+            parse_qsl(components.query, keep_blank_values=True),
+            key=lambda p: p[0]
+        )
+
+        canonical_body = None
+        if body:
+            content_encoding = None
+            for name, value in headers.items():
+                if name.lower() == 'content-encoding':
+                    content_encoding = value
+            body = Compression.decode(body, content_encoding)
+            try:
+                canonical_body = json.dumps(
+                    cls._redact(json.loads(body.decode('utf-8'))),
+                    sort_keys=True,
+                    separators=(',', ':')
+                )
+            except ValueError:
+                canonical_body = body.decode('utf-8', 'surrogateescape')
+
+        return (
+            method.upper(),
+            components.path,
+            urlencode(query),
+            canonical_body
+        )
@@ -0,0 +1,158 @@
+"""
+Amatino API Python Bindings
+Compression Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import gzip
+import zlib
+from threading import Lock
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from amatino.api_error import ApiError
+
+
+class Compression:
+    """
+    Governs compression of Amatino API request and response bodies.
+
+    Requests advertise that gzip or deflate compressed responses are
+    acceptable, and compressed responses are transparently decompressed.
+
+    Request bodies are sent uncompressed by default. Call
+    Compression.set_request_threshold() with a size in bytes to gzip request
+    bodies larger than that size.
+    """
+    ACCEPT_ENCODING = 'gzip, deflate'
+    _LEVEL = 6
+
+    _request_threshold = None  # type: Optional[int]
+    _lock = Lock()
+
+    @classmethod
+    def request_threshold(cls) -> Optional[int]:
+        """
+        Return the size in bytes above which request bodies are compressed,
+        or None if they are never compressed
+        """
+        with cls._lock:
+            return Compression._request_threshold
+
+    @classmethod
+    def set_request_threshold(cls, threshold: Optional[int]) -> None:
+        """
+        Compress request bodies larger than the supplied size in bytes, or
+        never compress them if the supplied size is None
+        """
+        if threshold is not None and (
+                not isinstance(threshold, int) or threshold < 0
+        ):
+            raise TypeError('threshold must be a non-negative `int` or None')
+        with cls._lock:
+            Compression._request_threshold = threshold
+        return
+
+    @classmethod
+    def encode(
+        cls,
+        body: Optional[bytes]
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Return a request body, compressed if it exceeds the request threshold,
+        and the value of the Content-Encoding header it requires, if any
+        """
+        threshold = cls.request_threshold()
+        if body is None or threshold is None or len(body) <= threshold:
+            return body, None
+        return gzip.compress(body, compresslevel=cls._LEVEL), 'gzip'
+
+    @staticmethod
+    def decode(body: bytes, content_encoding: Optional[str]) -> bytes:
+        """
+        Return a response body decompressed according to the value of its
+        Content-Encoding header
+        """
+        if content_encoding is None or len(body) < 1:
+            return body
+
+        codings = [c.strip().lower() for c in content_encoding.split(',')]
+
+        # Codings are listed in the order they were applied
+        for coding in reversed(codings):
+            if coding in ('', 'identity'):
+                continue
+            if coding in ('gzip', 'x-gzip'):
+                body = gzip.decompress(body)
+                continue
+            if coding == 'deflate':
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    # Some servers send raw deflate data without a zlib header
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)
+                continue
+            raise ApiError('Unsupported response Content-Encoding: ' + coding)
+
+        return body
+
+    @classmethod
+    def decode_stream(
+        cls,
+        chunks: Iterable[bytes],
+        content_encoding: Optional[str]
+    ) -> Iterator[bytes]:
+        """
+        Return an iterator over the chunks of a response body, decompressed
+        incrementally according to the value of its Content-Encoding header
+        """
+        if content_encoding is None:
+            return iter(chunks)
+
+        codings = [c.strip().lower() for c in content_encoding.split(',')]
+
+        for coding in reversed(codings):
+            if coding in ('', 'identity'):
+                continue
+            if coding not in ('gzip', 'x-gzip', 'deflate'):
+                raise ApiError(
+                    'Unsupported response Content-Encoding: ' + coding
+                )
+            chunks = cls._decompress_stream(chunks, coding)
+
+        return iter(chunks)
+
+    @staticmethod
+    def _decompress_stream(
+        chunks: Iterable[bytes],
+        coding: str
+    ) -> Iterator[bytes]:
+        chunks = iter(chunks)
+        decompressor = None
+        for chunk in chunks:
+            if decompressor is None:
+                if len(chunk) < 2:
+                    # Wait for enough data to identify a zlib header
+                    chunk = chunk + next(chunks, b'')
+                if coding == 'deflate':
+                    wbits = zlib.MAX_WBITS
+                    if len(chunk) < 2 or (
+                            chunk[0] & 0x0F != 8
+                            or (chunk[0] << 8 | chunk[1]) % 31 != 0
+                    ):
+                        # Raw deflate data without a zlib header
+                        wbits = -zlib.MAX_WBITS
+                else:
+                    wbits = 16 + zlib.MAX_WBITS
+                decompressor = zlib.decompressobj(wbits)
+            output = decompressor.decompress(chunk)
+            if output:
+                yield output
+        if decompressor is not None:
+            output = decompressor.flush()
+            if output:
+                yield output
+        return
@@ -0,0 +1,419 @@
+"""
+Amatino API Python Bindings
+Connection Pool Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import select
+import time
+from base64 import b64encode
+from http.client import HTTPConnection
+from http.client import HTTPSConnection
+from http.client import HTTPResponse
+from http.client import HTTPException
+from http.client import RemoteDisconnected
+from threading import Condition
+from threading import Lock
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+from urllib.request import getproxies
+from urllib.request import proxy_bypass
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from amatino.internal.immutable import Immutable
+from amatino.internal.transport import Transport
+
+T = TypeVar('T', bound='ConnectionPool')
+Proxy = Tuple[str, int, Optional[str]]
+HostKey = Tuple[str, str, int, Optional[Proxy]]
+IdleConnection = Tuple[float, HTTPConnection]
+
+
+class ConnectionPool(Transport):
+    """
+    A thread-safe pool of persistent HTTP connections to the Amatino API.
+
+    Connections are kept alive between requests and reused, such that a
+    sequence of requests to the same host pays for a TCP and TLS handshake
+    only once. A single shared pool is used by all requests, unless it is
+    replaced via ConnectionPool.set_shared(), or another Transport is
+    installed via Transport.set_shared().
+
+    max_size limits the number of idle connections retained across all hosts.
+    max_per_host limits the number of simultaneously open connections to any
+    one host. Requests beyond that limit block until a connection is returned
+    to the pool, raising TimeoutError if none is returned within the request
+    timeout. Connections idle for longer than idle_timeout seconds are
+    closed rather than reused.
+
+    Proxies are honoured as urllib honours them: the http and https proxies
+    configured when the pool is created, via the HTTP_PROXY and HTTPS_PROXY
+    environment variables or the platform's settings, are used for every
+    host not exempted by NO_PROXY. Plain HTTP requests are forwarded by the
+    proxy, while HTTPS requests are tunnelled through it with CONNECT.
+    Credentials in a proxy's url are sent with Basic authentication.
+    """
+    _DEFAULT_MAX_SIZE = 16
+    _DEFAULT_MAX_PER_HOST = 8
+    _DEFAULT_IDLE_TIMEOUT = 30.0
+    _IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    _shared = None
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        max_size: int = _DEFAULT_MAX_SIZE,
+        max_per_host: int = _DEFAULT_MAX_PER_HOST,
+        idle_timeout: float = _DEFAULT_IDLE_TIMEOUT
+    ) -> None:
+
+        if not isinstance(max_size, int) or max_size < 0:
+            raise TypeError('max_size must be a non-negative `int`')
+
+        if not isinstance(max_per_host, int) or max_per_host < 1:
+            raise TypeError('max_per_host must be a positive `int`')
+
+        if not isinstance(idle_timeout, (int, float)) or idle_timeout < 0:
+            raise TypeError('idle_timeout must be a non-negative number')
+
+        self._max_size = max_size
+        self._max_per_host = max_per_host
+        self._idle_timeout = float(idle_timeout)
+
+        self._condition = Condition(Lock())
+        self._idle = dict()  # type: Dict[HostKey, List[IdleConnection]]
+        self._active = dict()  # type: Dict[HostKey, int]
+        self._idle_count = 0
+        self._proxies = getproxies()
+
+        return
+
+    max_size = Immutable(lambda s: s._max_size)
+    max_per_host = Immutable(lambda s: s._max_per_host)
+    idle_timeout = Immutable(lambda s: s._idle_timeout)
+    idle_connections = Immutable(lambda s: s._idle_count)
+
+    @classmethod
+    def shared(cls: Type[T]) -> T:
+        """Return the pool used by default for all Amatino API requests"""
+        with cls._shared_lock:
+            if ConnectionPool._shared is None:
+                ConnectionPool._shared = cls()
+            return ConnectionPool._shared
+
+    @classmethod
+    def set_shared(cls: Type[T], pool: T) -> None:
+        """
+        Replace the pool used by default for all Amatino API requests. The
+        previous shared pool, if any, is closed.
+        """
+        if not isinstance(pool, ConnectionPool):
+            raise TypeError('pool must be of type `ConnectionPool`')
+        with cls._shared_lock:
+            previous = ConnectionPool._shared
+            ConnectionPool._shared = pool
+        if previous is not None and previous is not pool:
+            previous.close()
+        return
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> 'Transport.Response':
+        """
+        Send a request over a pooled connection and return the response,
+        whose body has not yet been read. The connection is returned to the
+        pool once the response body has been read in full, or the response is
+        closed.
+        """
+        components = urlsplit(url)
+        scheme = components.scheme
+        host = components.hostname
+        if scheme not in ('http', 'https') or host is None:
+            raise ValueError('Unsupported url: ' + url)
+        port = components.port
+        if port is None:
+            port = 443 if scheme == 'https' else 80
+        proxy = self._proxy(scheme, host)
+        key = (scheme, host, port, proxy)
+
+        target = components.path or '/'
+        if components.query:
+            target += '?' + components.query
+
+        if proxy is not None and scheme == 'http':
+            # A proxy forwarding plain HTTP expects the absolute url
+            target = scheme + '://' + components.netloc + target
+            if proxy[2] is not None:
+                headers = dict(headers)
+                headers['Proxy-Authorization'] = proxy[2]
+
+        connection, reused = self._acquire(key, timeout)
+
+        try:
+            try:
+                response = self._send(
+                    connection, method, target, body, headers
+                )
+            except (RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # A reused connection may have been closed by the server
+                # while idle. Retry once on a fresh connection, unless the
+                # request may have been acted upon and is not idempotent.
+                if not reused or method not in self._IDEMPOTENT_METHODS:
+                    raise
+                connection.close()
+                connection = self._connect(key, timeout)
+                response = self._send(
+                    connection, method, target, body, headers
+                )
+        except (HTTPException, OSError):
+            connection.close()
+            self._discard(key)
+            raise
+
+        return ConnectionPool.Response(self, key, connection, response)
+
+    def close(self) -> None:
+        """Close all idle connections held by this pool"""
+        with self._condition:
+            idle = self._idle
+            self._idle = dict()
+            self._idle_count = 0
+        for connections in idle.values():
+            for _, connection in connections:
+                connection.close()
+        return
+
+    @staticmethod
+    def _send(
+        connection: HTTPConnection,
+        method: str,
+        target: str,
+        body: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> HTTPResponse:
+        connection.request(method, target, body=body, headers=headers)
+        return connection.getresponse()
+
+    def _proxy(self, scheme: str, host: str) -> Optional[Proxy]:
+        """
+        Return the host, port, and Proxy-Authorization header value of the
+        proxy through which requests to the supplied host should be sent, or
+        None if they should be sent directly.
+        """
+        address = self._proxies.get(scheme)
+        if address is None or proxy_bypass(host):
+            return None
+        if '://' not in address:
+            address = 'http://' + address
+        components = urlsplit(address)
+        if components.hostname is None:
+            raise ValueError('Unsupported proxy: ' + address)
+        authorization = None
+        if components.username is not None:
+            credentials = unquote(components.username) + ':' + unquote(
+                components.password or ''
+            )
+            authorization = 'Basic ' + b64encode(
+                credentials.encode('utf-8')
+            ).decode('ascii')
+        return (components.hostname, components.port or 80, authorization)
+
+    @staticmethod
+    def _connect(key: HostKey, timeout: float) -> HTTPConnection:
+        scheme, host, port, proxy = key
+        if proxy is None:
+            if scheme == 'https':
+                return HTTPSConnection(host, port, timeout=timeout)
+            return HTTPConnection(host, port, timeout=timeout)
+        proxy_host, proxy_port, authorization = proxy
+        if scheme == 'https':
+            connection = HTTPSConnection(
+                proxy_host,
+                proxy_port,
+                timeout=timeout
+            )
+            tunnel_headers = dict()  # type: Dict[str, str]
+            if authorization is not None:
+                tunnel_headers['Proxy-Authorization'] = authorization
+            connection.set_tunnel(host, port, tunnel_headers)
+            return connection
+        return HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+
+    def _acquire(
+        self,
+        key: HostKey,
+        timeout: float
+    ) -> Tuple[HTTPConnection, bool]:
+        """
+        Return a connection to the supplied host, and whether that connection
+        has been reused from the pool.
+        """
+        stale = list()
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._active.get(key, 0) >= self._max_per_host:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        'Timed out waiting for a connection to ' + key[1]
+                    )
+                self._condition.wait(remaining)
+            self._active[key] = self._active.get(key, 0) + 1
+            connection = None
+            now = time.monotonic()
+            idle = self._idle.get(key, [])
+            while idle:
+                released, candidate = idle.pop()
+                self._idle_count -= 1
+                if (
+                        now - released > self._idle_timeout
+                        or not self._alive(candidate)
+                ):
+                    stale.append(candidate)
+                    continue
+                connection = candidate
+                break
+
+        for expired in stale:
+            expired.close()
+
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+
+        return self._connect(key, timeout), False
+
+    @staticmethod
+    def _alive(connection: HTTPConnection) -> bool:
+        """
+        Return False if an idle connection has been closed by the server. An
+        idle connection readable without blocking has either reached EOF or
+        received data it should not have, and is unfit for reuse either way.
+        """
+        if connection.sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([connection.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return len(readable) == 0
+
+    def _release(self, key: HostKey, connection: HTTPConnection) -> None:
+        """Return a healthy connection to the pool"""
+        evicted = list()
+        with self._condition:
+            self._decrement(key)
+            now = time.monotonic()
+            for host, connections in self._idle.items():
+                fresh = list()
+                for released, candidate in connections:
+                    if now - released > self._idle_timeout:
+                        evicted.append(candidate)
+                        continue
+                    fresh.append((released, candidate))
+                self._idle_count -= len(connections) - len(fresh)
+                self._idle[host] = fresh
+            if self._idle_count < self._max_size:
+                self._idle.setdefault(key, []).append((now, connection))
+                self._idle_count += 1
+            else:
+                evicted.append(connection)
+        for expired in evicted:
+            expired.close()
+        return
+
+    def _discard(self, key: HostKey) -> None:
+        """Account for a connection that will not be returned to the pool"""
+        with self._condition:
+            self._decrement(key)
+        return
+
+    def _decrement(self, key: HostKey) -> None:
+        self._active[key] -= 1
+        if self._active[key] < 1:
+            del self._active[key]
+        self._condition.notify_all()
+        return
+
+    class Response(Transport.Response):
+        """
+        An HTTP response received over a pooled connection. Reading the body
+        in full, or closing the response, returns the connection to the pool.
+        """
+
+        def __init__(
+            self,
+            pool: 'ConnectionPool',
+            key: HostKey,
+            connection: HTTPConnection,
+            response: HTTPResponse
+        ) -> None:
+
+            self._pool = pool
+            self._key = key
+            self._connection = connection
+            self._response = response
+            self._finished = False
+
+            return
+
+        status = Immutable(lambda s: s._response.status)
+        reason = Immutable(lambda s: s._response.reason)
+        headers = Immutable(lambda s: s._response.headers)
+
+        def read(self) -> bytes:
+            """Return the entire response body"""
+            try:
+                body = self._response.read()
+            except (HTTPException, OSError):
+                self._finish(reusable=False)
+                raise
+            self._finish(reusable=True)
+            return body
+
+        def read_chunk(self, size: int) -> bytes:
+            """
+            Return up to `size` bytes of the response body. An empty bytes
+            object indicates that the body has been read in full.
+            """
+            try:
+                chunk = self._response.read(size)
+            except (HTTPException, OSError):
+                self._finish(reusable=False)
+                raise
+            if not chunk:
+                self._finish(reusable=True)
+            return chunk
+
+        def close(self) -> None:
+            """
+            Abandon this response. If the body has not been read in full,
+            the underlying connection cannot be reused and is closed.
+            """
+            self._finish(reusable=self._response.isclosed())
+            return
+
+        def _finish(self, reusable: bool) -> None:
+            if self._finished:
+                return
+            self._finished = True
+            if reusable and not self._response.will_close:
+                self._pool._release(self._key, self._connection)
+                return
+            self._connection.close()
+            self._pool._discard(self._key)
+            return
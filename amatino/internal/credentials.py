@@ -3,6 +3,7 @@ Amatino API Python Bindings
 Credentials Module
 Author: hugh@amatino.io
 """
+from amatino.internal.signer import Signer
 
 
 class Credentials:
@@ -13,3 +14,15 @@ class Credentials:
     """
     api_key = NotImplemented
     session_id = NotImplemented
+
+    def signer(self) -> Signer:
+        """
+        Return a Signer computing request signatures with these credentials'
+        api_key, retained such that its key state and memoised signatures
+        are reused by subsequent requests
+        """
+        signer = getattr(self, '_signer', None)
+        if signer is None or signer.api_key != self.api_key:
+            signer = Signer(self.api_key)
+            self._signer = signer
+        return signer
@@ -5,6 +5,7 @@ author: hugh@blinkybeach.com
 """
 from json import loads
 from typing import Any, Optional, TypeVar, Type, List
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Decodable')
 
@@ -39,6 +40,7 @@ class Decodable:
         return cls.deserialise(serial)
 
     @classmethod
+    @Instrumentation.decoder
     def decode_many(cls: Type[T], data: Any) -> List[T]:
         """Return list of decoded instances of an object"""
         return [cls.decode(d) for d in data]
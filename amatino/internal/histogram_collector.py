@@ -0,0 +1,214 @@
+"""
+Amatino API Python Bindings
+Histogram Collector Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from amatino.internal.immutable import Immutable
+from amatino.internal.instrumentation import Instrumentation
+
+
+class HistogramCollector:
+    """
+    An Instrumentation hook accumulating request phase timings in memory,
+    as one histogram per phase, method, and path. Register it to begin
+    collecting:
+
+        collector = HistogramCollector()
+        Instrumentation.register(collector)
+
+    Inspect collected timings via .series() or .quantile(), or format
+    them for a Prometheus scraper with a PrometheusExporter.
+    """
+    DEFAULT_BUCKETS = (
+        0.0001,
+        0.00025,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0
+    )
+
+    class Series:
+        """A histogram of the time spent in one phase of one kind of request"""
+
+        def __init__(
+            self,
+            phase: str,
+            method: Optional[str],
+            path: Optional[str],
+            bucket_count: int
+        ) -> None:
+            self._phase = phase
+            self._method = method
+            self._path = path
+            self._counts = [0] * (bucket_count + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._bytes = 0
+            self._retries = 0
+            self._statuses = dict()  # type: Dict[Optional[int], int]
+            return
+
+        phase = Immutable(lambda s: s._phase)
+        method = Immutable(lambda s: s._method)
+        path = Immutable(lambda s: s._path)
+        counts = Immutable(lambda s: list(s._counts))
+        count = Immutable(lambda s: s._count)
+        sum = Immutable(lambda s: s._sum)
+        bytes = Immutable(lambda s: s._bytes)
+        retries = Immutable(lambda s: s._retries)
+        statuses = Immutable(lambda s: dict(s._statuses))
+
+        def _copy(self) -> 'HistogramCollector.Series':
+            copy = HistogramCollector.Series(
+                self._phase,
+                self._method,
+                self._path,
+                len(self._counts) - 1
+            )
+            copy._counts = list(self._counts)
+            copy._count = self._count
+            copy._sum = self._sum
+            copy._bytes = self._bytes
+            copy._retries = self._retries
+            copy._statuses = dict(self._statuses)
+            return copy
+
+    def __init__(self, buckets: Optional[Sequence[float]] = None) -> None:
+
+        if buckets is None:
+            buckets = self.DEFAULT_BUCKETS
+
+        buckets = tuple(buckets)
+        if (
+            len(buckets) < 1
+            or False in [isinstance(b, (int, float)) for b in buckets]
+            or list(buckets) != sorted(set(buckets))
+        ):
+            raise TypeError(
+                'buckets must be a non-empty sequence of unique, ascending '
+                'numbers'
+            )
+
+        self._buckets = tuple(float(b) for b in buckets)
+        self._lock = Lock()
+        self._series = dict()  # type: Dict[Tuple, HistogramCollector.Series]
+
+        return
+
+    buckets = Immutable(lambda s: s._buckets)
+
+    def __call__(self, event: Instrumentation.Event) -> None:
+        """Record an event"""
+        key = (event.phase, event.method, event.path)
+        index = bisect_left(self._buckets, event.seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self.Series(
+                    event.phase,
+                    event.method,
+                    event.path,
+                    len(self._buckets)
+                )
+                self._series[key] = series
+            series._counts[index] += 1
+            series._count += 1
+            series._sum += event.seconds
+            if event.size is not None:
+                series._bytes += event.size
+            if event.retries > 0:
+                series._retries += 1
+            if event.phase == Instrumentation.NETWORK:
+                series._statuses[event.status] = series._statuses.get(
+                    event.status,
+                    0
+                ) + 1
+        return
+
+    def series(self) -> List['HistogramCollector.Series']:
+        """
+        Return a snapshot of every histogram collected so far, ordered by
+        phase, method, and path
+        """
+        order = {p: i for i, p in enumerate(Instrumentation.PHASES)}
+        with self._lock:
+            snapshot = [s._copy() for s in self._series.values()]
+        return sorted(snapshot, key=lambda s: (
+            order.get(s.phase, len(order)),
+            s.phase,
+            s.method or '',
+            s.path or ''
+        ))
+
+    def quantile(
+        self,
+        phase: str,
+        q: float,
+        method: Optional[str] = None,
+        path: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Return an estimate of the q-quantile (0 <= q <= 1) of time spent in
+        a phase, optionally only by requests of one method or path, or None
+        if no such time has been recorded. The estimate interpolates within
+        the bucket containing the quantile, and is at most the largest
+        bucket bound.
+        """
+        if not isinstance(q, (int, float)) or q < 0 or q > 1:
+            raise ValueError('q must be a number between 0 and 1')
+
+        counts = [0] * (len(self._buckets) + 1)
+        for series in self.series():
+            if series.phase != phase:
+                continue
+            if method is not None and series.method != method:
+                continue
+            if path is not None and series.path != path:
+                continue
+            for index, count in enumerate(series.counts):
+                counts[index] += count
+
+        total = sum(counts)
+        if total < 1:
+            return None
+
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count < 1 or cumulative + count < rank:
+                cumulative += count
+                continue
+            if index >= len(self._buckets):
+                return self._buckets[-1]
+            lower = 0.0 if index == 0 else self._buckets[index - 1]
+            upper = self._buckets[index]
+            return lower + (upper - lower) * (rank - cumulative) / count
+
+        return self._buckets[-1]
+
+    def reset(self) -> None:
+        """Discard all collected timings"""
+        with self._lock:
+            self._series = dict()
+        return
@@ -0,0 +1,761 @@
+"""
+Amatino API Python Bindings
+In Process Server Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import asyncio
+import gzip
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+from email.message import Message
+from itertools import count
+from secrets import token_hex
+from threading import Lock
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from amatino.am_type import AMType
+from amatino.global_unit import GlobalUnitConstants
+from amatino.side import Side
+from amatino.internal.am_time import AmatinoTime
+from amatino.internal.compression import Compression
+from amatino.internal.immutable import Immutable
+from amatino.internal.transport import Transport
+
+Query = Dict[str, List[str]]
+Posting = Tuple[datetime, int, int, Decimal]
+
+
+class InProcessServer(Transport):
+    """
+    A stand-in for the Amatino API, serving requests in-process from data
+    held in memory, for use in offline testing, load testing, and
+    benchmarking. Install it via Transport.set_shared(). For example:
+
+        Transport.set_shared(InProcessServer())
+        session = Session.create_with_email('a@example.com', 'secret')
+        entity = Entity.create(session, 'Example', None)
+
+    Sessions, Entities, Accounts, Transactions, Custom Units, Global Units,
+    Ledgers, Recursive Ledgers, Balances, Recursive Balances, Trees,
+    Positions, and Performances are served.
+
+    The stand-in is not a faithful reproduction of the Amatino API. Requests
+    are not authenticated, and amounts are not converted between units:
+    Views are reported in the requested denomination, with amounts as they
+    were entered. Optionally supply a latency, in seconds, added to every
+    request.
+    """
+    endpoint = 'http://amatino.invalid'
+    PAGE_SIZE = 1000
+    _COMPRESSION_THRESHOLD = 1024
+    _DEBIT_NORMAL = (AMType.asset.value, AMType.expense.value)
+
+    def __init__(self, latency: float = 0.0) -> None:
+
+        if not isinstance(latency, (int, float)) or latency < 0:
+            raise TypeError('latency must be a non-negative number')
+
+        self._latency = float(latency)
+        self._lock = Lock()
+        self._entities = dict()  # type: Dict[str, InProcessServer._Book]
+        self._ids = count(1)
+        self._requests = 0
+
+        self._routes = {
+            ('POST', '/session'): self._create_session,
+            ('POST', '/entities'): self._create_entities,
+            ('GET', '/entities'): self._retrieve_entity,
+            ('POST', '/accounts'): self._create_accounts,
+            ('GET', '/accounts'): self._retrieve_accounts,
+            ('PUT', '/accounts'): self._update_accounts,
+            ('POST', '/transactions'): self._create_transactions,
+            ('GET', '/transactions'): self._retrieve_transactions,
+            ('PUT', '/transactions'): self._update_transactions,
+            ('DELETE', '/transactions'): self._delete_transaction,
+            ('POST', '/custom_units'): self._create_custom_units,
+            ('GET', '/custom_units'): self._retrieve_custom_units,
+            ('PUT', '/custom_units'): self._update_custom_units,
+            ('GET', '/units'): self._retrieve_global_units,
+            ('GET', '/accounts/ledger'): self._ledger,
+            ('GET', '/accounts/ledger/recursive'): self._recursive_ledger,
+            ('GET', '/accounts/balance'): self._balances,
+            ('GET', '/accounts/balance/recursive'): self._recursive_balances,
+            ('GET', '/trees'): self._tree,
+            ('GET', '/positions'): self._position,
+            ('GET', '/performances'): self._performance
+        }  # type: Dict[Tuple[str, str], Callable[[Query, Any], Any]]
+
+        return
+
+    latency = Immutable(lambda s: s._latency)
+    requests = Immutable(lambda s: s._requests)
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        """Serve a request, returning its response"""
+        response = self._serve(method, url, body, headers)
+        if self._latency > 0:
+            time.sleep(self._latency)
+        return response
+
+    async def open_async(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        """
+        Serve a request, returning its response. Latency is awaited, such
+        that concurrent requests on one event loop are served concurrently.
+        """
+        response = self._serve(method, url, body, headers)
+        if self._latency > 0:
+            await asyncio.sleep(self._latency)
+        return response
+
+    def _serve(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> Transport.Response:
+        """Route a request to its handler, returning its response"""
+        components = urlsplit(url)
+        query = parse_qs(components.query)
+        request_headers = {k.lower(): v for k, v in headers.items()}
+
+        status = 200
+        try:
+            handler = self._routes.get((method, components.path))
+            if handler is None:
+                raise InProcessServer._Rejected(404, 'Unknown path')
+            data = None
+            if body:
+                body = Compression.decode(
+                    body,
+                    request_headers.get('content-encoding')
+                )
+                data = json.loads(body.decode('utf-8'))
+            with self._lock:
+                self._requests += 1
+                payload = handler(query, data)
+        except InProcessServer._Rejected as rejection:
+            status = rejection.status
+            payload = {'error': rejection.message}
+        except (KeyError, IndexError, TypeError, ValueError) as error:
+            status = 400
+            payload = {'error': 'Malformed request: ' + repr(error)}
+
+        response_body = json.dumps(payload).encode('utf-8')
+        response_headers = Message()
+        response_headers['Content-Type'] = 'application/json'
+
+        accepted = request_headers.get('accept-encoding', '')
+        if (
+                'gzip' in accepted
+                and len(response_body) > self._COMPRESSION_THRESHOLD
+        ):
+            response_body = gzip.compress(response_body, compresslevel=1)
+            response_headers['Content-Encoding'] = 'gzip'
+
+        return Transport.Response(
+            status,
+            'OK' if status == 200 else 'Error',
+            response_headers,
+            response_body
+        )
+
+    def _book(self, query: Query) -> 'InProcessServer._Book':
+        entity_id = query['entity_id'][0]
+        book = self._entities.get(entity_id)
+        if book is None:
+            raise InProcessServer._Rejected(404, 'Unknown Entity')
+        return book
+
+    def _create_session(self, _: Query, data: Any) -> Any:
+        user_id = data['user_id']
+        if user_id is None:
+            user_id = 1
+        return {
+            'api_key': token_hex(32),
+            'session_id': next(self._ids),
+            'user_id': user_id
+        }
+
+    def _create_entities(self, _: Query, data: Any) -> Any:
+        created = list()
+        for arguments in data:
+            book = InProcessServer._Book({
+                'entity_id': token_hex(16),
+                'name': arguments['name'],
+                'description': arguments['description'],
+                'region_id': arguments['region_id'],
+                'owner': 1,
+                'permissions_graph': None,
+                'disposition': {
+                    'sequence': 1,
+                    'count': 1,
+                    'limit': 1,
+                    'offset': 0
+                }
+            })
+            self._entities[book.entity['entity_id']] = book
+            created.append(book.entity)
+        return created
+
+    def _retrieve_entity(self, query: Query, _: Any) -> Any:
+        return [self._book(query).entity]
+
+    def _create_accounts(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        created = list()
+        for arguments in data:
+            account = self._account(book, arguments, next(self._ids))
+            book.accounts[account['account_id']] = account
+            created.append(account)
+        return created
+
+    def _retrieve_accounts(self, query: Query, _: Any) -> Any:
+        book = self._book(query)
+        ids = [int(i) for i in query['account_id']]
+        missing = [i for i in ids if i not in book.accounts]
+        if len(missing) > 0:
+            raise InProcessServer._Rejected(404, 'Unknown Account')
+        return [book.accounts[i] for i in ids]
+
+    def _update_accounts(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        updated = list()
+        for arguments in data:
+            account_id = arguments['account_id']
+            if account_id not in book.accounts:
+                raise InProcessServer._Rejected(404, 'Unknown Account')
+            account = self._account(book, arguments, account_id)
+            book.accounts[account_id] = account
+            updated.append(account)
+        return updated
+
+    def _account(
+        self,
+        book: 'InProcessServer._Book',
+        arguments: Any,
+        account_id: int
+    ) -> Dict[str, Any]:
+        parent_id = arguments['parent_account_id']
+        if parent_id is not None and parent_id not in book.accounts:
+            raise InProcessServer._Rejected(400, 'Unknown parent Account')
+        if parent_id == account_id:
+            raise InProcessServer._Rejected(400, 'Account is its own parent')
+        AMType(arguments['type'])
+        colour = arguments['colour']
+        if not isinstance(colour, str) or len(colour) != 6:
+            colour = 'ffffff'
+        return {
+            'account_id': account_id,
+            'name': arguments['name'],
+            'type': arguments['type'],
+            'description': arguments['description'],
+            'parent_account_id': parent_id,
+            'global_unit_id': arguments['global_unit_id'],
+            'custom_unit_id': arguments['custom_unit_id'],
+            'counterparty_entity_id': arguments['counterparty_entity_id'],
+            'colour': colour
+        }
+
+    def _create_transactions(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        created = list()
+        for arguments in data:
+            transaction = self._transaction(book, arguments, next(self._ids))
+            book.store(transaction)
+            created.append(transaction)
+        return created
+
+    def _retrieve_transactions(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        ids = [a['transaction_id'] for a in data]
+        missing = [i for i in ids if i not in book.transactions]
+        if len(missing) > 0:
+            raise InProcessServer._Rejected(404, 'Unknown Transaction')
+        return [book.transactions[i] for i in ids]
+
+    def _update_transactions(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        updated = list()
+        for arguments in data:
+            transaction_id = arguments['transaction_id']
+            existing = book.transactions.get(transaction_id)
+            if existing is None:
+                raise InProcessServer._Rejected(404, 'Unknown Transaction')
+            merged = dict(existing)
+            merged.update(
+                {k: v for k, v in arguments.items() if v is not None}
+            )
+            transaction = self._transaction(book, merged, transaction_id)
+            book.store(transaction)
+            updated.append(transaction)
+        return updated
+
+    def _delete_transaction(self, query: Query, _: Any) -> Any:
+        book = self._book(query)
+        transaction_id = int(query['transaction_id'][0])
+        if transaction_id not in book.transactions:
+            raise InProcessServer._Rejected(404, 'Unknown Transaction')
+        book.remove(transaction_id)
+        return []
+
+    def _transaction(
+        self,
+        book: 'InProcessServer._Book',
+        arguments: Any,
+        transaction_id: int
+    ) -> Dict[str, Any]:
+        transaction_time = AmatinoTime.decode(arguments['transaction_time'])
+        entries = list()
+        net = Decimal(0)
+        for entry in arguments['entries']:
+            if entry['account_id'] not in book.accounts:
+                raise InProcessServer._Rejected(400, 'Unknown Account')
+            side = Side(entry['side'])
+            amount = Decimal(entry['amount'])
+            net += amount if side == Side.debit else -amount
+            entries.append({
+                'account_id': entry['account_id'],
+                'amount': str(amount),
+                'description': entry['description'],
+                'side': side.value
+            })
+        if len(entries) < 2 or net != 0:
+            raise InProcessServer._Rejected(400, 'Unbalanced Transaction')
+        return {
+            'transaction_id': transaction_id,
+            'transaction_time': transaction_time.serialise(),
+            'version_time': AmatinoTime(datetime.utcnow()).serialise(),
+            'description': arguments['description'],
+            'entries': entries,
+            'global_unit_denomination': arguments['global_unit_denomination'],
+            'custom_unit_denomination': arguments['custom_unit_denomination']
+        }
+
+    def _create_custom_units(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        created = list()
+        for arguments in data:
+            unit = dict(arguments, custom_unit_id=next(self._ids))
+            book.custom_units[unit['custom_unit_id']] = unit
+            created.append(unit)
+        return created
+
+    def _retrieve_custom_units(self, query: Query, _: Any) -> Any:
+        book = self._book(query)
+        ids = [int(i) for i in query['custom_unit_id']]
+        if False in [i in book.custom_units for i in ids]:
+            raise InProcessServer._Rejected(404, 'Unknown Custom Unit')
+        return [book.custom_units[i] for i in ids]
+
+    def _update_custom_units(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        updated = list()
+        for arguments in data:
+            if arguments['custom_unit_id'] not in book.custom_units:
+                raise InProcessServer._Rejected(404, 'Unknown Custom Unit')
+            book.custom_units[arguments['custom_unit_id']] = dict(arguments)
+            updated.append(arguments)
+        return updated
+
+    def _retrieve_global_units(self, query: Query, _: Any) -> Any:
+        units = {u.id_: u for u in GlobalUnitConstants.PRIORITY_1_UNITS}
+        ids = [int(i) for i in query['global_unit_id']]
+        if False in [i in units for i in ids]:
+            raise InProcessServer._Rejected(404, 'Unknown Global Unit')
+        return [{
+            'global_unit_id': units[i].id_,
+            'code': units[i].code,
+            'name': units[i].name,
+            'priority': units[i].priority,
+            'description': units[i].description,
+            'exponent': units[i].exponent
+        } for i in ids]
+
+    def _ledger(self, query: Query, data: Any) -> Any:
+        return self._compute_ledger(self._book(query), data, False)
+
+    def _recursive_ledger(self, query: Query, data: Any) -> Any:
+        return self._compute_ledger(self._book(query), data, True)
+
+    def _compute_ledger(
+        self,
+        book: 'InProcessServer._Book',
+        arguments: Any,
+        recursive: bool
+    ) -> Any:
+        account_id = arguments['account_id']
+        account = book.account(account_id)
+        members = {account_id}
+        if recursive:
+            members = book.subtree(account_id)
+
+        end_time = self._time(arguments['end_time'], datetime.utcnow())
+        start_time = self._time(arguments['start_time'], None)
+
+        postings = sorted(set(
+            (p[0], p[1]) for a in members for p in book.postings.get(a, [])
+        ))
+        if start_time is None:
+            start_time = postings[0][0] if len(postings) > 0 else end_time
+
+        sign = self._sign(account)
+        running = Decimal(0)
+        rows = list()
+        for transaction_time, transaction_id in postings:
+            if transaction_time > end_time:
+                break
+            transaction = book.transactions[transaction_id]
+            debit = Decimal(0)
+            credit = Decimal(0)
+            opposing = None
+            for entry in transaction['entries']:
+                if entry['account_id'] not in members:
+                    if opposing is None:
+                        opposing = entry['account_id']
+                    continue
+                if entry['side'] == Side.debit.value:
+                    debit += Decimal(entry['amount'])
+                else:
+                    credit += Decimal(entry['amount'])
+            running += sign * (debit - credit)
+            if transaction_time < start_time:
+                continue
+            opposing_name = None
+            if opposing is not None:
+                opposing_name = book.accounts[opposing]['name']
+            rows.append([
+                transaction_id,
+                transaction['transaction_time'],
+                transaction['description'],
+                opposing,
+                opposing_name,
+                self._amount(debit),
+                self._amount(credit),
+                self._amount(running)
+            ])
+
+        oldest_first = arguments['order_oldest_first']
+        if not oldest_first:
+            rows.reverse()
+
+        number_of_pages = max(1, -(-len(rows) // self.PAGE_SIZE))
+        page = arguments['page']
+        first = (page - 1) * self.PAGE_SIZE
+
+        return {
+            'account_id': account_id,
+            'start_time': AmatinoTime(start_time).serialise(),
+            'end_time': AmatinoTime(end_time).serialise(),
+            'recursive': recursive,
+            'generated_time': AmatinoTime(datetime.utcnow()).serialise(),
+            'global_unit_denomination': arguments['global_unit_denomination'],
+            'custom_unit_denomination': arguments['custom_unit_denomination'],
+            'ledger_rows': rows[first:first + self.PAGE_SIZE],
+            'page': page,
+            'number_of_pages': number_of_pages,
+            'ordered_oldest_first': oldest_first
+        }
+
+    def _balances(self, query: Query, data: Any) -> Any:
+        return self._compute_balances(self._book(query), data, False)
+
+    def _recursive_balances(self, query: Query, data: Any) -> Any:
+        return self._compute_balances(self._book(query), data, True)
+
+    def _compute_balances(
+        self,
+        book: 'InProcessServer._Book',
+        data: Any,
+        recursive: bool
+    ) -> Any:
+        balances = list()
+        for arguments in data:
+            account_id = arguments['account_id']
+            account = book.account(account_id)
+            balance_time = self._time(
+                arguments['balance_time'],
+                datetime.utcnow()
+            )
+            members = {account_id}
+            if recursive:
+                members = book.subtree(account_id)
+            net = Decimal(0)
+            for member in members:
+                for posting in book.postings.get(member, []):
+                    if posting[0] <= balance_time:
+                        net += posting[3]
+            balances.append({
+                'balance_time': AmatinoTime(balance_time).serialise(),
+                'generated_time': AmatinoTime(datetime.utcnow()).serialise(),
+                'recursive': recursive,
+                'global_unit_denomination': arguments[
+                    'global_unit_denomination'
+                ],
+                'custom_unit_denomination': arguments[
+                    'custom_unit_denomination'
+                ],
+                'account_id': account_id,
+                'balance': self._amount(self._sign(account) * net)
+            })
+        return balances
+
+    def _tree(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        balance_time = self._time(data['balance_time'], datetime.utcnow())
+        return {
+            'balance_time': AmatinoTime(balance_time).serialise(),
+            'generated_time': AmatinoTime(datetime.utcnow()).serialise(),
+            'global_unit_denomination': data['global_unit_denomination'],
+            'custom_unit_denomination': data['custom_unit_denomination'],
+            'tree': self._forest(book, None, balance_time, None, None)
+        }
+
+    def _position(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        balance_time = self._time(data['balance_time'], datetime.utcnow())
+        depth = data['depth']
+        if depth is None:
+            depth = book.depth()
+
+        def forest(am_type: AMType) -> List[Any]:
+            return self._forest(book, am_type, balance_time, None, depth)
+
+        return {
+            'balance_time': AmatinoTime(balance_time).serialise(),
+            'generated_time': AmatinoTime(datetime.utcnow()).serialise(),
+            'global_unit_denomination': data['global_unit_denomination'],
+            'custom_unit_denomination': data['custom_unit_denomination'],
+            'assets': forest(AMType.asset),
+            'liabilities': forest(AMType.liability),
+            'equities': forest(AMType.equity),
+            'depth': depth
+        }
+
+    def _performance(self, query: Query, data: Any) -> Any:
+        book = self._book(query)
+        start_time = self._time(data['start_time'], None)
+        end_time = self._time(data['end_time'], datetime.utcnow())
+        depth = data['depth']
+        if depth is None:
+            depth = book.depth()
+
+        def forest(am_type: AMType) -> List[Any]:
+            return self._forest(book, am_type, end_time, start_time, depth)
+
+        return {
+            'start_time': AmatinoTime(start_time).serialise(),
+            'end_time': AmatinoTime(end_time).serialise(),
+            'generated_time': AmatinoTime(datetime.utcnow()).serialise(),
+            'global_unit_denomination': data['global_unit_denomination'],
+            'custom_unit_denomination': data['custom_unit_denomination'],
+            'income': forest(AMType.income),
+            'expenses': forest(AMType.expense),
+            'depth': depth
+        }
+
+    def _forest(
+        self,
+        book: 'InProcessServer._Book',
+        am_type: Optional[AMType],
+        end_time: datetime,
+        start_time: Optional[datetime],
+        depth: Optional[int]
+    ) -> List[Any]:
+        """
+        Return raw TreeNode data describing the hierarchy of Accounts of the
+        supplied type, or all Accounts, with balances of the Transactions
+        between the supplied times
+        """
+        children = dict()  # type: Dict[Optional[int], List[int]]
+        for account in book.accounts.values():
+            if am_type is not None and account['type'] != am_type.value:
+                continue
+            parent_id = account['parent_account_id']
+            if parent_id is not None and (
+                    am_type is not None
+                    and book.accounts[parent_id]['type'] != am_type.value
+            ):
+                parent_id = None
+            children.setdefault(parent_id, []).append(account['account_id'])
+
+        balances = dict()  # type: Dict[int, Decimal]
+        for account_id, postings in book.postings.items():
+            net = Decimal(0)
+            for posting in postings:
+                if posting[0] > end_time:
+                    continue
+                if start_time is not None and posting[0] < start_time:
+                    continue
+                net += posting[3]
+            balances[account_id] = net
+
+        # Build nodes depth first, then total recursive balances in reverse
+        # such that every child is totalled before its parent.
+        nodes = dict()  # type: Dict[int, Dict[str, Any]]
+        order = list()  # type: List[Tuple[int, int]]
+        stack = [(i, 0) for i in reversed(children.get(None, []))]
+        while len(stack) > 0:
+            account_id, node_depth = stack.pop()
+            order.append((account_id, node_depth))
+            stack.extend([
+                (i, node_depth + 1)
+                for i in reversed(children.get(account_id, []))
+            ])
+
+        totals = dict()  # type: Dict[int, Decimal]
+        for account_id, node_depth in reversed(order):
+            account = book.accounts[account_id]
+            own = self._sign(account) * balances.get(account_id, Decimal(0))
+            kids = children.get(account_id, [])
+            totals[account_id] = own + sum(
+                [totals[k] for k in kids],
+                Decimal(0)
+            )
+            kid_nodes = None  # type: Optional[List[Any]]
+            if depth is None or node_depth < depth:
+                kid_nodes = [nodes[k] for k in kids]
+            nodes[account_id] = {
+                'account_id': account_id,
+                'depth': node_depth,
+                'account_balance': self._amount(own),
+                'recursive_balance': self._amount(totals[account_id]),
+                'name': account['name'],
+                'type': account['type'],
+                'children': kid_nodes
+            }
+
+        return [nodes[i] for i in children.get(None, [])]
+
+    @classmethod
+    def _sign(cls, account: Dict[str, Any]) -> int:
+        """Return 1 if debits increase the supplied Account's balance"""
+        if account['type'] in cls._DEBIT_NORMAL:
+            return 1
+        return -1
+
+    @staticmethod
+    def _time(
+        data: Optional[str],
+        default: Optional[datetime]
+    ) -> Optional[datetime]:
+        if data is None:
+            return default
+        return AmatinoTime.decode(data).raw.replace(tzinfo=None)
+
+    @staticmethod
+    def _amount(value: Decimal) -> str:
+        return '{0:.2f}'.format(value)
+
+    class _Rejected(Exception):
+        """A request the stand-in refuses to serve"""
+        def __init__(self, status: int, message: str) -> None:
+            super().__init__(message)
+            self.status = status
+            self.message = message
+            return
+
+    class _Book:
+        """The accounting data of one Entity"""
+
+        def __init__(self, entity: Dict[str, Any]) -> None:
+            self.entity = entity
+            self.accounts = dict()  # type: Dict[int, Dict[str, Any]]
+            self.transactions = dict()  # type: Dict[int, Dict[str, Any]]
+            self.custom_units = dict()  # type: Dict[int, Dict[str, Any]]
+            self.postings = dict()  # type: Dict[int, List[Posting]]
+            return
+
+        def account(self, account_id: int) -> Dict[str, Any]:
+            account = self.accounts.get(account_id)
+            if account is None:
+                raise InProcessServer._Rejected(404, 'Unknown Account')
+            return account
+
+        def depth(self) -> int:
+            """Return the number of levels in the hierarchy of Accounts"""
+            levels = dict()  # type: Dict[int, int]
+            for account_id in self.accounts:
+                chain = list()
+                current = account_id
+                while current is not None and current not in levels:
+                    chain.append(current)
+                    current = self.accounts[current]['parent_account_id']
+                level = 0 if current is None else levels[current]
+                for member in reversed(chain):
+                    level += 1
+                    levels[member] = level
+            return max(levels.values(), default=0)
+
+        def subtree(self, account_id: int) -> Set[int]:
+            """Return the ids of an Account and all its descendants"""
+            children = dict()  # type: Dict[int, List[int]]
+            for account in self.accounts.values():
+                parent_id = account['parent_account_id']
+                if parent_id is not None:
+                    children.setdefault(parent_id, []).append(
+                        account['account_id']
+                    )
+            members = set()  # type: Set[int]
+            stack = [account_id]
+            while len(stack) > 0:
+                member = stack.pop()
+                members.add(member)
+                stack.extend(children.get(member, []))
+            return members
+
+        def store(self, transaction: Dict[str, Any]) -> None:
+            """Record a Transaction, replacing any previous version"""
+            transaction_id = transaction['transaction_id']
+            if transaction_id in self.transactions:
+                self.remove(transaction_id)
+            self.transactions[transaction_id] = transaction
+            transaction_time = AmatinoTime.decode(
+                transaction['transaction_time']
+            ).raw.replace(tzinfo=None)
+            for entry in transaction['entries']:
+                amount = Decimal(entry['amount'])
+                if entry['side'] != Side.debit.value:
+                    amount = -amount
+                self.postings.setdefault(entry['account_id'], []).append(
+                    (transaction_time, transaction_id, entry['account_id'],
+                     amount)
+                )
+            return
+
+        def remove(self, transaction_id: int) -> None:
+            """Forget a Transaction"""
+            transaction = self.transactions.pop(transaction_id)
+            account_ids = {e['account_id'] for e in transaction['entries']}
+            for account_id in account_ids:
+                self.postings[account_id] = [
+                    p for p in self.postings[account_id]
+                    if p[1] != transaction_id
+                ]
+            return
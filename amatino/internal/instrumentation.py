@@ -0,0 +1,218 @@
+"""
+Amatino API Python Bindings
+Instrumentation Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import threading
+import time
+from functools import wraps
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+from amatino.internal.immutable import Immutable
+
+
+class Instrumentation:
+    """
+    A registry of hooks receiving an Instrumentation.Event for each phase
+    of each request to the Amatino API, namely:
+
+        sign     Computing request headers, including the signature
+        encode   Serialising and compressing the request body
+        network  Sending one attempt and reading its response
+        parse    Decompressing and parsing the response body as JSON
+        decode   Decoding parsed data into Amatino objects
+
+    Register a hook, such as a HistogramCollector, via .register(). For
+    example:
+
+        collector = HistogramCollector()
+        Instrumentation.register(collector)
+
+    Hooks are called synchronously on the requesting thread, and must not
+    raise. While no hooks are registered, events are discarded unseen.
+
+    The network time of a streamed request ends once response headers are
+    received, and no parse event is emitted for its body.
+
+    Decode events are attributed to the request most recently completed on
+    the decoding thread. Coroutines interleaving requests on one event loop
+    may therefore see decode events attributed to a sibling request.
+    """
+    SIGN = 'sign'
+    ENCODE = 'encode'
+    NETWORK = 'network'
+    PARSE = 'parse'
+    DECODE = 'decode'
+    PHASES = (SIGN, ENCODE, NETWORK, PARSE, DECODE)
+
+    _hooks = tuple()  # type: Tuple[Callable, ...]
+    _hooks_lock = Lock()
+    _context = threading.local()
+
+    class Event:
+        """The time spent in one phase of a request"""
+        __slots__ = (
+            '_phase',
+            '_path',
+            '_method',
+            '_seconds',
+            '_size',
+            '_status',
+            '_retries'
+        )
+
+        def __init__(
+            self,
+            phase: str,
+            path: Optional[str],
+            method: Optional[str],
+            seconds: float,
+            size: Optional[int] = None,
+            status: Optional[int] = None,
+            retries: int = 0
+        ) -> None:
+            self._phase = phase
+            self._path = path
+            self._method = method
+            self._seconds = seconds
+            self._size = size
+            self._status = status
+            self._retries = retries
+            return
+
+        phase = Immutable(lambda s: s._phase)
+        path = Immutable(lambda s: s._path)
+        method = Immutable(lambda s: s._method)
+        seconds = Immutable(lambda s: s._seconds)
+        size = Immutable(lambda s: s._size)
+        status = Immutable(lambda s: s._status)
+        retries = Immutable(lambda s: s._retries)
+
+        def __repr__(self) -> str:
+            return (
+                'Instrumentation.Event({p}, {m} {path}, {s:.6f}s, '
+                'size={size}, status={status}, retries={r})'
+            ).format(
+                p=self._phase,
+                m=self._method,
+                path=self._path,
+                s=self._seconds,
+                size=self._size,
+                status=self._status,
+                r=self._retries
+            )
+
+    @classmethod
+    def register(cls, hook: Callable[['Instrumentation.Event'], Any]) -> None:
+        """Begin delivering events to the supplied callable"""
+        if not callable(hook):
+            raise TypeError('hook must be callable')
+        with cls._hooks_lock:
+            if hook not in Instrumentation._hooks:
+                Instrumentation._hooks = Instrumentation._hooks + (hook,)
+        return
+
+    @classmethod
+    def unregister(
+        cls,
+        hook: Callable[['Instrumentation.Event'], Any]
+    ) -> None:
+        """Stop delivering events to the supplied callable, if registered"""
+        with cls._hooks_lock:
+            Instrumentation._hooks = tuple(
+                h for h in Instrumentation._hooks if h != hook
+            )
+        return
+
+    @classmethod
+    def active(cls) -> bool:
+        """Return True if any hooks are registered"""
+        return len(Instrumentation._hooks) > 0
+
+    @classmethod
+    def emit(
+        cls,
+        phase: str,
+        path: Optional[str],
+        method: Optional[str],
+        seconds: float,
+        size: Optional[int] = None,
+        status: Optional[int] = None,
+        retries: int = 0
+    ) -> None:
+        """Deliver an event to every registered hook"""
+        hooks = Instrumentation._hooks
+        if len(hooks) < 1:
+            return
+        event = cls.Event(phase, path, method, seconds, size, status, retries)
+        for hook in hooks:
+            hook(event)
+        return
+
+    @classmethod
+    def began(cls, path: str, method: str) -> None:
+        """
+        Record that a request has begun on this thread, such that decode
+        events are no longer attributed to any request completed earlier
+        """
+        cls._context.request = (path, method, None, None, 0)
+        return
+
+    @classmethod
+    def completed(
+        cls,
+        path: str,
+        method: str,
+        size: Optional[int],
+        status: Optional[int],
+        retries: int
+    ) -> None:
+        """
+        Record the request most recently completed on this thread, to which
+        subsequent decode events are attributed
+        """
+        cls._context.request = (path, method, size, status, retries)
+        return
+
+    @classmethod
+    def decoder(cls, function: Callable) -> Callable:
+        """
+        Decorate a function decoding response data, such that its calls emit
+        decode events. Calls nested within another decoder are counted as
+        part of the outermost call.
+        """
+        @wraps(function)
+        def decode(*args, **kwargs) -> Any:
+            if len(Instrumentation._hooks) < 1:
+                return function(*args, **kwargs)
+            context = cls._context
+            depth = getattr(context, 'depth', 0)
+            context.depth = depth + 1
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                context.depth = depth
+                if depth == 0:
+                    request = getattr(
+                        context,
+                        'request',
+                        (None, None, None, None, 0)
+                    )
+                    cls.emit(
+                        cls.DECODE,
+                        request[0],
+                        request[1],
+                        time.perf_counter() - started,
+                        request[2],
+                        request[3],
+                        request[4]
+                    )
+
+        return decode
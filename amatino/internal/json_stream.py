@@ -0,0 +1,222 @@
+"""
+Amatino API Python Bindings
+JSON Stream Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import codecs
+from json import JSONDecoder
+from json import JSONDecodeError
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from amatino.api_error import ApiError
+from amatino.missing_key import MissingKey
+from amatino.unexpected_response_type import UnexpectedResponseType
+from amatino.internal.immutable import Immutable
+
+
+class JsonStream:
+    """
+    Private - Not intended to be used directly. Obtain instances via
+    Ledger.stream() or Tree.stream().
+
+    An iterator over the elements of one array in a JSON document, parsed
+    incrementally from chunks of bytes as they arrive. The array may be the
+    document itself, or the value of `key` in a top-level object. Each
+    element is passed through `decode`, if supplied, before it is returned.
+
+    Only the unparsed remainder of the most recent chunks is held in memory,
+    whatever the size of the document. Other top-level values are collected
+    in .fields, which is complete once iteration has finished. Close the
+    stream to abandon the document early.
+    """
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        key: Optional[str] = None,
+        decode: Optional[Callable[[Any], Any]] = None
+    ) -> None:
+
+        self._chunks = iter(chunks)
+        self._key = key
+        self._decode = decode
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = JSONDecoder()
+        self._buffer = ''
+        self._index = 0
+        self._exhausted = False
+        self._fields = dict()  # type: Dict[str, Any]
+        self._elements = self._parse()
+
+        return
+
+    fields = Immutable(lambda s: s._fields)
+
+    def __iter__(self) -> 'JsonStream':
+        return self
+
+    def __next__(self) -> Any:
+        element = next(self._elements)
+        if self._decode is None:
+            return element
+        return self._decode(element)
+
+    def __enter__(self) -> 'JsonStream':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        return
+
+    def close(self) -> None:
+        """Stop parsing, and release the source of chunks"""
+        self._elements.close()
+        close = getattr(self._chunks, 'close', None)
+        if close is not None:
+            close()
+        self._buffer = ''
+        self._index = 0
+        return
+
+    def _parse(self) -> Iterator[Any]:
+        """Yield each raw element of the target array in document order"""
+        if self._key is None:
+            yield from self._array()
+            self._finish()
+            return
+
+        self._expect('{')
+        found = False
+        if self._peek() == '}':
+            self._index += 1
+        else:
+            while True:
+                name = self._value()
+                if not isinstance(name, str):
+                    raise UnexpectedResponseType(name, str)
+                self._expect(':')
+                if name == self._key:
+                    yield from self._array()
+                    found = True
+                else:
+                    self._fields[name] = self._value()
+                if self._closes('}'):
+                    break
+
+        if not found:
+            raise MissingKey(self._key)
+
+        self._finish()
+        return
+
+    def _array(self) -> Iterator[Any]:
+        """Yield each raw element of the array at the current position"""
+        if self._peek() != '[':
+            value = self._value()
+            if value is not None:
+                raise UnexpectedResponseType(value, list)
+            return
+        self._index += 1
+        if self._peek() == ']':
+            self._index += 1
+            return
+        while True:
+            yield self._value()
+            if self._closes(']'):
+                return
+
+    def _closes(self, closing: str) -> bool:
+        """
+        Consume the delimiter following a value, returning True if it closes
+        the enclosing array or object
+        """
+        character = self._peek()
+        self._index += 1
+        if character == ',':
+            return False
+        if character == closing:
+            return True
+        raise ApiError('Malformed JSON in streamed response data')
+
+    def _expect(self, character: str) -> None:
+        if self._peek() != character:
+            raise ApiError('Malformed JSON in streamed response data')
+        self._index += 1
+        return
+
+    def _finish(self) -> None:
+        """Verify that nothing but whitespace follows the document"""
+        while True:
+            remainder = self._buffer[self._index:].strip(self._WHITESPACE)
+            if len(remainder) > 0:
+                raise ApiError('Unexpected data after streamed response data')
+            self._index = len(self._buffer)
+            if not self._read():
+                return
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character, reading if required"""
+        while True:
+            buffer = self._buffer
+            index = self._index
+            while index < len(buffer) and buffer[index] in self._WHITESPACE:
+                index += 1
+            self._index = index
+            if index < len(buffer):
+                return buffer[index]
+            if not self._read():
+                raise ApiError('Unexpected end of streamed response data')
+
+    def _value(self) -> Any:
+        """Return the complete JSON value at the current position"""
+        self._peek()
+        while True:
+            end = None
+            try:
+                value, end = self._decoder.raw_decode(
+                    self._buffer,
+                    self._index
+                )
+            except JSONDecodeError:
+                pass
+            # A value ending at the end of the buffer may be truncated, e.g.
+            # a number whose remaining digits are yet to arrive. Values in a
+            # well formed document are always followed by a delimiter.
+            if end is not None and (
+                    end < len(self._buffer) or self._exhausted
+            ):
+                self._index = end
+                return value
+            # Wait for at least as much again before parsing anew, such that
+            # values spanning many chunks are not parsed many times.
+            target = 2 * (len(self._buffer) - self._index)
+            if not self._read():
+                raise ApiError('Unexpected end of streamed response data')
+            while not self._exhausted:
+                if len(self._buffer) - self._index >= target:
+                    break
+                self._read()
+
+    def _read(self) -> bool:
+        """
+        Append the next chunk to the buffer, discarding parsed text. Return
+        False if no chunks remain.
+        """
+        if self._exhausted:
+            return False
+        try:
+            text = self._text.decode(next(self._chunks))
+        except StopIteration:
+            self._exhausted = True
+            text = self._text.decode(b'', final=True)
+        self._buffer = self._buffer[self._index:] + text
+        self._index = 0
+        return True
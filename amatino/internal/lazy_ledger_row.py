@@ -0,0 +1,71 @@
+"""
+Amatino API Python Bindings
+Lazy Ledger Row Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from typing import List
+from amatino.ledger_row import LedgerRow
+from amatino.internal.am_time import AmatinoTime
+from amatino.internal.am_amount import AmatinoAmount
+from amatino.internal.immutable import Immutable
+
+
+class LazyLedgerRow(LedgerRow):
+    """
+    Private - Not intended to be used directly.
+
+    A LedgerRow holding the raw list delivered by the Amatino API. The
+    transaction time and amounts are decoded on first access, and cached
+    thereafter, such that consumers reading only a few fields of each row
+    do not pay to decode the others.
+
+    Decoded amounts are held in the slots LedgerRow declares for them.
+    """
+    __slots__ = ('_data', '_time')
+
+    def __init__(self, data: List[Any]) -> None:
+        self._data = data
+        return
+
+    transaction_id = Immutable(lambda s: s._data[0])
+    transaction_time = Immutable(lambda s: s._decoded_time())
+    description = Immutable(lambda s: s._data[2])
+    opposing_account_id = Immutable(lambda s: s._data[3])
+    opposing_account_name = Immutable(lambda s: s._data[4])
+    debit = Immutable(lambda s: s._decoded_debit())
+    credit = Immutable(lambda s: s._decoded_credit())
+    balance = Immutable(lambda s: s._decoded_balance())
+
+    def _decoded_time(self) -> datetime:
+        try:
+            return self._time
+        except AttributeError:
+            self._time = AmatinoTime.decode(self._data[1]).raw
+            return self._time
+
+    def _decoded_debit(self) -> Decimal:
+        try:
+            return self._debit
+        except AttributeError:
+            self._debit = AmatinoAmount.decode(self._data[5])
+            return self._debit
+
+    def _decoded_credit(self) -> Decimal:
+        try:
+            return self._credit
+        except AttributeError:
+            self._credit = AmatinoAmount.decode(self._data[6])
+            return self._credit
+
+    def _decoded_balance(self) -> Decimal:
+        try:
+            return self._balance
+        except AttributeError:
+            self._balance = AmatinoAmount.decode(self._data[7])
+            return self._balance
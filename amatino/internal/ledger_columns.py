@@ -0,0 +1,299 @@
+"""
+Amatino API Python Bindings
+Ledger Columns Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+from array import array
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+from collections.abc import Sequence
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from amatino.ledger_row import LedgerRow
+from amatino.unexpected_response_type import UnexpectedResponseType
+from amatino.internal.am_time import AmatinoTime
+from amatino.internal.immutable import Immutable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+T = TypeVar('T', bound='LedgerColumns')
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_ACCOUNT = -1
+
+
+class LedgerColumns(Sequence):
+    """
+    Private - Not intended to be used directly.
+
+    LedgerRow data stored column-wise in contiguous arrays. Integer columns
+    are NumPy int64 arrays when NumPy is installed, and `array.array` int64
+    arrays otherwise.
+
+    Transaction times are stored as integer microseconds since the Unix
+    epoch. Amounts are stored as integers scaled by 10 ** scale, such that
+    sums over a column are exact. Should an amount be too large to fit in a
+    64 bit integer, amount columns fall back to lists of Python integers.
+    Descriptions and opposing Account names are interned in a shared pool,
+    and stored as indexes into that pool.
+
+    Indexing returns a LedgerRow view created on demand.
+    """
+
+    def __init__(
+        self,
+        transaction_ids: Any,
+        times: Any,
+        descriptions: Any,
+        opposing_account_ids: Any,
+        opposing_account_names: Any,
+        debits: Any,
+        credits: Any,
+        balances: Any,
+        scale: int,
+        strings: List[Optional[str]]
+    ) -> None:
+
+        self._transaction_ids = transaction_ids
+        self._times = times
+        self._descriptions = descriptions
+        self._opposing_account_ids = opposing_account_ids
+        self._opposing_account_names = opposing_account_names
+        self._debits = debits
+        self._credits = credits
+        self._balances = balances
+        self._scale = scale
+        self._strings = strings
+
+        return
+
+    transaction_ids = Immutable(lambda s: s._transaction_ids)
+    times = Immutable(lambda s: s._times)
+    opposing_account_ids = Immutable(lambda s: s._opposing_account_ids)
+    debits = Immutable(lambda s: s._debits)
+    credits = Immutable(lambda s: s._credits)
+    balances = Immutable(lambda s: s._balances)
+    scale = Immutable(lambda s: s._scale)
+
+    total_debits = Immutable(lambda s: s._total(s._debits))
+    total_credits = Immutable(lambda s: s._total(s._credits))
+
+    def __len__(self) -> int:
+        return len(self._transaction_ids)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._row(i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if key < 0 or key >= len(self):
+            raise IndexError('LedgerColumns index out of range')
+        return self._row(key)
+
+    def amount(self, value: int) -> Decimal:
+        """Return a Decimal amount from a scaled integer column value"""
+        return Decimal(int(value)).scaleb(-self._scale)
+
+    def _total(self, column: Any) -> Decimal:
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            return self.amount(int(column.sum()))
+        return self.amount(sum(column))
+
+    def _row(self, index: int) -> LedgerRow:
+        opposing_account_id = int(self._opposing_account_ids[index])
+        if opposing_account_id == _NO_ACCOUNT:
+            opposing_account_id = None
+        time = _EPOCH + timedelta(microseconds=int(self._times[index]))
+        return LedgerRow(
+            transaction_id=int(self._transaction_ids[index]),
+            transaction_time=AmatinoTime(time),
+            description=self._strings[self._descriptions[index]],
+            opposing_account_id=opposing_account_id,
+            opposing_account_name=self._strings[
+                self._opposing_account_names[index]
+            ],
+            debit=self.amount(self._debits[index]),
+            credit=self.amount(self._credits[index]),
+            balance=self.amount(self._balances[index])
+        )
+
+    @classmethod
+    def decode(cls: Type[T], rows: List[Any]) -> T:
+        """Return LedgerColumns decoded from raw API ledger row data"""
+        if not isinstance(rows, list):
+            raise UnexpectedResponseType(rows, list)
+
+        transaction_ids = list()
+        times = list()
+        descriptions = list()
+        opposing_account_ids = list()
+        opposing_account_names = list()
+        amounts = list()  # type: List[Tuple[int, int, int, int, int, int]]
+        pool = _StringPool()
+        scale = 0
+
+        for data in rows:
+            if not isinstance(data, list):
+                raise UnexpectedResponseType(data, list)
+
+            transaction_ids.append(data[0])
+            time = AmatinoTime.decode(data[1]).raw.replace(tzinfo=None)
+            times.append((time - _EPOCH) // _MICROSECOND)
+            descriptions.append(pool.intern(data[2]))
+            if data[3] is None:
+                opposing_account_ids.append(_NO_ACCOUNT)
+            else:
+                opposing_account_ids.append(data[3])
+            opposing_account_names.append(pool.intern(data[4]))
+
+            debit, debit_places = _parse_amount(data[5])
+            credit, credit_places = _parse_amount(data[6])
+            balance, balance_places = _parse_amount(data[7])
+            scale = max(scale, debit_places, credit_places, balance_places)
+            amounts.append((
+                debit, debit_places,
+                credit, credit_places,
+                balance, balance_places
+            ))
+
+        debits = [a[0] * 10 ** (scale - a[1]) for a in amounts]
+        credits = [a[2] * 10 ** (scale - a[3]) for a in amounts]
+        balances = [a[4] * 10 ** (scale - a[5]) for a in amounts]
+
+        return cls(
+            transaction_ids=_integers(transaction_ids),
+            times=_integers(times),
+            descriptions=_indexes(descriptions),
+            opposing_account_ids=_integers(opposing_account_ids),
+            opposing_account_names=_indexes(opposing_account_names),
+            debits=_amounts(debits),
+            credits=_amounts(credits),
+            balances=_amounts(balances),
+            scale=scale,
+            strings=pool.strings
+        )
+
+    @classmethod
+    def concatenate(cls: Type[T], parts: List[T]) -> T:
+        """Return LedgerColumns holding the rows of all supplied parts"""
+        scale = max([p._scale for p in parts] + [0])
+        pool = _StringPool()
+
+        transaction_ids = list()
+        times = list()
+        descriptions = list()
+        opposing_account_ids = list()
+        opposing_account_names = list()
+        debits = list()
+        credits = list()
+        balances = list()
+
+        for part in parts:
+            remap = [pool.intern(s) for s in part._strings]
+            factor = 10 ** (scale - part._scale)
+            transaction_ids.extend([int(i) for i in part._transaction_ids])
+            times.extend([int(t) for t in part._times])
+            descriptions.extend([remap[i] for i in part._descriptions])
+            opposing_account_ids.extend(
+                [int(i) for i in part._opposing_account_ids]
+            )
+            opposing_account_names.extend(
+                [remap[i] for i in part._opposing_account_names]
+            )
+            debits.extend([int(d) * factor for d in part._debits])
+            credits.extend([int(c) * factor for c in part._credits])
+            balances.extend([int(b) * factor for b in part._balances])
+
+        return cls(
+            transaction_ids=_integers(transaction_ids),
+            times=_integers(times),
+            descriptions=_indexes(descriptions),
+            opposing_account_ids=_integers(opposing_account_ids),
+            opposing_account_names=_indexes(opposing_account_names),
+            debits=_amounts(debits),
+            credits=_amounts(credits),
+            balances=_amounts(balances),
+            scale=scale,
+            strings=pool.strings
+        )
+
+
+class _StringPool:
+    """Interns strings, assigning each distinct string an integer index"""
+
+    def __init__(self) -> None:
+        self.strings = list()  # type: List[Optional[str]]
+        self._indexes = dict()  # type: Dict[Optional[str], int]
+        return
+
+    def intern(self, string: Optional[str]) -> int:
+        index = self._indexes.get(string)
+        if index is None:
+            index = len(self.strings)
+            self._indexes[string] = index
+            self.strings.append(string)
+        return index
+
+
+def _parse_amount(amount: str) -> Tuple[int, int]:
+    """
+    Return an API amount string as an integer of its digits, and the number
+    of decimal places those digits carry
+    """
+    if not isinstance(amount, str):
+        raise UnexpectedResponseType(amount, str)
+
+    negate = False
+    if amount[0] == '(':
+        amount = amount[1:-1]
+        negate = True
+
+    amount = amount.replace(',', '')
+    if amount[0] == '-':
+        amount = amount[1:]
+        negate = not negate
+
+    whole, _, fraction = amount.partition('.')
+    value = int(whole + fraction)
+    if negate is True:
+        value = -value
+
+    return value, len(fraction)
+
+
+def _integers(values: List[int]) -> Any:
+    """Return a contiguous int64 column"""
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.int64)
+    return array('q', values)
+
+
+def _indexes(values: List[int]) -> Any:
+    """Return a contiguous column of string pool indexes"""
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.int32)
+    return array('i', values)
+
+
+def _amounts(values: List[int]) -> Any:
+    """
+    Return a contiguous int64 column of scaled amounts, or a list should an
+    amount not fit in 64 bits
+    """
+    try:
+        return _integers(values)
+    except OverflowError:
+        return values
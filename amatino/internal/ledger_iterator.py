@@ -0,0 +1,143 @@
+"""
+Amatino API Python Bindings
+Ledger Iterator Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import weakref
+from queue import Queue
+from queue import Full
+from threading import Event
+from threading import Thread
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from amatino.internal.immutable import Immutable
+
+
+class LedgerIterator:
+    """
+    Private - Not intended to be used directly. Obtain instances via
+    Ledger.iterate() or RecursiveLedger.iterate().
+
+    An iterator over every LedgerRow in every page of a Ledger. While the
+    caller consumes the rows of one page, subsequent pages are retrieved in
+    a background thread. At most `window` retrieved pages wait in memory
+    ahead of the page being consumed.
+
+    Retrieval stops once the iterator is closed, or once it is collected,
+    having been dropped without being closed.
+    """
+    _PUT_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        first_page: Any,
+        retrieve_page: Callable[[int], Any],
+        window: int = 2
+    ) -> None:
+
+        if not isinstance(window, int) or window < 1:
+            raise TypeError('window must be a positive `int`')
+
+        self._number_of_pages = first_page.number_of_pages
+        self._rows = first_page.rows  # type: List[Any]
+        self._index = 0
+        self._page = first_page.page
+        self._pages = Queue(maxsize=window)
+        self._stop = Event()
+        self._thread = None  # type: Optional[Thread]
+
+        if self._page < self._number_of_pages:
+            # The thread holds no reference to this iterator, which may
+            # therefore be collected while the thread waits to offer a page
+            self._thread = Thread(
+                target=self._prefetch,
+                args=(
+                    range(self._page + 1, self._number_of_pages + 1),
+                    retrieve_page,
+                    self._pages,
+                    self._stop
+                ),
+                daemon=True
+            )
+            self._thread.start()
+            weakref.finalize(self, self._stop.set)
+
+        return
+
+    number_of_pages = Immutable(lambda s: s._number_of_pages)
+    page = Immutable(lambda s: s._page)
+
+    def __iter__(self) -> 'LedgerIterator':
+        return self
+
+    def __next__(self) -> Any:
+        while self._index >= len(self._rows):
+            if self._page >= self._number_of_pages or self._stop.is_set():
+                raise StopIteration
+            outcome = self._pages.get()
+            if isinstance(outcome, BaseException):
+                self.close()
+                raise outcome
+            self._rows = outcome.rows
+            self._page = outcome.page
+            self._index = 0
+        row = self._rows[self._index]
+        self._index += 1
+        return row
+
+    def __enter__(self) -> 'LedgerIterator':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        return
+
+    def close(self) -> None:
+        """Stop retrieving pages and end iteration"""
+        self._stop.set()
+        self._rows = list()
+        self._index = 0
+        while not self._pages.empty():
+            self._pages.get_nowait()
+        return
+
+    @classmethod
+    def _prefetch(
+        cls,
+        pages: range,
+        retrieve_page: Callable[[int], Any],
+        queue: Queue,
+        stop: Event
+    ) -> None:
+        """Retrieve remaining pages in order, handing each to the consumer"""
+        for page in pages:
+            if stop.is_set():
+                return
+            try:
+                outcome = retrieve_page(page)
+            except Exception as error:
+                outcome = error
+            if not cls._offer(outcome, queue, stop):
+                return
+            if isinstance(outcome, Exception):
+                return
+        return
+
+    @classmethod
+    def _offer(cls, outcome: Any, queue: Queue, stop: Event) -> bool:
+        """
+        Place a page or error in the queue, waiting for space while the
+        consumer has not closed the iterator. Return False if closed.
+        """
+        while not stop.is_set():
+            try:
+                queue.put(outcome, timeout=cls._PUT_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
@@ -0,0 +1,190 @@
+"""
+Amatino API Python Bindings
+Prometheus Exporter Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+from typing import List
+from typing import Optional
+from typing import Tuple
+from amatino.internal.histogram_collector import HistogramCollector
+from amatino.internal.immutable import Immutable
+from amatino.internal.instrumentation import Instrumentation
+
+
+class PrometheusExporter:
+    """
+    Formats the timings gathered by a HistogramCollector in the Prometheus
+    text exposition format, for serving to a scraper or writing to a file
+    read by a node exporter. For example:
+
+        exporter = PrometheusExporter(collector)
+        text = exporter.render()
+
+    Metrics are named with the supplied prefix, by default 'amatino':
+
+        <prefix>_request_phase_seconds     Histogram of time per phase
+        <prefix>_request_phase_bytes_total Payload bytes handled per phase
+        <prefix>_request_retries_total     Attempts that were retries
+        <prefix>_responses_total           Responses received, by status
+    """
+    _CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(
+        self,
+        collector: HistogramCollector,
+        prefix: str = 'amatino'
+    ) -> None:
+
+        if not isinstance(collector, HistogramCollector):
+            raise TypeError('collector must be of type `HistogramCollector`')
+
+        if not isinstance(prefix, str) or not prefix.isidentifier():
+            raise TypeError('prefix must be a valid metric name `str`')
+
+        self._collector = collector
+        self._prefix = prefix
+
+        return
+
+    collector = Immutable(lambda s: s._collector)
+    prefix = Immutable(lambda s: s._prefix)
+    content_type = Immutable(lambda s: s._CONTENT_TYPE)
+
+    def render(self) -> str:
+        """Return collected metrics as Prometheus exposition text"""
+        series = self._collector.series()
+        buckets = self._collector.buckets
+        lines = list()  # type: List[str]
+
+        name = self._prefix + '_request_phase_seconds'
+        lines += self._header(
+            name,
+            'histogram',
+            'Time spent in each phase of Amatino API requests'
+        )
+        for histogram in series:
+            labels = self._phase_labels(histogram)
+            cumulative = 0
+            for bound, count in zip(buckets, histogram.counts):
+                cumulative += count
+                lines.append(self._sample(
+                    name + '_bucket',
+                    labels + [('le', self._number(bound))],
+                    cumulative
+                ))
+            lines.append(self._sample(
+                name + '_bucket',
+                labels + [('le', '+Inf')],
+                histogram.count
+            ))
+            lines.append(self._sample(name + '_sum', labels, histogram.sum))
+            lines.append(self._sample(
+                name + '_count',
+                labels,
+                histogram.count
+            ))
+
+        name = self._prefix + '_request_phase_bytes_total'
+        lines += self._header(
+            name,
+            'counter',
+            'Payload bytes handled in each phase of Amatino API requests'
+        )
+        for histogram in series:
+            if histogram.phase == Instrumentation.SIGN:
+                continue
+            lines.append(self._sample(
+                name,
+                self._phase_labels(histogram),
+                histogram.bytes
+            ))
+
+        network = [s for s in series if s.phase == Instrumentation.NETWORK]
+
+        name = self._prefix + '_request_retries_total'
+        lines += self._header(
+            name,
+            'counter',
+            'Amatino API request attempts that were retries'
+        )
+        for histogram in network:
+            lines.append(self._sample(
+                name,
+                self._request_labels(histogram),
+                histogram.retries
+            ))
+
+        name = self._prefix + '_responses_total'
+        lines += self._header(
+            name,
+            'counter',
+            'Amatino API responses received, by status, or by `error` where '
+            'no response was received'
+        )
+        for histogram in network:
+            statuses = histogram.statuses
+            for status in sorted(statuses, key=lambda s: (s is None, s)):
+                label = 'error' if status is None else str(status)
+                lines.append(self._sample(
+                    name,
+                    self._request_labels(histogram) + [('status', label)],
+                    statuses[status]
+                ))
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _header(name: str, kind: str, description: str) -> List[str]:
+        return [
+            '# HELP {n} {d}'.format(n=name, d=description),
+            '# TYPE {n} {k}'.format(n=name, k=kind)
+        ]
+
+    @classmethod
+    def _phase_labels(
+        cls,
+        series: HistogramCollector.Series
+    ) -> List[Tuple[str, str]]:
+        return [('phase', series.phase)] + cls._request_labels(series)
+
+    @staticmethod
+    def _request_labels(
+        series: HistogramCollector.Series
+    ) -> List[Tuple[str, str]]:
+        return [
+            ('method', series.method or ''),
+            ('path', series.path or '')
+        ]
+
+    @classmethod
+    def _sample(
+        cls,
+        name: str,
+        labels: List[Tuple[str, str]],
+        value: float
+    ) -> str:
+        return '{n}{{{l}}} {v}'.format(
+            n=name,
+            l=','.join(
+                '{k}="{v}"'.format(k=k, v=cls._escape(v)) for k, v in labels
+            ),
+            v=cls._number(value)
+        )
+
+    @staticmethod
+    def _escape(value: Optional[str]) -> str:
+        if value is None:
+            return ''
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace(
+            '\n',
+            '\\n'
+        )
+
+    @staticmethod
+    def _number(value: float) -> str:
+        if isinstance(value, int):
+            return str(value)
+        return repr(float(value))
@@ -0,0 +1,157 @@
+"""
+Amatino API Python Bindings
+Rate Limiter Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import asyncio
+import time
+from threading import Lock
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+from amatino.internal.credentials import Credentials
+from amatino.internal.immutable import Immutable
+
+T = TypeVar('T', bound='RateLimiter')
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket limiting the rate at which requests are sent
+    to the Amatino API. The bucket holds up to burst tokens, and refills at
+    rate tokens per second. Each request consumes a token, waiting for one
+    if none is available.
+
+    Waiting requests reserve tokens in the order they arrive, such that
+    many threads or coroutines sharing a limiter are released evenly at
+    the permitted rate, rather than all at once.
+
+    By default one bucket is shared by all requests. If per_session is
+    True, requests made with each Session draw from a bucket of their own,
+    and requests made without a Session share another.
+
+    Requests are not limited until a limiter is installed via
+    RateLimiter.set_shared(). For example:
+
+        RateLimiter.set_shared(RateLimiter(rate=10, burst=20))
+    """
+    _shared = None
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        per_session: bool = False
+    ) -> None:
+
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise TypeError('rate must be a positive number')
+
+        if burst is None:
+            burst = max(int(rate), 1)
+
+        if not isinstance(burst, int) or burst < 1:
+            raise TypeError('burst must be a positive `int`')
+
+        if not isinstance(per_session, bool):
+            raise TypeError('per_session must be of type `bool`')
+
+        self._rate = float(rate)
+        self._burst = burst
+        self._per_session = per_session
+        self._lock = Lock()
+        self._buckets = dict()  # type: Dict[Hashable, List[float]]
+
+        return
+
+    rate = Immutable(lambda s: s._rate)
+    burst = Immutable(lambda s: s._burst)
+    per_session = Immutable(lambda s: s._per_session)
+
+    @classmethod
+    def shared(cls: Type[T]) -> Optional[T]:
+        """Return the installed limiter, or None if requests are unlimited"""
+        with cls._shared_lock:
+            return RateLimiter._shared
+
+    @classmethod
+    def set_shared(cls: Type[T], limiter: Optional[T]) -> None:
+        """Install a limiter, or remove limits by supplying None"""
+        if limiter is not None and not isinstance(limiter, RateLimiter):
+            raise TypeError('limiter must be of type `RateLimiter` or None')
+        with cls._shared_lock:
+            RateLimiter._shared = limiter
+        return
+
+    @classmethod
+    def limit(cls, credentials: Optional[Credentials] = None) -> None:
+        """Wait for the installed limiter, if any, to permit a request"""
+        limiter = cls.shared()
+        if limiter is not None:
+            limiter.acquire(credentials)
+        return
+
+    @classmethod
+    async def limit_async(
+        cls,
+        credentials: Optional[Credentials] = None
+    ) -> None:
+        """An awaitable equivalent of .limit()"""
+        limiter = cls.shared()
+        if limiter is not None:
+            await limiter.acquire_async(credentials)
+        return
+
+    def acquire(self, credentials: Optional[Credentials] = None) -> None:
+        """
+        Block until a request made with the supplied credentials may be sent
+        """
+        delay = self._reserve(credentials)
+        if delay > 0:
+            time.sleep(delay)
+        return
+
+    async def acquire_async(
+        self,
+        credentials: Optional[Credentials] = None
+    ) -> None:
+        """An awaitable equivalent of .acquire()"""
+        delay = self._reserve(credentials)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return
+
+    def _reserve(self, credentials: Optional[Credentials]) -> float:
+        """
+        Take a token from the appropriate bucket, returning the seconds to
+        wait before it becomes available. Tokens may be taken ahead of
+        their availability, leaving the bucket in debt.
+        """
+        key = None
+        if self._per_session and credentials is not None:
+            key = credentials.session_id
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(self._burst), now]
+                self._buckets[key] = bucket
+            tokens = min(
+                float(self._burst),
+                bucket[0] + (now - bucket[1]) * self._rate
+            )
+            tokens -= 1
+            bucket[0] = tokens
+            bucket[1] = now
+
+        if tokens >= 0:
+            return 0.0
+        return -tokens / self._rate
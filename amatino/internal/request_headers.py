@@ -7,8 +7,9 @@ This module is intended to be private, used indirectly
 by public classes, and should not be used directly.
 """
 from amatino.internal.data_package import DataPackage
-from amatino.internal.signature import Signature
 from amatino.internal.credentials import Credentials
+from amatino.internal.compression import Compression
+from typing import Optional
 
 
 class RequestHeaders:
@@ -23,23 +24,25 @@ class RequestHeaders:
         self,
         path: str,
         credentials: Credentials = None,
-        request_data: DataPackage = None
+        request_data: DataPackage = None,
+        content_encoding: Optional[str] = None
     ) -> None:
 
-        self._headers = {'User-Agent': self._AGENT}
+        self._headers = {
+            'User-Agent': self._AGENT,
+            'Accept-Encoding': Compression.ACCEPT_ENCODING
+        }
 
         if request_data is not None:
             self._headers['content-type'] = 'application/json'
 
+        if content_encoding is not None:
+            self._headers['Content-Encoding'] = content_encoding
+
         if credentials is None:
             return
 
-        signature = Signature(
-            api_key=credentials.api_key,
-            path=path
-        )
-
-        self._headers['X-Signature'] = signature.string
+        self._headers['X-Signature'] = credentials.signer().sign(path)
         self._headers['X-Session-ID'] = credentials.session_id
 
         return
@@ -0,0 +1,231 @@
+"""
+Amatino API Python Bindings
+Response Cache Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+from datetime import timezone
+from hashlib import sha256
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+from amatino.entity import Entity
+from amatino.internal.data_package import DataPackage
+from amatino.internal.immutable import Immutable
+
+T = TypeVar('T', bound='ResponseCache')
+
+
+class ResponseCache:
+    """
+    An opt-in cache of Amatino API responses describing derived views of an
+    Entity, i.e. Trees, Positions, Performances, Balances, and Recursive
+    Balances. Caching is disabled until a cache is installed via
+    ResponseCache.set_shared(). For example:
+
+        ResponseCache.set_shared(ResponseCache(directory='/tmp/amatino'))
+
+    Only views of settled periods are cached: those whose balance time, or
+    end time, is in the past. Responses are keyed by Entity, view, and
+    retrieval arguments, and by the User retrieving them, as Users may hold
+    differing permissions on the same Entity. Up to max_entries responses
+    are held in memory, least recently used responses being discarded first.
+    If a directory is supplied, responses are also written there, and
+    survive the process.
+
+    All responses cached for an Entity are discarded when this process
+    creates, updates, or deletes a Transaction or Account in that Entity.
+    Changes made by other processes are not detected. Discard them via
+    .discard() where that matters.
+    """
+    _DEFAULT_MAX_ENTRIES = 256
+    _SUFFIX = '.json'
+
+    _shared = None
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        directory: Optional[str] = None
+    ) -> None:
+
+        if not isinstance(max_entries, int) or max_entries < 0:
+            raise TypeError('max_entries must be a non-negative `int`')
+
+        if directory is not None and not isinstance(directory, str):
+            raise TypeError('directory must be of type `str` or None')
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self._max_entries = max_entries
+        self._directory = directory
+        self._lock = Lock()
+        self._entries = OrderedDict()  # type: OrderedDict[str, Any]
+
+        return
+
+    max_entries = Immutable(lambda s: s._max_entries)
+    directory = Immutable(lambda s: s._directory)
+    entries = Immutable(lambda s: len(s._entries))
+
+    @classmethod
+    def shared(cls: Type[T]) -> Optional[T]:
+        """Return the installed cache, or None if caching is disabled"""
+        with cls._shared_lock:
+            return ResponseCache._shared
+
+    @classmethod
+    def set_shared(cls: Type[T], cache: Optional[T]) -> None:
+        """Install a cache, or disable caching by supplying None"""
+        if cache is not None and not isinstance(cache, ResponseCache):
+            raise TypeError('cache must be of type `ResponseCache` or None')
+        with cls._shared_lock:
+            ResponseCache._shared = cache
+        return
+
+    @classmethod
+    def fetch(
+        cls,
+        entity: Entity,
+        path: str,
+        data: DataPackage,
+        as_of: Optional[datetime],
+        retrieve: Callable[[], Any]
+    ) -> Any:
+        """
+        Return response data for a view of an Entity at time `as_of`, from
+        the installed cache if possible, otherwise by calling `retrieve`
+        """
+        cache = cls.shared()
+        if cache is None or not cls.settled(as_of):
+            return retrieve()
+
+        key = cache.key(entity, path, data)
+        response_data = cache.lookup(entity, key)
+        if response_data is not None:
+            return response_data
+
+        response_data = retrieve()
+        cache.store(entity, key, response_data)
+        return response_data
+
+    @classmethod
+    def entity_changed(cls, entity: Entity) -> None:
+        """
+        Discard responses describing an Entity from the installed cache, if
+        there is one
+        """
+        cache = cls.shared()
+        if cache is not None:
+            cache.discard(entity)
+        return
+
+    @staticmethod
+    def settled(as_of: Optional[datetime]) -> bool:
+        """Return True if a view as of the supplied time may be cached"""
+        if as_of is None:
+            return False
+        if as_of.tzinfo is None:
+            as_of = as_of.replace(tzinfo=timezone.utc)
+        return as_of < datetime.now(timezone.utc)
+
+    @staticmethod
+    def key(entity: Entity, path: str, data: DataPackage) -> str:
+        """Return a key identifying a view of an Entity, as seen by a User"""
+        digest = sha256()
+        digest.update(str(entity.session.user_id).encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(path.encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(data.as_json_bytes())
+        return digest.hexdigest()
+
+    def lookup(self, entity: Entity, key: str) -> Optional[Any]:
+        """Return cached response data, or None if there is none"""
+        with self._lock:
+            memory_key = entity.id_ + '/' + key
+            if memory_key in self._entries:
+                self._entries.move_to_end(memory_key)
+                return self._entries[memory_key]
+
+        if self._directory is None:
+            return None
+
+        try:
+            with open(self._file(entity, key), 'r') as file:
+                response_data = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        self._remember(entity.id_ + '/' + key, response_data)
+        return response_data
+
+    def store(self, entity: Entity, key: str, response_data: Any) -> None:
+        """Cache response data describing an Entity"""
+        self._remember(entity.id_ + '/' + key, response_data)
+
+        if self._directory is None:
+            return
+
+        os.makedirs(self._entity_directory(entity), exist_ok=True)
+        path = self._file(entity, key)
+        temporary = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temporary, 'w') as file:
+            json.dump(response_data, file)
+        os.replace(temporary, path)
+        return
+
+    def discard(self, entity: Entity) -> None:
+        """Discard all cached responses describing an Entity"""
+        prefix = entity.id_ + '/'
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+        if self._directory is None:
+            return
+
+        directory = self._entity_directory(entity)
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(self._SUFFIX):
+                continue
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                continue
+        return
+
+    def clear(self) -> None:
+        """Discard all responses cached in memory"""
+        with self._lock:
+            self._entries = OrderedDict()
+        return
+
+    def _remember(self, memory_key: str, response_data: Any) -> None:
+        with self._lock:
+            self._entries[memory_key] = response_data
+            self._entries.move_to_end(memory_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return
+
+    def _entity_directory(self, entity: Entity) -> str:
+        return os.path.join(self._directory, entity.id_)
+
+    def _file(self, entity: Entity, key: str) -> str:
+        return os.path.join(self._entity_directory(entity), key + self._SUFFIX)
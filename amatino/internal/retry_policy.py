@@ -0,0 +1,251 @@
+"""
+Amatino API Python Bindings
+Retry Policy Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import asyncio
+import random
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from http.client import HTTPException
+from threading import Lock
+from urllib.error import HTTPError
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+from amatino.internal.http_method import HTTPMethod
+from amatino.internal.immutable import Immutable
+
+T = TypeVar('T', bound='RetryPolicy')
+
+
+class RetryPolicy:
+    """
+    Governs the retrying of Amatino API requests that fail transiently, i.e.
+    with HTTP status 429, 500, 502, 503, or 504, or with a connection error
+    or timeout.
+
+    Each request is attempted at most 1 + max_retries times. Between
+    attempts, the policy waits for a random period of up to
+    base_delay * 2 ** retry seconds, no more than max_delay, unless the
+    response carries a Retry-After header, which is honoured instead.
+    Retrying stops once max_elapsed seconds have passed since the first
+    attempt.
+
+    Across all requests, at most budget retries are made in any sixty
+    second window, such that a struggling API is not met with a storm of
+    retries.
+
+    Only idempotent methods (GET, PUT, DELETE) are retried, unless
+    retry_all_methods is True. Retrying a POST that failed after reaching
+    the API may create duplicate objects. Requests of any method refused
+    with status 429 are retried, as they were not processed.
+
+    A single shared policy governs all requests, unless it is replaced via
+    RetryPolicy.set_shared(). Install RetryPolicy(max_retries=0) to disable
+    retries.
+    """
+    RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = (HTTPMethod.GET, HTTPMethod.PUT, HTTPMethod.DELETE)
+    _CONNECTION_ERRORS = (
+        OSError,
+        HTTPException,
+        asyncio.TimeoutError,
+        asyncio.IncompleteReadError
+    )
+    _WINDOW = 60.0
+
+    _shared = None
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_elapsed: float = 120.0,
+        budget: int = 100,
+        retry_all_methods: bool = False
+    ) -> None:
+
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise TypeError('max_retries must be a non-negative `int`')
+
+        for name, value in (
+                ('base_delay', base_delay),
+                ('max_delay', max_delay),
+                ('max_elapsed', max_elapsed)
+        ):
+            if not isinstance(value, (int, float)) or value < 0:
+                raise TypeError(name + ' must be a non-negative number')
+
+        if not isinstance(budget, int) or budget < 0:
+            raise TypeError('budget must be a non-negative `int`')
+
+        if not isinstance(retry_all_methods, bool):
+            raise TypeError('retry_all_methods must be of type `bool`')
+
+        self._max_retries = max_retries
+        self._base_delay = float(base_delay)
+        self._max_delay = float(max_delay)
+        self._max_elapsed = float(max_elapsed)
+        self._budget = budget
+        self._retry_all_methods = retry_all_methods
+
+        self._lock = Lock()
+        self._retry_times = deque()  # type: Deque[float]
+
+        return
+
+    max_retries = Immutable(lambda s: s._max_retries)
+    base_delay = Immutable(lambda s: s._base_delay)
+    max_delay = Immutable(lambda s: s._max_delay)
+    max_elapsed = Immutable(lambda s: s._max_elapsed)
+    budget = Immutable(lambda s: s._budget)
+    retry_all_methods = Immutable(lambda s: s._retry_all_methods)
+
+    @classmethod
+    def shared(cls: Type[T]) -> T:
+        """Return the policy governing all Amatino API requests"""
+        with cls._shared_lock:
+            if RetryPolicy._shared is None:
+                RetryPolicy._shared = cls()
+            return RetryPolicy._shared
+
+    @classmethod
+    def set_shared(cls: Type[T], policy: T) -> None:
+        """Replace the policy governing all Amatino API requests"""
+        if not isinstance(policy, RetryPolicy):
+            raise TypeError('policy must be of type `RetryPolicy`')
+        with cls._shared_lock:
+            RetryPolicy._shared = policy
+        return
+
+    def perform(
+        self,
+        method: HTTPMethod,
+        attempt: Callable[[float], Any]
+    ) -> Any:
+        """
+        Return the outcome of a request, retrying it as this policy allows.
+        The attempt callable receives the number of seconds remaining before
+        max_elapsed, which it may use to bound its timeout.
+        """
+        start = time.monotonic()
+        retry = 0
+        while True:
+            try:
+                return attempt(self._remaining(start))
+            except Exception as error:
+                delay = self._delay(method, error, retry, start)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            retry += 1
+
+    async def perform_async(
+        self,
+        method: HTTPMethod,
+        attempt: Callable[[float], Awaitable[Any]]
+    ) -> Any:
+        """An awaitable equivalent of .perform()"""
+        start = time.monotonic()
+        retry = 0
+        while True:
+            try:
+                return await attempt(self._remaining(start))
+            except Exception as error:
+                delay = self._delay(method, error, retry, start)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            retry += 1
+
+    def _remaining(self, start: float) -> float:
+        """Return the seconds remaining before max_elapsed"""
+        return max(self._max_elapsed - (time.monotonic() - start), 0.0)
+
+    def _delay(
+        self,
+        method: HTTPMethod,
+        error: Exception,
+        retry: int,
+        start: float
+    ) -> Optional[float]:
+        """
+        Return the seconds to wait before retrying a failed request, or None
+        if it should not be retried
+        """
+        if retry >= self._max_retries:
+            return None
+
+        throttled = isinstance(error, HTTPError) and error.code == 429
+        if not (self._retry_all_methods or throttled) and (
+                method not in self.IDEMPOTENT_METHODS
+        ):
+            return None
+
+        retry_after = None
+        if isinstance(error, HTTPError):
+            if error.code not in self.RETRYABLE_STATUSES:
+                return None
+            retry_after = self._retry_after(error)
+        elif not isinstance(error, self._CONNECTION_ERRORS):
+            return None
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            ceiling = min(self._max_delay, self._base_delay * 2 ** retry)
+            delay = random.uniform(0, ceiling)
+
+        if delay > self._remaining(start):
+            return None
+
+        if not self._spend_budget():
+            return None
+
+        return delay
+
+    def _spend_budget(self) -> bool:
+        """Record a retry if the shared budget allows one"""
+        now = time.monotonic()
+        with self._lock:
+            while (
+                    len(self._retry_times) > 0
+                    and now - self._retry_times[0] > self._WINDOW
+            ):
+                self._retry_times.popleft()
+            if len(self._retry_times) >= self._budget:
+                return False
+            self._retry_times.append(now)
+        return True
+
+    @staticmethod
+    def _retry_after(error: HTTPError) -> Optional[float]:
+        """
+        Return the seconds a response asked us to wait via its Retry-After
+        header, or None if it did not
+        """
+        if error.headers is None:
+            return None
+        value = error.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(when.timestamp() - time.time(), 0.0)
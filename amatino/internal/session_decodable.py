@@ -5,6 +5,7 @@ author: hugh@blinkybeach.com
 """
 from typing import Any, Optional, TypeVar, Type, List
 from amatino.session import Session
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='SessionDecodable')
 
@@ -29,6 +30,7 @@ class SessionDecodable:
         return cls.decode(data, session)
 
     @classmethod
+    @Instrumentation.decoder
     def decode_many(cls: Type[T], data: Any, session: Session) -> List[T]:
         """Return list of decoded instances of an object"""
         return [cls.decode(d, session) for d in data]
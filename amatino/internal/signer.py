@@ -0,0 +1,69 @@
+"""
+Amatino API Python Bindings
+Signer Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly by public classes, and
+should not be used directly.
+"""
+from hashlib import sha512
+from base64 import b64encode
+from typing import Dict
+from typing import Tuple
+from amatino.internal.immutable import Immutable
+import hmac
+import time
+
+
+class Signer:
+    """
+    Private - Not intended to be used directly.
+
+    Computes HMAC request signatures with a single API key. The key is
+    absorbed into an HMAC state once, and that state is copied for each
+    signature, rather than rebuilt from the key.
+
+    A signature covers the current timestamp, in whole seconds, and the
+    request path. Signatures are therefore memoised per path until the
+    second changes, such that bursts of requests to the same path compute
+    the digest once.
+    """
+    _MEMO_SIZE = 256
+
+    def __init__(self, api_key: str) -> None:
+
+        assert isinstance(api_key, str)
+
+        self._api_key = api_key
+        self._state = hmac.new(api_key.encode('utf-8'), digestmod=sha512)
+        self._memo = (-1, dict())  # type: Tuple[int, Dict[str, str]]
+
+        return
+
+    api_key = Immutable(lambda s: s._api_key)
+
+    def sign(self, path: str) -> str:
+        """Return a signature authorising a request to path, sent now"""
+        assert isinstance(path, str)
+
+        second = int(time.time())
+
+        # The memo is replaced, never cleared, when the second changes, so
+        # that threads holding the previous memo cannot pollute the next.
+        memo = self._memo
+        if memo[0] != second:
+            memo = (second, dict())
+            self._memo = memo
+
+        signature = memo[1].get(path)
+        if signature is not None:
+            return signature
+
+        state = self._state.copy()
+        state.update((str(second) + path).encode('utf-8'))
+        signature = b64encode(state.digest()).decode()
+
+        if len(memo[1]) < self._MEMO_SIZE:
+            memo[1][path] = signature
+
+        return signature
@@ -0,0 +1,74 @@
+"""
+Amatino API Python Bindings
+Single Flight Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+from threading import Event
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from amatino.internal.immutable import Immutable
+
+
+class SingleFlight:
+    """
+    Private - Not intended to be used directly.
+
+    Coalesces concurrent identical operations. While an operation identified
+    by some key is in flight, other threads requesting an operation with the
+    same key wait for it to finish and share its outcome, rather than
+    performing their own. Outcomes are not retained once the operation
+    finishes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls = dict()  # type: Dict[Hashable, SingleFlight._Call]
+        return
+
+    in_flight = Immutable(lambda s: len(s._calls))
+
+    def do(self, key: Hashable, operation: Callable[[], Any]) -> Any:
+        """
+        Return the outcome of an operation, performing it only if no
+        operation with the same key is already in flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = SingleFlight._Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = operation()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    class _Call:
+        """An operation in flight, and its eventual outcome"""
+        __slots__ = ('done', 'result', 'error')
+
+        def __init__(self) -> None:
+            self.done = Event()
+            self.result = None
+            self.error = None
+            return
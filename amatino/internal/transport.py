@@ -0,0 +1,153 @@
+"""
+Amatino API Python Bindings
+Transport Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import asyncio
+from email.message import Message
+from threading import Lock
+from typing import Dict
+from typing import Optional
+from typing import Type
+from typing import TypeVar
+from amatino.internal.immutable import Immutable
+
+T = TypeVar('T', bound='Transport')
+
+
+class Transport:
+    """
+    The means by which requests reach the Amatino API. By default, requests
+    are sent over HTTP via the shared ConnectionPool. An alternative, such
+    as an InProcessServer, may be installed via Transport.set_shared(). For
+    example:
+
+        Transport.set_shared(InProcessServer())
+
+    Concrete transports implement .open(), and may override .open_async().
+    A transport may also define an endpoint, the base url to which requests
+    are addressed. Where it does not, requests are addressed to the Amatino
+    API, or to a local debug server if requested.
+    """
+    endpoint = None  # type: Optional[str]
+
+    _shared = None
+    _shared_lock = Lock()
+
+    @classmethod
+    def shared(cls) -> 'Transport':
+        """Return the transport carrying all Amatino API requests"""
+        installed = cls.installed()
+        if installed is not None:
+            return installed
+        from amatino.internal.connection_pool import ConnectionPool
+        return ConnectionPool.shared()
+
+    @classmethod
+    def installed(cls) -> Optional['Transport']:
+        """
+        Return the transport installed via .set_shared(), or None if requests
+        are carried by the default ConnectionPool
+        """
+        with cls._shared_lock:
+            return Transport._shared
+
+    @classmethod
+    def set_shared(cls: Type[T], transport: Optional[T]) -> None:
+        """
+        Install a transport carrying all Amatino API requests, or restore the
+        default ConnectionPool by supplying None
+        """
+        if transport is not None and not isinstance(transport, Transport):
+            raise TypeError('transport must be of type `Transport` or None')
+        with cls._shared_lock:
+            Transport._shared = transport
+        return
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> 'Transport.Response':
+        """
+        Send a request and return its response, whose body may not yet have
+        been read
+        """
+        raise NotImplementedError
+
+    async def open_async(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> 'Transport.Response':
+        """
+        Send a request without blocking the running event loop, and return
+        its response, whose body has been read in full. By default, .open()
+        is called in the loop's default executor.
+        """
+        def perform() -> Transport.Response:
+            response = self.open(method, url, body, headers, timeout)
+            return Transport.Response(
+                response.status,
+                response.reason,
+                response.headers,
+                response.read()
+            )
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, perform)
+
+    class Response:
+        """
+        A response to a request carried by a Transport. This base class holds
+        a body already received in full.
+        """
+
+        def __init__(
+            self,
+            status: int,
+            reason: str,
+            headers: Message,
+            body: bytes
+        ) -> None:
+
+            self._status = status
+            self._reason = reason
+            self._headers = headers
+            self._body = body
+            self._position = 0
+
+            return
+
+        status = Immutable(lambda s: s._status)
+        reason = Immutable(lambda s: s._reason)
+        headers = Immutable(lambda s: s._headers)
+
+        def read(self) -> bytes:
+            """Return the remainder of the response body"""
+            body = self._body[self._position:]
+            self._position = len(self._body)
+            return body
+
+        def read_chunk(self, size: int) -> bytes:
+            """
+            Return up to `size` bytes of the response body. An empty bytes
+            object indicates that the body has been read in full.
+            """
+            chunk = self._body[self._position:self._position + size]
+            self._position += len(chunk)
+            return chunk
+
+        def close(self) -> None:
+            """Abandon this response"""
+            self._position = len(self._body)
+            return
@@ -0,0 +1,193 @@
+"""
+Amatino API Python Bindings
+Unit Cache Module
+Author: hugh@amatino.io
+
+This module is intended to be private, used indirectly
+by public classes, and should not be used directly.
+"""
+import time
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from amatino.entity import Entity
+from amatino.denomination import Denomination
+from amatino.global_unit import GlobalUnit
+from amatino.global_unit import GlobalUnitConstants
+from amatino.custom_unit import CustomUnit
+from amatino.internal.immutable import Immutable
+
+T = TypeVar('T', bound='UnitCache')
+CustomKey = Tuple[Any, str, int]
+CachedCustomUnit = Tuple[float, CustomUnit]
+
+
+class UnitCache:
+    """
+    A thread-safe, process-wide cache of the Global Units and Custom Units
+    denominating Amatino objects, such that each unit is retrieved from the
+    Amatino API at most once.
+
+    Global Units cannot be modified, and so are cached indefinitely. The
+    cache is seeded with the Global Units in GlobalUnitConstants. Custom
+    Units may be modified by their owners, and so are cached per Entity for
+    at most custom_unit_ttl seconds. They are also scoped by the Session that
+    retrieved them, such that a Session is only ever returned Custom Units
+    bound to its own credentials.
+
+    A single shared cache is used by all Amatino objects, unless it is
+    replaced via UnitCache.set_shared().
+    """
+    _DEFAULT_CUSTOM_UNIT_TTL = 300.0
+
+    _shared = None
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        custom_unit_ttl: float = _DEFAULT_CUSTOM_UNIT_TTL
+    ) -> None:
+
+        if (
+                not isinstance(custom_unit_ttl, (int, float))
+                or custom_unit_ttl < 0
+        ):
+            raise TypeError('custom_unit_ttl must be a non-negative number')
+
+        self._custom_unit_ttl = float(custom_unit_ttl)
+        self._lock = Lock()
+        self._global_units = {
+            u.id_: u for u in GlobalUnitConstants.PRIORITY_1_UNITS
+        }  # type: Dict[int, GlobalUnit]
+        self._custom_units = dict()  # type: Dict[CustomKey, CachedCustomUnit]
+
+        return
+
+    custom_unit_ttl = Immutable(lambda s: s._custom_unit_ttl)
+
+    @classmethod
+    def shared(cls: Type[T]) -> T:
+        """Return the cache used by default by all Amatino objects"""
+        with cls._shared_lock:
+            if UnitCache._shared is None:
+                UnitCache._shared = cls()
+            return UnitCache._shared
+
+    @classmethod
+    def set_shared(cls: Type[T], cache: T) -> None:
+        """Replace the cache used by default by all Amatino objects"""
+        if not isinstance(cache, UnitCache):
+            raise TypeError('cache must be of type `UnitCache`')
+        with cls._shared_lock:
+            UnitCache._shared = cache
+        return
+
+    def denomination(
+        self,
+        entity: Entity,
+        global_unit_id: Optional[int],
+        custom_unit_id: Optional[int]
+    ) -> Denomination:
+        """
+        Return the unit identified by either global_unit_id or
+        custom_unit_id, retrieving it from the Amatino API if it is not
+        cached.
+        """
+        unit = self.lookup(entity, global_unit_id, custom_unit_id)
+        if unit is not None:
+            return unit
+
+        if global_unit_id is not None:
+            unit = GlobalUnit.retrieve(entity.session, global_unit_id)
+        else:
+            unit = CustomUnit.retrieve(entity, custom_unit_id)
+
+        self.store(entity, unit)
+        return unit
+
+    def lookup(
+        self,
+        entity: Entity,
+        global_unit_id: Optional[int],
+        custom_unit_id: Optional[int]
+    ) -> Optional[Denomination]:
+        """
+        Return the unit identified by either global_unit_id or
+        custom_unit_id if it is cached, or None if it is not.
+        """
+        if global_unit_id is not None and custom_unit_id is not None:
+            raise AssertionError('Both global & custom units supplied!')
+
+        if global_unit_id is not None:
+            if not isinstance(global_unit_id, int):
+                raise TypeError('global_unit_id must be of type `int`')
+            with self._lock:
+                return self._global_units.get(global_unit_id)
+
+        if not isinstance(custom_unit_id, int):
+            raise TypeError('custom_unit_id must be of type `int`')
+
+        key = self._key(entity, custom_unit_id)
+        with self._lock:
+            cached = self._custom_units.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] > self._custom_unit_ttl:
+                del self._custom_units[key]
+                return None
+            return cached[1]
+
+    def store(self, entity: Entity, unit: Denomination) -> None:
+        """Cache a unit denominating objects in the supplied Entity"""
+        if isinstance(unit, GlobalUnit):
+            with self._lock:
+                self._global_units[unit.id_] = unit
+            return
+
+        if not isinstance(unit, CustomUnit):
+            raise TypeError(
+                'unit must be of type `GlobalUnit` or `CustomUnit`'
+            )
+
+        with self._lock:
+            self._custom_units[self._key(entity, unit.id_)] = (
+                time.monotonic(),
+                unit
+            )
+        return
+
+    def invalidate(
+        self,
+        entity: Entity,
+        custom_unit_id: Optional[int] = None
+    ) -> None:
+        """
+        Discard a cached Custom Unit belonging to the supplied Entity, or all
+        of that Entity's cached Custom Units if custom_unit_id is None, as
+        cached for every Session
+        """
+        with self._lock:
+            for key in [
+                k for k in self._custom_units
+                if k[1] == entity.id_
+                and (custom_unit_id is None or k[2] == custom_unit_id)
+            ]:
+                del self._custom_units[key]
+        return
+
+    def clear(self) -> None:
+        """Discard all cached Custom Units and retrieved Global Units"""
+        with self._lock:
+            self._global_units = {
+                u.id_: u for u in GlobalUnitConstants.PRIORITY_1_UNITS
+            }
+            self._custom_units = dict()
+        return
+
+    @staticmethod
+    def _key(entity: Entity, custom_unit_id: int) -> CustomKey:
+        return (entity.session.session_id, entity.id_, custom_unit_id)
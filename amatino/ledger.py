@@ -13,6 +13,7 @@ from amatino.session import Session
 from amatino.entity import Entity
 from amatino.internal.immutable import Immutable
 from amatino.account import Account
+from amatino.internal.account_cache import AccountCache
 from amatino.internal.encodable import Encodable
 from amatino.internal.api_request import ApiRequest
 from amatino.internal.url_parameters import UrlParameters
@@ -21,15 +22,20 @@ from amatino.unexpected_response_type import UnexpectedResponseType
 from amatino.missing_key import MissingKey
 from amatino.internal.http_method import HTTPMethod
 from amatino.internal.data_package import DataPackage
-from amatino.internal.am_amount import AmatinoAmount
+from amatino.internal.ledger_iterator import LedgerIterator
+from amatino.internal.lazy_ledger_row import LazyLedgerRow
+from amatino.internal.json_stream import JsonStream
 from typing import Optional
 from typing import TypeVar
 from typing import Type
 from typing import Dict
 from typing import Any
 from typing import List
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
 from collections.abc import Sequence
 from amatino.denominated import Denominated
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Ledger')
 
@@ -86,9 +92,7 @@ class Ledger(Sequence, Denominated):
     session = Immutable(lambda s: s._entity.session)
     entity = Immutable(lambda s: s._entity)
     account_id = Immutable(lambda s: s._account_id)
-    account = Immutable(
-        lambda s: Account.retrieve(s.session, s.entity, s.account_id)
-    )
+    account = Immutable(lambda s: Account.lookup(s.entity, s.account_id))
     start_time = Immutable(lambda s: s._start_time.raw)
     end_time = Immutable(lambda s: s._end_time.raw)
     recursive = Immutable(lambda s: s._recursive)
@@ -141,6 +145,203 @@ class Ledger(Sequence, Denominated):
         return cls._decode(entity, request.response_data)
 
     @classmethod
+    def stream(
+        cls: Type[T],
+        entity: Entity,
+        account: Account,
+        order: LedgerOrder = LedgerOrder.YOUNGEST_FIRST,
+        page: int = 1,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        denomination: Optional[Denomination] = None
+    ) -> JsonStream:
+        """
+        Return an iterator over the LedgerRows of one page of the Ledger for
+        the supplied account, each decoded as it arrives from the Amatino
+        API rather than once the whole page has been received. Memory use is
+        bounded whatever the size of the page. The remaining Ledger
+        attributes, e.g. `number_of_pages`, are available as raw data in the
+        iterator's .fields once iteration has finished. Close the iterator
+        to abandon the page early.
+        """
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        arguments = Ledger.RetrieveArguments(
+            account,
+            order,
+            page,
+            start_time,
+            end_time,
+            denomination
+        )
+        data = DataPackage(object_data=arguments, override_listing=True)
+
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        chunks = ApiRequest.stream(
+            path=cls._PATH,
+            method=HTTPMethod.GET,
+            credentials=entity.session,
+            data=data,
+            url_parameters=parameters
+        )
+
+        return JsonStream(chunks, 'ledger_rows', cls._decode_row)
+
+    @classmethod
+    def iterate(
+        cls: Type[T],
+        entity: Entity,
+        account: Account,
+        order: LedgerOrder = LedgerOrder.YOUNGEST_FIRST,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        denomination: Optional[Denomination] = None,
+        window: int = 2
+    ) -> LedgerIterator:
+        """
+        Return an iterator over every LedgerRow in the Ledger for the supplied
+        account, across all pages. The first page is retrieved immediately.
+        Subsequent pages are retrieved in the background while earlier pages
+        are consumed, with at most `window` pages waiting in memory.
+        """
+        if denomination is None:
+            denomination = account.denomination
+
+        first_page = cls.retrieve(
+            entity,
+            account,
+            order,
+            1,
+            start_time,
+            end_time,
+            denomination
+        )
+
+        retrieve_page = cls._page_retriever(
+            entity,
+            account,
+            first_page,
+            denomination
+        )
+
+        return LedgerIterator(first_page, retrieve_page, window)
+
+    @classmethod
+    def retrieve_all(
+        cls: Type[T],
+        entity: Entity,
+        account: Account,
+        order: LedgerOrder = LedgerOrder.YOUNGEST_FIRST,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        denomination: Optional[Denomination] = None,
+        max_workers: int = 4
+    ) -> T:
+        """
+        Retrieve every page of the Ledger for the supplied account, returning
+        a single Ledger containing all rows. Once the first page reveals the
+        number of pages, the remaining pages are retrieved concurrently by up
+        to `max_workers` threads. Rows are returned in the supplied order.
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise TypeError('max_workers must be a positive `int`')
+
+        if denomination is None:
+            denomination = account.denomination
+
+        first_page = cls.retrieve(
+            entity,
+            account,
+            order,
+            1,
+            start_time,
+            end_time,
+            denomination
+        )
+
+        if first_page.number_of_pages <= 1:
+            return first_page
+
+        retrieve_page = cls._page_retriever(
+            entity,
+            account,
+            first_page,
+            denomination
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = executor.map(
+                retrieve_page,
+                range(2, first_page.number_of_pages + 1)
+            )
+            rows = cls._concatenate_rows(
+                [first_page.rows] + [page.rows for page in pages]
+            )
+
+        ledger = cls(
+            entity=entity,
+            account_id=first_page.account_id,
+            start_time=first_page._start_time,
+            end_time=first_page._end_time,
+            recursive=first_page.recursive,
+            generated_time=first_page._generated_time,
+            global_unit_id=first_page.global_unit_id,
+            custom_unit_id=first_page.custom_unit_id,
+            page=1,
+            number_of_pages=1,
+            order=first_page.order,
+            ledger_rows=rows
+        )
+
+        return ledger
+
+    @classmethod
+    def _page_retriever(
+        cls: Type[T],
+        entity: Entity,
+        account: Account,
+        first_page: T,
+        denomination: Denomination
+    ) -> Callable[[int], T]:
+        """
+        Return a function retrieving pages of the Ledger described by the
+        supplied first page. Pages are retrieved for the start and end times
+        of the first page, such that Transactions created in the meantime do
+        not shift rows between pages.
+        """
+        def retrieve_page(page: int) -> T:
+            return cls.retrieve(
+                entity,
+                account,
+                first_page.order,
+                page,
+                first_page.start_time,
+                first_page.end_time,
+                denomination
+            )
+
+        return retrieve_page
+
+    def opposing_accounts(self) -> List[Account]:
+        """
+        Return the distinct Accounts opposing rows in this Ledger, retrieving
+        those not already cached in as few requests as possible. Thereafter,
+        LedgerRow.opposing_account() will not require a request.
+        """
+        ids = list(dict.fromkeys(
+            [r.opposing_account_id for r in self._rows]
+        ))
+        if None in ids:
+            ids.remove(None)
+        missing = AccountCache.shared().missing(self.entity, ids)
+        if len(missing) > 0:
+            Account.retrieve_many(self.entity, missing)
+        return [Account.lookup(self.entity, i) for i in ids]
+
+    @classmethod
+    @Instrumentation.decoder
     def _decode(
         cls: Type[T],
         entity: Entity,
@@ -160,7 +361,7 @@ class Ledger(Sequence, Denominated):
                 generated_time=AmatinoTime.decode(data['generated_time']),
                 global_unit_id=data['global_unit_denomination'],
                 custom_unit_id=data['custom_unit_denomination'],
-                ledger_rows=Ledger._decode_rows(data['ledger_rows']),
+                ledger_rows=cls._decode_rows(data['ledger_rows']),
                 page=data['page'],
                 number_of_pages=data['number_of_pages'],
                 order=LedgerOrder(data['ordered_oldest_first'])
@@ -172,29 +373,30 @@ class Ledger(Sequence, Denominated):
 
     @classmethod
     def _decode_rows(cls: Type[T], rows: List[Any]) -> List[LedgerRow]:
-        """Return LedgerRows decoded from raw API response data"""
+        """
+        Return LedgerRows decoded from raw API response data. Row fields are
+        decoded lazily, on first access.
+        """
         if not isinstance(rows, list):
             raise UnexpectedResponseType(rows, list)
 
-        def decode(data) -> LedgerRow:
-
-            if not isinstance(data, list):
-                raise UnexpectedResponseType(data, list)
+        return [cls._decode_row(r) for r in rows]
 
-            row = LedgerRow(
-                transaction_id=data[0],
-                transaction_time=AmatinoTime.decode(data[1]),
-                description=data[2],
-                opposing_account_id=data[3],
-                opposing_account_name=data[4],
-                debit=AmatinoAmount.decode(data[5]),
-                credit=AmatinoAmount.decode(data[6]),
-                balance=AmatinoAmount.decode(data[7])
-            )
+    @staticmethod
+    def _decode_row(data: Any) -> LedgerRow:
+        """Return a LedgerRow whose fields are decoded on first access"""
+        if not isinstance(data, list):
+            raise UnexpectedResponseType(data, list)
 
-            return row
+        return LazyLedgerRow(data)
 
-        return [decode(r) for r in rows]
+    @classmethod
+    def _concatenate_rows(cls: Type[T], parts: List[Any]) -> List[LedgerRow]:
+        """Return the rows of several Ledger pages joined in order"""
+        rows = list()
+        for part in parts:
+            rows.extend(part)
+        return rows
 
     class RetrieveArguments(Encodable):
         def __init__(
@@ -252,11 +454,11 @@ class Ledger(Sequence, Denominated):
 
             start_time = None
             if self._start_time:
-                start_time = AmatinoTime(self._start_time).serialise()
+                start_time = self._start_time.serialise()
 
             end_time = None
             if self._end_time:
-                end_time = AmatinoTime(self._end_time).serialise()
+                end_time = self._end_time.serialise()
 
             data = {
                 'account_id': self._account.id_,
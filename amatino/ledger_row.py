@@ -24,6 +24,16 @@ class LedgerRow:
     own. They are only ever delivered under the ledger_rows key as part of a
     Ledger or Recursive Ledger object.
     """
+    __slots__ = (
+        '_transaction_id',
+        '_transaction_time',
+        '_description',
+        '_opposing_account_id',
+        '_opposing_account_name',
+        '_debit',
+        '_credit',
+        '_balance'
+    )
 
     def __init__(
         self,
@@ -65,7 +75,7 @@ class LedgerRow:
         """Return the account opposing this transaction, or, if many, None"""
         if self.opposing_account_id is None:
             return None
-        return Account.retrieve(session, entity, self.opposing_account_id)
+        return Account.lookup(entity, self.opposing_account_id)
 
     def retrieve_transaction(
         self,
@@ -0,0 +1,109 @@
+"""
+Amatino API Python Bindings
+Node Indexed Module
+Author: hugh@amatino.io
+"""
+from amatino.tree_node import TreeNode
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+NodeEntry = Tuple[TreeNode, Optional[int], int]
+
+
+class NodeIndexed:
+    """
+    Abstract class defining an interface for objects composed of nested
+    TreeNodes, i.e. Trees, Positions, and Performances. Provides lookups of
+    TreeNodes by Account id, backed by a flat index built on first use, such
+    that repeated lookups do not walk the nested structure.
+    """
+
+    nodes = NotImplemented
+
+    _indexed_cached_index = None
+
+    def find(self, account_id: int) -> Optional[TreeNode]:
+        """
+        Return the TreeNode describing the supplied Account id, or None if
+        there is no such TreeNode
+        """
+        entry = self._node_index().get(account_id)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def parent_of(self, account_id: int) -> Optional[TreeNode]:
+        """
+        Return the TreeNode containing the TreeNode describing the supplied
+        Account id, or None if that TreeNode is at the top level
+        """
+        index = self._node_index()
+        parent_id = self._entry(index, account_id)[1]
+        if parent_id is None:
+            return None
+        return index[parent_id][0]
+
+    def depth_of(self, account_id: int) -> int:
+        """
+        Return the depth at which the TreeNode describing the supplied
+        Account id is nested, where top level TreeNodes have depth zero
+        """
+        return self._entry(self._node_index(), account_id)[2]
+
+    def path_to(self, account_id: int) -> List[TreeNode]:
+        """
+        Return the TreeNodes leading from the top level to the TreeNode
+        describing the supplied Account id, inclusive of both
+        """
+        index = self._node_index()
+        entry = self._entry(index, account_id)
+        path = [entry[0]]
+        while entry[1] is not None:
+            entry = index[entry[1]]
+            path.append(entry[0])
+        path.reverse()
+        return path
+
+    def walk(self) -> Iterator[TreeNode]:
+        """Yield every TreeNode, depth first, parents before children"""
+        if self.nodes == NotImplemented:
+            raise NotImplementedError('Implement .nodes property')
+        stack = list(reversed(self.nodes))
+        while len(stack) > 0:
+            node = stack.pop()
+            yield node
+            if node.children is not None:
+                stack.extend(reversed(node.children))
+
+    def _node_index(self) -> Dict[int, NodeEntry]:
+        """Return a map of Account id to TreeNode, parent id, and depth"""
+        if self._indexed_cached_index is not None:
+            return self._indexed_cached_index
+
+        if self.nodes == NotImplemented:
+            raise NotImplementedError('Implement .nodes property')
+
+        index = dict()  # type: Dict[int, NodeEntry]
+        stack = [(n, None, 0) for n in self.nodes]
+        while len(stack) > 0:
+            node, parent_id, depth = stack.pop()
+            index[node.account_id] = (node, parent_id, depth)
+            if node.children is not None:
+                stack.extend([
+                    (c, node.account_id, depth + 1) for c in node.children
+                ])
+
+        self._indexed_cached_index = index
+        return index
+
+    @staticmethod
+    def _entry(index: Dict[int, NodeEntry], account_id: int) -> NodeEntry:
+        entry = index.get(account_id)
+        if entry is None:
+            raise KeyError('No TreeNode describes Account {}'.format(
+                account_id
+            ))
+        return entry
@@ -12,10 +12,12 @@ from typing import Dict
 from datetime import datetime
 from decimal import Decimal
 from amatino.denominated import Denominated
+from amatino.node_indexed import NodeIndexed
 from amatino.denomination import Denomination
 from amatino.decodable import Decodable
 from amatino.internal.data_package import DataPackage
 from amatino.internal.api_request import ApiRequest
+from amatino.internal.response_cache import ResponseCache
 from amatino.internal.url_parameters import UrlParameters
 from amatino.internal.http_method import HTTPMethod
 from amatino.internal.encodable import Encodable
@@ -27,12 +29,13 @@ from amatino.tree_node import TreeNode
 from amatino.internal.immutable import Immutable
 from amatino.global_unit import GlobalUnit
 from amatino.custom_unit import CustomUnit
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Performance')
 K = TypeVar('K', bound='Performance.RetrieveArguments')
 
 
-class Performance(Denominated, Decodable):
+class Performance(Denominated, Decodable, NodeIndexed):
     """
     A Performance is a hierarchical collection of Account balances describing
     the financial performance of an Entity over a period of time. They are
@@ -109,6 +112,7 @@ class Performance(Denominated, Decodable):
     global_unit_id = Immutable(lambda s: s._global_unit_id)
     income = Immutable(lambda s: s._income)
     expenses = Immutable(lambda s: s._expenses)
+    nodes = Immutable(lambda s: s._income + s._expenses)
 
     has_income = Immutable(lambda s: len(s._income) > 0)
     has_expenses = Immutable(lambda s: len(s._expenses) > 0)
@@ -117,6 +121,7 @@ class Performance(Denominated, Decodable):
     total_expenses = Immutable(lambda s: s._compute_expenses())
 
     @classmethod
+    @Instrumentation.decoder
     def decode(
         cls: Type[T],
         entity: Entity,
@@ -185,15 +190,29 @@ class Performance(Denominated, Decodable):
         data = DataPackage(object_data=arguments, override_listing=True)
         parameters = UrlParameters(entity_id=entity.id_)
 
-        request = ApiRequest(
-            path=cls._PATH,
-            method=HTTPMethod.GET,
-            credentials=entity.session,
-            data=data,
-            url_parameters=parameters
+        def retrieve() -> Any:
+            return ApiRequest(
+                path=cls._PATH,
+                method=HTTPMethod.GET,
+                credentials=entity.session,
+                data=data,
+                url_parameters=parameters
+            ).response_data
+
+        response_data = ResponseCache.fetch(
+            entity,
+            cls._PATH,
+            data,
+            cls._as_of(arguments),
+            retrieve
         )
 
-        return cls.decode(entity, request.response_data)
+        return cls.decode(entity, response_data)
+
+    @classmethod
+    def _as_of(cls: Type[T], arguments: K) -> datetime:
+        """Return the end time of the Performance the arguments describe"""
+        return arguments._end_time.raw
 
     def _compute_income(self) -> Decimal:
         """Return total income"""
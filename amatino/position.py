@@ -12,10 +12,12 @@ from typing import Dict
 from datetime import datetime
 from decimal import Decimal
 from amatino.denominated import Denominated
+from amatino.node_indexed import NodeIndexed
 from amatino.denomination import Denomination
 from amatino.decodable import Decodable
 from amatino.internal.data_package import DataPackage
 from amatino.internal.api_request import ApiRequest
+from amatino.internal.response_cache import ResponseCache
 from amatino.internal.url_parameters import UrlParameters
 from amatino.internal.http_method import HTTPMethod
 from amatino.internal.encodable import Encodable
@@ -27,12 +29,13 @@ from amatino.tree_node import TreeNode
 from amatino.internal.immutable import Immutable
 from amatino.global_unit import GlobalUnit
 from amatino.custom_unit import CustomUnit
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Position')
 K = TypeVar('K', bound='Position.RetrieveArguments')
 
 
-class Position(Denominated, Decodable):
+class Position(Denominated, Decodable, NodeIndexed):
     """
     Positions are hierarchical collections of Account balances describing
     the financial position of an Entity at a point in time. They are generic representations of popular accounting constructs better known as a
@@ -108,6 +111,7 @@ class Position(Denominated, Decodable):
     assets = Immutable(lambda s: s._assets)
     liabilities = Immutable(lambda s: s._liabilities)
     equities = Immutable(lambda s: s._equities)
+    nodes = Immutable(lambda s: s._assets + s._liabilities + s._equities)
 
     has_assets = Immutable(lambda s: len(s._assets) > 0)
     has_liabilities = Immutable(lambda s: len(s._liabilities) > 0)
@@ -126,6 +130,7 @@ class Position(Denominated, Decodable):
         return total
 
     @classmethod
+    @Instrumentation.decoder
     def decode(
         cls: Type[T],
         entity: Entity,
@@ -192,15 +197,29 @@ class Position(Denominated, Decodable):
         data = DataPackage(object_data=arguments, override_listing=True)
         parameters = UrlParameters(entity_id=entity.id_)
 
-        request = ApiRequest(
-            path=cls._PATH,
-            method=HTTPMethod.GET,
-            credentials=entity.session,
-            data=data,
-            url_parameters=parameters
+        def retrieve() -> Any:
+            return ApiRequest(
+                path=cls._PATH,
+                method=HTTPMethod.GET,
+                credentials=entity.session,
+                data=data,
+                url_parameters=parameters
+            ).response_data
+
+        response_data = ResponseCache.fetch(
+            entity,
+            cls._PATH,
+            data,
+            cls._as_of(arguments),
+            retrieve
         )
 
-        return cls.decode(entity, request.response_data)
+        return cls.decode(entity, response_data)
+
+    @classmethod
+    def _as_of(cls: Type[T], arguments: K) -> datetime:
+        """Return the balance time of the Position the arguments describe"""
+        return arguments._balance_time.raw
 
     class RetrieveArguments(Encodable):
         def __init__(
@@ -14,6 +14,7 @@ from typing import Optional
 from amatino.internal.immutable import Immutable
 from amatino.internal.http_method import HTTPMethod
 from amatino.internal.credentials import Credentials
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Session')
 
@@ -104,6 +105,7 @@ class Session(Credentials):
         return entity
 
     @classmethod
+    @Instrumentation.decoder
     def _decode(cls: Type[T], response_data: Any):
 
         if not isinstance(response_data, dict):
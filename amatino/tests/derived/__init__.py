@@ -1,7 +1,13 @@
 from amatino.tests.derived.ledger import LedgerTest
+from amatino.tests.derived.ledger_iterate import LedgerIterateTest
+from amatino.tests.derived.ledger_retrieve_all import LedgerRetrieveAllTest
+from amatino.tests.derived.ledger_stream import LedgerStreamTest
 from amatino.tests.derived.recursive_ledger import RecursiveLedgerTest
 from amatino.tests.derived.balance import BalanceTest
 from amatino.tests.derived.recursive_balance import RecursiveBalanceTest
 from amatino.tests.derived.performance import PerformanceTest
 from amatino.tests.derived.position import PositionTest
 from amatino.tests.derived.tree import TreeTest
+from amatino.tests.derived.tree_index import TreeIndexTest
+from amatino.tests.derived.chart_of_accounts import ChartOfAccountsTest
+from amatino.tests.derived.aio import AioTest
@@ -0,0 +1,62 @@
+"""
+Amatino API Python Bindings
+Asyncio Test Module
+Author: hugh@amatino.io
+"""
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from amatino.tests.primary.transaction import TransactionTest
+from amatino import Entry
+from amatino import Side
+from amatino import aio
+
+NAME = 'Retrieve objects concurrently with amatino.aio'
+
+
+class AioTest(TransactionTest):
+    """Test the awaitable classes provided by amatino.aio"""
+
+    def __init__(self, name=NAME) -> None:
+
+        super().__init__(name)
+        return
+
+    async def _retrieve(self) -> None:
+
+        transaction = await aio.Transaction.create(
+            self.entity,
+            datetime.utcnow(),
+            [
+                Entry(Side.debit, Decimal(7), self.asset),
+                Entry(Side.credit, Decimal(7), self.liability)
+            ],
+            self.usd
+        )
+        assert isinstance(transaction, aio.Transaction)
+
+        ledger, balance, account = await asyncio.gather(
+            aio.Ledger.retrieve(self.entity, self.asset),
+            aio.Balance.retrieve(self.entity, self.asset),
+            aio.Account.retrieve(self.entity, self.asset.id_)
+        )
+
+        assert isinstance(ledger, aio.Ledger)
+        assert len(ledger) == 1
+        assert balance.magnitude == Decimal(7)
+        assert account.id_ == self.asset.id_
+
+        return
+
+    def execute(self) -> None:
+
+        try:
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(self._retrieve())
+            loop.close()
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        self.record_success()
+        return
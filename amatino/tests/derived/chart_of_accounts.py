@@ -0,0 +1,67 @@
+"""
+Amatino API Python Bindings
+Chart of Accounts Test Module
+Author: hugh@blinkybeach.com
+"""
+from amatino.tests.primary.account import AccountTest
+from amatino import Account
+from amatino import Tree
+from amatino import AMType
+from amatino import ChartOfAccounts
+from datetime import datetime
+
+NAME = 'Build a Chart of Accounts from a Tree'
+
+
+class ChartOfAccountsTest(AccountTest):
+    """Test the ChartOfAccounts object"""
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        return
+
+    def execute(self) -> None:
+
+        try:
+
+            income = self.create_account(
+                amt=AMType.income,
+                name='Test Income'
+            )
+
+            income_child = Account.create(
+                self.entity,
+                'Test income child',
+                income.am_type,
+                income.denomination,
+                parent=income
+            )
+
+            expense = self.create_account(
+                amt=AMType.expense,
+                name='Test Expense'
+            )
+
+            tree = Tree.retrieve(
+                entity=self.entity,
+                balance_time=datetime.utcnow(),
+                denomination=self.usd
+            )
+
+            chart = ChartOfAccounts.from_tree(tree)
+
+            assert isinstance(chart, ChartOfAccounts)
+            assert income_child.id_ in chart
+            assert chart.parent_id(income.id_) is None
+            assert chart.parent_id(income_child.id_) == income.id_
+            assert chart.depth(income_child.id_) == 1
+            assert chart.name(income_child.id_) == 'Test income child'
+            assert chart.is_descendant(income_child.id_, income.id_)
+            assert not chart.is_descendant(expense.id_, income.id_)
+            assert chart.descendant_ids(income.id_) == [income_child.id_]
+
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        self.record_success()
@@ -0,0 +1,47 @@
+"""
+Amatino API Python Bindings
+Ledger Iterate Test Module
+Author: hugh@amatino.io
+"""
+from amatino.tests.primary.transaction import TransactionTest
+from amatino import Ledger
+from decimal import Decimal
+from amatino import LedgerRow
+
+NAME = 'Iterate over every page of a Ledger'
+
+
+class LedgerIterateTest(TransactionTest):
+    """Test iteration of Ledger rows across pages"""
+
+    def __init__(self, name=NAME) -> None:
+
+        super().__init__(name)
+        return
+
+    def execute(self) -> None:
+
+        try:
+            self.create_transaction(amount=Decimal(42))
+            self.create_transaction(amount=Decimal(12))
+            self.create_transaction(amount=Decimal(1492))
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        try:
+            rows = list(Ledger.iterate(self.entity, self.asset))
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        for row in rows:
+            if not isinstance(row, LedgerRow):
+                self.record_failure('Unexpected non-LedgerRow type')
+                return
+
+        if len(rows) != 3:
+            self.record_failure('Unexpected number of iterated ledger rows')
+            return
+
+        self.record_success()
@@ -0,0 +1,49 @@
+"""
+Amatino API Python Bindings
+Ledger Retrieve All Test Module
+Author: hugh@amatino.io
+"""
+from amatino.tests.primary.transaction import TransactionTest
+from amatino import Ledger
+from decimal import Decimal
+
+NAME = 'Retrieve every page of a Ledger'
+
+
+class LedgerRetrieveAllTest(TransactionTest):
+    """Test retrieval of a Ledger with all of its pages"""
+
+    def __init__(self, name=NAME) -> None:
+
+        super().__init__(name)
+        return
+
+    def execute(self) -> None:
+
+        try:
+            self.create_transaction(amount=Decimal(42))
+            self.create_transaction(amount=Decimal(12))
+            self.create_transaction(amount=Decimal(1492))
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        try:
+            ledger = Ledger.retrieve(self.entity, self.asset)
+            full_ledger = Ledger.retrieve_all(self.entity, self.asset)
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        if not isinstance(full_ledger, Ledger):
+            return_type = str(type(full_ledger))
+            self.record_failure('Unexpected return type: ' + return_type)
+            return
+
+        if [r.transaction_id for r in full_ledger] != [
+            r.transaction_id for r in ledger
+        ]:
+            self.record_failure('Unexpected rows in fully retrieved ledger')
+            return
+
+        self.record_success()
@@ -0,0 +1,50 @@
+"""
+Amatino API Python Bindings
+Ledger Stream Test Module
+Author: hugh@amatino.io
+"""
+from amatino.tests.primary.transaction import TransactionTest
+from amatino import Ledger
+from decimal import Decimal
+from amatino import LedgerRow
+
+NAME = 'Stream the rows of a Ledger'
+
+
+class LedgerStreamTest(TransactionTest):
+    """Test incremental decoding of Ledger rows"""
+
+    def __init__(self, name=NAME) -> None:
+
+        super().__init__(name)
+        return
+
+    def execute(self) -> None:
+
+        try:
+            self.create_transaction(amount=Decimal(42))
+            self.create_transaction(amount=Decimal(12))
+            self.create_transaction(amount=Decimal(1492))
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        try:
+            ledger = Ledger.retrieve(self.entity, self.asset)
+            streamed = list(Ledger.stream(self.entity, self.asset))
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        for row in streamed:
+            if not isinstance(row, LedgerRow):
+                self.record_failure('Unexpected non-LedgerRow type')
+                return
+
+        if [r.transaction_id for r in streamed] != [
+            r.transaction_id for r in ledger
+        ]:
+            self.record_failure('Unexpected rows in streamed ledger')
+            return
+
+        self.record_success()
@@ -0,0 +1,83 @@
+"""
+Amatino API Python Bindings
+Tree Index Test Module
+Author: hugh@blinkybeach.com
+"""
+from amatino.tests.primary.account import AccountTest
+from amatino import Account
+from amatino import Transaction
+from amatino import Tree
+from amatino import AMType
+from amatino import Side
+from amatino import Entry
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+
+NAME = 'Find, walk and measure Tree nodes'
+
+
+class TreeIndexTest(AccountTest):
+    """Test the node index of the Tree object"""
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        return
+
+    def execute(self) -> None:
+
+        try:
+
+            income = self.create_account(
+                amt=AMType.income,
+                name='Test Income'
+            )
+
+            income_child = Account.create(
+                self.entity,
+                'Test income child',
+                income.am_type,
+                income.denomination,
+                parent=income
+            )
+
+            asset = self.create_account(
+                AMType.asset,
+                'Test Asset'
+            )
+
+            Transaction.create(
+                self.entity,
+                datetime.utcnow(),
+                [
+                    Entry(Side.credit, Decimal('250'), income_child),
+                    Entry(Side.credit, Decimal('250'), income),
+                    Entry(Side.debit, Decimal('500'), asset)
+                ],
+                self.usd,
+                'Test transaction'
+            )
+
+            tree = Tree.retrieve(
+                entity=self.entity,
+                balance_time=datetime.utcnow() + timedelta(hours=1),
+                denomination=self.usd
+            )
+
+            income_root = tree.find(income.id_)
+            child_node = tree.find(income_child.id_)
+
+            assert income_root is tree.income[0]
+            assert child_node.account_balance == Decimal('250')
+            assert tree.path_to(income_child.id_) == [income_root, child_node]
+            assert tree.depth_of(income.id_) == 0
+            assert tree.depth_of(income_child.id_) == 1
+            walked = [n.account_id for n in tree.walk()]
+            assert income_child.id_ in walked
+            assert walked.index(income.id_) < walked.index(income_child.id_)
+
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        self.record_success()
@@ -0,0 +1,22 @@
+from amatino.tests.offline.retry import RetryTest
+from amatino.tests.offline.rate_limit import RateLimitTest
+from amatino.tests.offline.stream import StreamTest
+from amatino.tests.offline.connection_pool import ConnectionPoolTest
+from amatino.tests.offline.account_cache import AccountCacheTest
+from amatino.tests.offline.account_batch import AccountBatchTest
+from amatino.tests.offline.response_cache import ResponseCacheTest
+from amatino.tests.offline.transaction_batch import TransactionBatchTest
+from amatino.tests.offline.cassette import CassetteTest
+from amatino.tests.offline.ledger_iterator import LedgerIteratorTest
+from amatino.tests.offline.single_flight import SingleFlightTest
+from amatino.tests.offline.compression import CompressionTest
+from amatino.tests.offline.signer import SignerTest
+from amatino.tests.offline.unit_cache import UnitCacheTest
+from amatino.tests.offline.am_time import AmatinoTimeTest
+from amatino.tests.offline.ledger_columns import LedgerColumnsTest
+from amatino.tests.offline.ledger_row import LedgerRowTest
+from amatino.tests.offline.in_process_server import InProcessServerTest
+from amatino.tests.offline.instrumentation import InstrumentationTest
+from amatino.tests.offline.tree_node import TreeNodeTest
+from amatino.tests.offline.async_connection_pool import AsyncConnectionPoolTest
+from amatino.tests.offline.proxy import ProxyTest
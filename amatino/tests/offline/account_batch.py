@@ -0,0 +1,83 @@
+"""
+Amatino API Python Bindings
+Account Batch Test Module
+Author: hugh@amatino.io
+"""
+from datetime import datetime
+from email.message import Message
+from typing import Dict
+from typing import Optional
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Account
+from amatino import AccountCache
+from amatino import AMType
+from amatino import Entity
+from amatino import GlobalUnitConstants
+from amatino import InProcessServer
+from amatino import Transport
+from amatino import Tree
+
+NAME = 'Attempt unreadable Account batches once'
+
+
+class ForbiddingServer(InProcessServer):
+    """
+    An InProcessServer refusing requests for more than one Account at once,
+    counting the requests for Accounts it receives
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = 0
+        self.singles = 0
+        return
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        if method != 'GET' or '/accounts?' not in url:
+            return super().open(method, url, body, headers, timeout)
+        if url.count('account_id=') < 2:
+            self.singles += 1
+            return super().open(method, url, body, headers, timeout)
+        self.batches += 1
+        return Transport.Response(403, 'Forbidden', Message(), b'{}')
+
+
+class AccountBatchTest(OfflineTest):
+    """
+    Test that TreeNodes sharing an Account batch which cannot be retrieved
+    attempt it once, rather than once per node
+    """
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        self.server = ForbiddingServer()
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        usd = GlobalUnitConstants.USD
+        session = self.create_session()
+        entity = Entity.create(session, 'Batch', None)
+        for name in ('Cash', 'Bank', 'Receivables', 'Inventory'):
+            Account.create(entity, name, AMType.asset, usd)
+        AccountCache.shared().clear()
+
+        tree = Tree.retrieve(entity, datetime(2019, 1, 1), usd)
+        assert len(tree.assets) == 4
+        for node in tree.assets:
+            assert node.account.id_ == node.account_id
+
+        assert self.server.batches == 1
+        assert self.server.singles == 4
+
+        return
@@ -0,0 +1,42 @@
+"""
+Amatino API Python Bindings
+Account Cache Test Module
+Author: hugh@amatino.io
+"""
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Account
+from amatino import AMType
+from amatino import Entity
+from amatino import GlobalUnitConstants
+
+
+class AccountCacheTest(OfflineTest):
+    """
+    Test that Accounts cached for one Session are not returned to another
+    """
+
+    def __init__(self, name='Scope cached Accounts to their Session') -> None:
+        super().__init__(name)
+        return
+
+    def check(self) -> None:
+
+        first = self.create_session()
+        entity = Entity.create(first, 'Cache', None)
+        account = Account.create(
+            entity,
+            'Cash',
+            AMType.asset,
+            GlobalUnitConstants.USD
+        )
+        assert Account.lookup(entity, account.id_) is account
+
+        second = self.create_session()
+        other_entity = Entity.retrieve(second, entity.id_)
+        other_account = Account.lookup(other_entity, account.id_)
+
+        assert other_account is not account
+        assert other_account.session is second
+        assert other_account.entity.session is second
+
+        return
@@ -0,0 +1,79 @@
+"""
+Amatino API Python Bindings
+AmatinoTime Test Module
+Author: hugh@amatino.io
+"""
+from datetime import datetime
+from typing import Optional
+from amatino.tests.offline.offline import OfflineTest
+from amatino.internal import am_time
+from amatino.internal.am_time import AmatinoTime
+
+STRINGS = (
+    '2019-03-04_05:06:07.123456',
+    '2019-03-04_05:06:07.000000',
+    '2019-12-31_23:59:59.999999',
+    '0001-01-01_00:00:00.000001',
+    '2019-03-04_05:06:07.5',
+    '2019-03-04_05:06:07',
+    '2019-03-04_05:06:07.123456Z',
+    '2019-03-04_05:06:07.12345Z',
+    '2019-03-04_05:06:07.123+00',
+    '2019-03-04_05:06:07.123456+00:00',
+    '2019-13-04_05:06:07.123456',
+    '2019-02-30_05:06:07.123456',
+    '2019-03-04_24:06:07.123456',
+    '2019-03-04T05:06:07.123456',
+    '2019-03-04_05:06:07.1 3456',
+    ' 019-03-04_05:06:07.123456',
+    'abcd-ef-gh_ij:kl:mn.opqrst',
+    ''
+)
+
+
+class AmatinoTimeTest(OfflineTest):
+    """
+    Test that AmatinoTime parses every string as strptime would, by either
+    fixed width path, returning equal times and rejecting the same strings
+    """
+
+    def __init__(self, name='Parse times as strptime does') -> None:
+        super().__init__(name)
+        return
+
+    def check(self) -> None:
+
+        from_iso_format = am_time._FROM_ISO_FORMAT
+        try:
+            for parser in (from_iso_format, None):
+                am_time._FROM_ISO_FORMAT = parser
+                AmatinoTime._parse.cache_clear()
+                for string in STRINGS:
+                    expected = self._strptime(string)
+                    assert self._parse(string) == expected, string
+                    # Memoised results must match too
+                    assert self._parse(string) == expected, string
+        finally:
+            am_time._FROM_ISO_FORMAT = from_iso_format
+            AmatinoTime._parse.cache_clear()
+
+        parsed = AmatinoTime.decode(STRINGS[0]).raw
+        assert parsed.microsecond == 123456
+        assert parsed.utcoffset().total_seconds() == 0
+
+        return
+
+    @staticmethod
+    def _strptime(string: str) -> Optional[datetime]:
+        try:
+            parsed = datetime.strptime(string, AmatinoTime._FORMAT_STRING)
+        except ValueError:
+            return None
+        return parsed.replace(tzinfo=am_time._UTC)
+
+    @staticmethod
+    def _parse(string: str) -> Optional[datetime]:
+        try:
+            return AmatinoTime._parse(string)
+        except ValueError:
+            return None
@@ -0,0 +1,68 @@
+"""
+Amatino API Python Bindings
+Async Connection Pool Test Module
+Author: hugh@amatino.io
+"""
+import asyncio
+import time
+from amatino.tests.offline.offline import OfflineTest
+from amatino.internal.async_connection_pool import AsyncConnectionPool
+
+NAME = 'Bound the wait for an async connection'
+
+
+class AsyncConnectionPoolTest(OfflineTest):
+    """
+    Test that a request waiting for a connection from a saturated
+    AsyncConnectionPool times out within its own timeout
+    """
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        return
+
+    def check(self) -> None:
+        asyncio.run(self._check())
+        return
+
+    @staticmethod
+    async def _check() -> None:
+
+        async def stall(
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+        ) -> None:
+            # Read requests, and never answer them
+            await reader.read()
+            writer.close()
+            return
+
+        server = await asyncio.start_server(stall, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        url = 'http://127.0.0.1:{p}/entities'.format(p=port)
+        pool = AsyncConnectionPool(max_per_host=1)
+
+        # Occupies the only connection the pool allows
+        occupant = asyncio.ensure_future(
+            pool.request('GET', url, None, dict(), 5)
+        )
+        await asyncio.sleep(0.1)
+
+        started = time.perf_counter()
+        try:
+            await pool.request('GET', url, None, dict(), 0.3)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            raise AssertionError('Request to a stalled server completed')
+        elapsed = time.perf_counter() - started
+
+        occupant.cancel()
+        await asyncio.gather(occupant, return_exceptions=True)
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+        assert elapsed < 1, elapsed
+
+        return
@@ -0,0 +1,51 @@
+"""
+Amatino API Python Bindings
+Cassette Test Module
+Author: hugh@amatino.io
+"""
+import gzip
+import os
+from tempfile import TemporaryDirectory
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Cassette
+from amatino import Entity
+from amatino import InProcessServer
+from amatino import Session
+from amatino import Transport
+
+EMAIL = 'cassette@example.com'
+SECRET = 'cassette secret'
+
+
+class CassetteTest(OfflineTest):
+    """
+    Test that a Cassette replays what it recorded, without writing the
+    credentials it carried
+    """
+
+    def __init__(self, name='Record and replay without credentials') -> None:
+        super().__init__(name)
+        return
+
+    def check(self) -> None:
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'test.cassette')
+
+            with Cassette(path, Cassette.RECORD, InProcessServer()):
+                session = Session.create_with_email(EMAIL, SECRET)
+                entity = Entity.create(session, 'Cassette', None)
+
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                recorded = file.read()
+
+            Transport.set_shared(Cassette(path))
+            replayed = Session.create_with_email(EMAIL, 'another secret')
+            replayed_entity = Entity.create(replayed, 'Cassette', None)
+
+        for credential in (EMAIL, SECRET, session.api_key):
+            assert credential not in recorded
+        assert replayed.session_id == session.session_id
+        assert replayed_entity.id_ == entity.id_
+
+        return
@@ -0,0 +1,114 @@
+"""
+Amatino API Python Bindings
+Compression Test Module
+Author: hugh@amatino.io
+"""
+import gzip
+import zlib
+from typing import Dict
+from typing import List
+from typing import Optional
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Compression
+from amatino import Entity
+from amatino import InProcessServer
+from amatino import Transport
+
+NAME = 'Compress request and response bodies'
+
+
+class EncodingServer(InProcessServer):
+    """
+    An InProcessServer recording the Content-Encoding of each request body
+    it receives, and of each response body it returns
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.request_encodings = list()  # type: List[Optional[str]]
+        self.response_encodings = list()  # type: List[Optional[str]]
+        return
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        if body:
+            self.request_encodings.append(headers.get('Content-Encoding'))
+        response = super().open(method, url, body, headers, timeout)
+        self.response_encodings.append(
+            response.headers.get('Content-Encoding')
+        )
+        return response
+
+
+class CompressionTest(OfflineTest):
+    """
+    Test that request bodies are compressed above the request threshold,
+    and that compressed responses are decompressed, whole or in chunks
+    """
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        self.server = EncodingServer()
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        threshold = Compression.request_threshold()
+        try:
+            self._check_requests()
+        finally:
+            Compression.set_request_threshold(threshold)
+
+        self._check_chunks()
+
+        return
+
+    def _check_requests(self) -> None:
+
+        description = 'Compressible ' * 200
+
+        Compression.set_request_threshold(None)
+        session = self.create_session()
+        Entity.create(session, 'Uncompressed', description)
+
+        Compression.set_request_threshold(1024)
+        entity = Entity.create(session, 'Compressed', description)
+        assert entity.description == description
+
+        assert self.server.request_encodings == [None, None, 'gzip']
+        assert self.server.response_encodings[-1] == 'gzip'
+
+        return
+
+    @staticmethod
+    def _check_chunks() -> None:
+
+        body = b'{"ledger_rows": []}' * 100
+        encodings = {
+            'gzip': gzip.compress(body),
+            'deflate': zlib.compress(body),
+            'identity': body
+        }
+
+        for coding, encoded in encodings.items():
+            assert Compression.decode(encoded, coding) == body
+            chunks = [encoded[i:i + 1] for i in range(len(encoded))]
+            assert b''.join(Compression.decode_stream(chunks, coding)) == body
+
+        # Some servers send raw deflate data without a zlib header
+        raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        encoded = raw.compress(body) + raw.flush()
+        assert Compression.decode(encoded, 'deflate') == body
+        chunks = [encoded[i:i + 1] for i in range(len(encoded))]
+        assert b''.join(Compression.decode_stream(chunks, 'deflate')) == body
+
+        return
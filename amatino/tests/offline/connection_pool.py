@@ -0,0 +1,105 @@
+"""
+Amatino API Python Bindings
+Connection Pool Test Module
+Author: hugh@amatino.io
+"""
+import socket
+from threading import Thread
+from typing import List
+from amatino.tests.offline.offline import OfflineTest
+from amatino import ConnectionPool
+
+NAME = 'Replay only idempotent requests on dropped connections'
+
+
+class DroppingServer:
+    """
+    A raw HTTP server answering the first request on each connection, and
+    closing the connection upon receiving the second, as a server whose
+    keep-alive timeout expired mid-request would. Records the method of
+    every request received.
+    """
+
+    def __init__(self) -> None:
+        self._socket = socket.socket()
+        self._socket.bind(('127.0.0.1', 0))
+        self._socket.listen(8)
+        self.url = 'http://127.0.0.1:{p}/'.format(
+            p=self._socket.getsockname()[1]
+        )
+        self.received = list()  # type: List[str]
+        Thread(target=self._serve, daemon=True).start()
+        return
+
+    def close(self) -> None:
+        self._socket.close()
+        return
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except OSError:
+                return
+            Thread(
+                target=self._handle,
+                args=(connection,),
+                daemon=True
+            ).start()
+
+    def _handle(self, connection: socket.socket) -> None:
+        buffer = b''
+        answered = False
+        while True:
+            while b'\r\n\r\n' not in buffer:
+                received = connection.recv(65536)
+                if not received:
+                    connection.close()
+                    return
+                buffer += received
+            head, buffer = buffer.split(b'\r\n\r\n', 1)
+            length = 0
+            for line in head.split(b'\r\n')[1:]:
+                name, value = line.split(b':', 1)
+                if name.strip().lower() == b'content-length':
+                    length = int(value)
+            while len(buffer) < length:
+                buffer += connection.recv(65536)
+            buffer = buffer[length:]
+            self.received.append(head.split(b' ')[0].decode())
+            if answered:
+                connection.close()
+                return
+            answered = True
+            connection.sendall(
+                b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}'
+            )
+
+
+class ConnectionPoolTest(OfflineTest):
+    """Test the ConnectionPool's handling of connections dropped in use"""
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        return
+
+    def check(self) -> None:
+
+        for method, replayed in (('POST', False), ('GET', True)):
+            server = DroppingServer()
+            pool = ConnectionPool()
+            try:
+                pool.open(method, server.url, b'{}', {}, 5).read()
+                try:
+                    pool.open(method, server.url, b'{}', {}, 5).read()
+                    succeeded = True
+                except (ConnectionError, OSError):
+                    succeeded = False
+            finally:
+                pool.close()
+                server.close()
+
+            assert succeeded == replayed
+            assert len(server.received) == (3 if replayed else 2)
+
+        return
@@ -0,0 +1,57 @@
+"""
+Amatino API Python Bindings
+In Process Server Test Module
+Author: hugh@amatino.io
+"""
+import asyncio
+import time
+from amatino.tests.offline.offline import OfflineTest
+from amatino import aio
+from amatino import AMType
+from amatino import Entity
+from amatino import GlobalUnitConstants
+from amatino import InProcessServer
+from amatino import Transport
+
+LATENCY = 0.2
+CONCURRENCY = 5
+
+
+class InProcessServerTest(OfflineTest):
+    """
+    Test that an InProcessServer serves concurrent awaited requests
+    concurrently, rather than blocking its event loop for their latency
+    """
+
+    def __init__(self, name='Await in-process latency') -> None:
+        super().__init__(name)
+        return
+
+    def transport(self) -> Transport:
+        return InProcessServer(latency=LATENCY)
+
+    def check(self) -> None:
+
+        session = self.create_session()
+        entity = Entity.create(session, 'Concurrency', None)
+        asyncio.run(self._check(entity))
+
+        return
+
+    @staticmethod
+    async def _check(entity: Entity) -> None:
+
+        usd = GlobalUnitConstants.USD
+        started = time.perf_counter()
+        accounts = await asyncio.gather(*[
+            aio.Account.create(entity, str(i), AMType.asset, usd)
+            for i in range(CONCURRENCY)
+        ])
+        elapsed = time.perf_counter() - started
+
+        assert sorted(a.name for a in accounts) == [
+            str(i) for i in range(CONCURRENCY)
+        ]
+        assert elapsed < LATENCY * CONCURRENCY / 2, elapsed
+
+        return
@@ -0,0 +1,130 @@
+"""
+Amatino API Python Bindings
+Instrumentation Test Module
+Author: hugh@amatino.io
+"""
+from typing import List
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Entity
+from amatino import HistogramCollector
+from amatino import Instrumentation
+from amatino import PrometheusExporter
+
+EXPOSITION = '''\
+# HELP test_request_phase_seconds Time spent in each phase of Amatino API \
+requests
+# TYPE test_request_phase_seconds histogram
+test_request_phase_seconds_bucket{phase="network",method="GET",path="/x\\"y",\
+le="0.125"} 2
+test_request_phase_seconds_bucket{phase="network",method="GET",path="/x\\"y",\
+le="1.0"} 3
+test_request_phase_seconds_bucket{phase="network",method="GET",path="/x\\"y",\
+le="+Inf"} 4
+test_request_phase_seconds_sum{phase="network",method="GET",path="/x\\"y"} \
+2.6875
+test_request_phase_seconds_count{phase="network",method="GET",path="/x\\"y"} 4
+# HELP test_request_phase_bytes_total Payload bytes handled in each phase of \
+Amatino API requests
+# TYPE test_request_phase_bytes_total counter
+test_request_phase_bytes_total{phase="network",method="GET",path="/x\\"y"} 300
+# HELP test_request_retries_total Amatino API request attempts that were \
+retries
+# TYPE test_request_retries_total counter
+test_request_retries_total{method="GET",path="/x\\"y"} 1
+# HELP test_responses_total Amatino API responses received, by status, or by \
+`error` where no response was received
+# TYPE test_responses_total counter
+test_responses_total{method="GET",path="/x\\"y",status="200"} 2
+test_responses_total{method="GET",path="/x\\"y",status="503"} 1
+test_responses_total{method="GET",path="/x\\"y",status="error"} 1
+'''
+
+
+class InstrumentationTest(OfflineTest):
+    """
+    Test that requests emit an event per phase, and that a HistogramCollector
+    and PrometheusExporter count and render those events
+    """
+
+    def __init__(self, name='Collect and export request timings') -> None:
+        super().__init__(name)
+        return
+
+    def check(self) -> None:
+        self._check_events()
+        self._check_collector()
+        return
+
+    def _check_events(self) -> None:
+
+        events = list()  # type: List[Instrumentation.Event]
+        collector = HistogramCollector()
+        Instrumentation.register(events.append)
+        Instrumentation.register(collector)
+        try:
+            session = self.create_session()
+            entity = Entity.create(session, 'Instrumented', None)
+            Entity.retrieve(session, entity.id_)
+        finally:
+            Instrumentation.unregister(events.append)
+            Instrumentation.unregister(collector)
+
+        network = [e for e in events if e.phase == Instrumentation.NETWORK]
+        assert [(e.method, e.path, e.status) for e in network] == [
+            ('POST', '/session', 200),
+            ('POST', '/entities', 200),
+            ('GET', '/entities', 200)
+        ]
+
+        # Each decode is attributed to the request whose response it decodes
+        for index, event in enumerate(events):
+            if event.phase != Instrumentation.DECODE:
+                continue
+            previous = [
+                e for e in events[:index]
+                if e.phase == Instrumentation.NETWORK
+            ]
+            assert event.path == previous[-1].path
+
+        for phase in Instrumentation.PHASES:
+            assert len([e for e in events if e.phase == phase]) == 3, phase
+
+        assert sum([s.count for s in collector.series()]) == len(events)
+
+        return
+
+    @staticmethod
+    def _check_collector() -> None:
+
+        collector = HistogramCollector(buckets=(0.125, 1.0))
+        for seconds, status, retries in (
+            (0.0625, 200, 0),
+            (0.125, 200, 0),
+            (0.5, 503, 1),
+            (2.0, None, 0)
+        ):
+            collector(Instrumentation.Event(
+                Instrumentation.NETWORK,
+                '/x"y',
+                'GET',
+                seconds,
+                size=100 if status is not None else None,
+                status=status,
+                retries=retries
+            ))
+
+        series = collector.series()
+        assert len(series) == 1
+        assert series[0].counts == [2, 1, 1]
+        assert series[0].statuses == {200: 2, 503: 1, None: 1}
+        assert collector.quantile(Instrumentation.NETWORK, 0.5) == 0.125
+        assert collector.quantile(Instrumentation.NETWORK, 1) == 1.0
+        assert collector.quantile(Instrumentation.PARSE, 0.5) is None
+
+        exporter = PrometheusExporter(collector, prefix='test')
+        assert exporter.render() == EXPOSITION
+
+        collector.reset()
+        assert collector.series() == []
+
+        return
@@ -0,0 +1,159 @@
+"""
+Amatino API Python Bindings
+Ledger Columns Test Module
+Author: hugh@amatino.io
+"""
+from array import array
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from typing import List
+from amatino.tests.offline.offline import OfflineTest
+from amatino.tests.offline.ledger_iterator import PagingServer
+from amatino.internal import ledger_columns
+from amatino.internal.lazy_ledger_row import LazyLedgerRow
+from amatino.internal.ledger_columns import LedgerColumns
+from amatino import Account
+from amatino import AMType
+from amatino import ColumnarLedger
+from amatino import ColumnarRecursiveLedger
+from amatino import Entity
+from amatino import Entry
+from amatino import GlobalUnitConstants
+from amatino import Ledger
+from amatino import RecursiveLedger
+from amatino import Side
+from amatino import Transaction
+from amatino import Transport
+
+FIELDS = (
+    'transaction_id',
+    'transaction_time',
+    'description',
+    'opposing_account_id',
+    'opposing_account_name',
+    'debit',
+    'credit',
+    'balance'
+)
+
+ROWS = [
+    [1, '2019-01-01_00:00:00.000000', 'Sale', 5, 'Income', '10.50', '0.00',
+     '10.50'],
+    [2, '2019-01-02_12:30:00.250000', 'Sale', None, None, '0', '(1,000.125)',
+     '-989.625'],
+    [3, '2019-01-03_00:00:00.000001', None, 5, 'Income', '-0.1', '0.00',
+     '-989.725']
+]
+
+OVERFLOWING_ROWS = [
+    [4, '2019-01-04_00:00:00.000000', 'Windfall', 6, 'Gains',
+     '123456789012345678901.5', '0', '123456789012345677911.775']
+]
+
+
+class LedgerColumnsTest(OfflineTest):
+    """
+    Test that LedgerColumns decode, join, and total rows exactly as
+    LedgerRows do, whether backed by NumPy or by the array module
+    """
+
+    def __init__(self, name='Decode Ledgers into columns') -> None:
+        super().__init__(name)
+        return
+
+    def transport(self) -> Transport:
+        return PagingServer()
+
+    def check(self) -> None:
+
+        installed = ledger_columns.numpy
+        try:
+            for numpy in ([installed, None] if installed else [None]):
+                ledger_columns.numpy = numpy
+                self._check_columns(array if numpy is None else numpy.ndarray)
+                self._check_ledgers()
+        finally:
+            ledger_columns.numpy = installed
+
+        return
+
+    def _check_columns(self, column_type: type) -> None:
+
+        columns = LedgerColumns.decode(ROWS)
+        self._assert_rows(columns, ROWS)
+        assert isinstance(columns.debits, column_type)
+        assert columns.scale == 3
+        assert len(columns._strings) == 3
+
+        overflowing = LedgerColumns.decode(OVERFLOWING_ROWS)
+        self._assert_rows(overflowing, OVERFLOWING_ROWS)
+        assert isinstance(overflowing.debits, list)
+
+        parts = [
+            LedgerColumns.decode(ROWS[:1]),
+            LedgerColumns.decode(ROWS[1:]),
+            LedgerColumns.decode([])
+        ]
+        joined = LedgerColumns.concatenate(parts)
+        self._assert_rows(joined, ROWS)
+        assert isinstance(joined.debits, column_type)
+        assert len(joined._strings) == 3
+
+        joined = LedgerColumns.concatenate(parts + [overflowing])
+        self._assert_rows(joined, ROWS + OVERFLOWING_ROWS)
+        assert isinstance(joined.debits, list)
+
+        return
+
+    @staticmethod
+    def _assert_rows(columns: LedgerColumns, rows: List[Any]) -> None:
+
+        expected = [LazyLedgerRow(r) for r in rows]
+        assert len(columns) == len(expected)
+        for row, reference in zip(columns, expected):
+            for field in FIELDS:
+                assert getattr(row, field) == getattr(reference, field), field
+
+        total_debits = sum([r.debit for r in expected], Decimal(0))
+        total_credits = sum([r.credit for r in expected], Decimal(0))
+        assert columns.total_debits == total_debits
+        assert columns.total_credits == total_credits
+
+        return
+
+    def _check_ledgers(self) -> None:
+
+        usd = GlobalUnitConstants.USD
+        session = self.create_session()
+        entity = Entity.create(session, 'Columns', None)
+        assets = Account.create(entity, 'Assets', AMType.asset, usd)
+        cash = Account.create(entity, 'Cash', AMType.asset, usd, None, assets)
+        income = Account.create(entity, 'Income', AMType.income, usd)
+        Transaction.create_many(entity, [
+            (
+                datetime(2019, 1, day),
+                [
+                    Entry(Side.debit, Decimal(day) / 4, cash),
+                    Entry(Side.credit, Decimal(day) / 4, income)
+                ],
+                usd
+            ) for day in range(1, 4)
+        ])
+
+        ledgers = (
+            (ColumnarLedger, Ledger, cash),
+            (ColumnarRecursiveLedger, RecursiveLedger, assets)
+        )
+        for columnar, reference, account in ledgers:
+            ledger = columnar.retrieve_all(entity, account)
+            expected = reference.retrieve_all(entity, account)
+            assert isinstance(ledger, reference)
+            assert ledger.number_of_pages == 1
+            assert len(ledger) == len(expected) == 3
+            for row, expected_row in zip(ledger, expected):
+                for field in FIELDS:
+                    assert getattr(row, field) == getattr(expected_row, field)
+            assert ledger.total_debits == Decimal('1.50')
+
+        return
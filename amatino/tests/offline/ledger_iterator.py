@@ -0,0 +1,69 @@
+"""
+Amatino API Python Bindings
+Ledger Iterator Test Module
+Author: hugh@amatino.io
+"""
+import gc
+from datetime import datetime
+from decimal import Decimal
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Account
+from amatino import AMType
+from amatino import Entity
+from amatino import Entry
+from amatino import GlobalUnitConstants
+from amatino import InProcessServer
+from amatino import Ledger
+from amatino import Side
+from amatino import Transaction
+from amatino import Transport
+
+
+class PagingServer(InProcessServer):
+    """An InProcessServer returning one LedgerRow per page"""
+    PAGE_SIZE = 1
+
+
+class LedgerIteratorTest(OfflineTest):
+    """
+    Test that a LedgerIterator dropped without being closed stops
+    retrieving pages
+    """
+
+    def __init__(self, name='Stop prefetching for dropped iterators') -> None:
+        super().__init__(name)
+        return
+
+    def transport(self) -> Transport:
+        return PagingServer()
+
+    def check(self) -> None:
+
+        usd = GlobalUnitConstants.USD
+        session = self.create_session()
+        entity = Entity.create(session, 'Iterator', None)
+        cash = Account.create(entity, 'Cash', AMType.asset, usd)
+        income = Account.create(entity, 'Income', AMType.income, usd)
+        Transaction.create_many(entity, [
+            (
+                datetime(2019, 1, day),
+                [
+                    Entry(Side.debit, Decimal(day), cash),
+                    Entry(Side.credit, Decimal(day), income)
+                ],
+                usd
+            ) for day in range(1, 6)
+        ])
+
+        iterator = Ledger.iterate(entity, cash, window=1)
+        assert iterator.number_of_pages == 5
+        next(iterator)
+        thread = iterator._thread
+
+        del iterator
+        gc.collect()
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+
+        return
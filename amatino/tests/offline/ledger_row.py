@@ -0,0 +1,71 @@
+"""
+Amatino API Python Bindings
+Ledger Row Test Module
+Author: hugh@amatino.io
+"""
+from datetime import datetime
+from datetime import timezone
+from decimal import Decimal
+from amatino.tests.offline.offline import OfflineTest
+from amatino.internal.am_time import AmatinoTime
+from amatino.internal.lazy_ledger_row import LazyLedgerRow
+from amatino import LedgerRow
+
+DATA = [
+    7,
+    '2019-01-02_12:30:00.250000',
+    'Refund',
+    None,
+    None,
+    '0.00',
+    '(1,000.125)',
+    '-989.625'
+]
+
+
+class LedgerRowTest(OfflineTest):
+    """
+    Test that LedgerRows carry no instance dictionary, and that lazily
+    decoded LedgerRows decode each field correctly, once, on first access
+    """
+
+    def __init__(self, name='Decode LedgerRows lazily into slots') -> None:
+        super().__init__(name)
+        return
+
+    def check(self) -> None:
+
+        time = datetime(2019, 1, 2, 12, 30, 0, 250000)
+        row = LedgerRow(
+            7,
+            AmatinoTime(time),
+            'Refund',
+            None,
+            None,
+            Decimal('0.00'),
+            Decimal('-1000.125'),
+            Decimal('-989.625')
+        )
+        lazy_row = LazyLedgerRow(DATA)
+
+        assert not hasattr(row, '__dict__')
+        assert not hasattr(lazy_row, '__dict__')
+
+        # Nothing is decoded until first accessed
+        for slot in ('_time', '_debit', '_credit', '_balance'):
+            assert not hasattr(lazy_row, slot)
+
+        assert lazy_row.transaction_id == row.transaction_id
+        assert lazy_row.transaction_time == time.replace(tzinfo=timezone.utc)
+        assert lazy_row.transaction_time == row.transaction_time
+        assert lazy_row.description == row.description
+        assert lazy_row.opposing_account_id is None
+        assert lazy_row.opposing_account_name is None
+        assert lazy_row.debit == row.debit
+        assert lazy_row.credit == row.credit
+        assert lazy_row.balance == row.balance
+
+        assert lazy_row.credit is lazy_row.credit
+        assert lazy_row.transaction_time is lazy_row.transaction_time
+
+        return
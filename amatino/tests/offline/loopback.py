@@ -0,0 +1,66 @@
+"""
+Amatino API Python Bindings
+Loopback Server Module
+Author: hugh@amatino.io
+"""
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Thread
+from amatino import InProcessServer
+
+
+class LoopbackServer(ThreadingMixIn, HTTPServer):
+    """
+    An HTTP server on 127.0.0.1 relaying requests to an InProcessServer,
+    such that tests may exercise real sockets and the ConnectionPool
+    without network access. Serves from a daemon thread until .close()
+    """
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), LoopbackServer._Handler)
+        self.backend = InProcessServer()
+        self.endpoint = 'http://127.0.0.1:{p}'.format(p=self.server_port)
+        Thread(target=self.serve_forever, daemon=True).start()
+        return
+
+    def close(self) -> None:
+        self.shutdown()
+        self.server_close()
+        return
+
+    def handle_error(self, *_) -> None:
+        # Clients abandoning responses, e.g. closed streams, reset their
+        # connections mid-write, which is expected here
+        return
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _relay(self) -> None:
+            length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(length) if length > 0 else None
+            response = self.server.backend.open(
+                self.command,
+                self.server.endpoint + self.path,
+                body,
+                dict(self.headers.items()),
+                10
+            )
+            response_body = response.read()
+            self.send_response(response.status, response.reason)
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(response_body)))
+            self.end_headers()
+            self.wfile.write(response_body)
+            return
+
+        do_GET = _relay
+        do_POST = _relay
+        do_PUT = _relay
+        do_DELETE = _relay
+
+        def log_message(self, *_) -> None:
+            return
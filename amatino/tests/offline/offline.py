@@ -0,0 +1,77 @@
+"""
+Amatino API Python Bindings
+Offline Test Module
+Author: hugh@amatino.io
+"""
+from amatino.tests.test import Test
+from amatino import AccountCache
+from amatino import InProcessServer
+from amatino import RateLimiter
+from amatino import ResponseCache
+from amatino import RetryPolicy
+from amatino import Session
+from amatino import Transport
+from amatino import UnitCache
+
+
+class OfflineTest(Test):
+    """
+    Abstract class for tests served by an InProcessServer, or by another
+    Transport supplied by the test, requiring neither credentials nor
+    network access. Each test executes with an empty AccountCache and
+    UnitCache, and no ResponseCache. The shared Transport, RetryPolicy, RateLimiter, and caches
+    are restored once a test has executed.
+
+    Subclasses implement .check(), which should raise, typically via a
+    failed assertion, if the test's conditions are not met.
+    """
+
+    def __init__(self, test_name: str) -> None:
+
+        if not isinstance(test_name, str):
+            raise TypeError('test_name must be of type `str`')
+
+        self._name = test_name
+        self._note = None
+        self._passed = None
+
+        return
+
+    def transport(self) -> Transport:
+        """Return the Transport serving this test's requests"""
+        return InProcessServer()
+
+    def create_session(self) -> Session:
+        return Session.create_with_email('offline@example.com', 'secret')
+
+    def check(self) -> None:
+        raise NotImplementedError
+
+    def execute(self) -> None:
+
+        transport = Transport.installed()
+        policy = RetryPolicy.shared()
+        limiter = RateLimiter.shared()
+        accounts = AccountCache.shared()
+        responses = ResponseCache.shared()
+        units = UnitCache.shared()
+
+        try:
+            AccountCache.set_shared(AccountCache())
+            UnitCache.set_shared(UnitCache())
+            ResponseCache.set_shared(None)
+            Transport.set_shared(self.transport())
+            self.check()
+        except Exception as error:
+            self.record_failure(error)
+            return
+        finally:
+            Transport.set_shared(transport)
+            RetryPolicy.set_shared(policy)
+            RateLimiter.set_shared(limiter)
+            AccountCache.set_shared(accounts)
+            UnitCache.set_shared(units)
+            ResponseCache.set_shared(responses)
+
+        self.record_success()
+        return
@@ -0,0 +1,80 @@
+"""
+Amatino API Python Bindings
+Rate Limit Test Module
+Author: hugh@amatino.io
+"""
+import hmac
+import time
+from base64 import b64encode
+from hashlib import sha512
+from typing import Dict
+from typing import List
+from typing import Optional
+from urllib.parse import urlsplit
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Entity
+from amatino import InProcessServer
+from amatino import RateLimiter
+from amatino import Transport
+
+
+class VerifyingServer(InProcessServer):
+    """
+    An InProcessServer checking each signed request's signature against its
+    own clock, as the Amatino API does, and recording whether it was valid
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.api_keys = dict()  # type: Dict[str, str]
+        self.verdicts = list()  # type: List[bool]
+        return
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        if 'X-Signature' in headers:
+            api_key = self.api_keys[str(headers['X-Session-ID'])]
+            message = str(int(time.time())) + urlsplit(url).path
+            expected = b64encode(hmac.new(
+                api_key.encode('utf-8'),
+                message.encode('utf-8'),
+                sha512
+            ).digest()).decode()
+            self.verdicts.append(headers['X-Signature'] == expected)
+        return super().open(method, url, body, headers, timeout)
+
+
+class RateLimitTest(OfflineTest):
+    """Test that throttled requests are signed once the limiter permits"""
+
+    def __init__(self, name='Sign throttled requests after waiting') -> None:
+        super().__init__(name)
+        self.server = VerifyingServer()
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        session = self.create_session()
+        self.server.api_keys[str(session.session_id)] = session.api_key
+
+        # One token every two seconds, such that the second request waits
+        # into a later second than the one in which it was made
+        RateLimiter.set_shared(RateLimiter(rate=0.5, burst=1))
+
+        started = time.monotonic()
+        entity = Entity.create(session, 'Rate Limit', None)
+        Entity.retrieve(session, entity.id_)
+
+        assert time.monotonic() - started > 1.5
+        assert self.server.verdicts == [True, True]
+
+        return
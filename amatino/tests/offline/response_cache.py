@@ -0,0 +1,82 @@
+"""
+Amatino API Python Bindings
+Response Cache Test Module
+Author: hugh@amatino.io
+"""
+from datetime import datetime
+from typing import Dict
+from typing import Optional
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Entity
+from amatino import GlobalUnitConstants
+from amatino import InProcessServer
+from amatino import ResponseCache
+from amatino import Session
+from amatino import Transport
+from amatino import Tree
+
+
+class CountingServer(InProcessServer):
+    """An InProcessServer counting the requests it receives for a path"""
+
+    def __init__(self, path: str, latency: float = 0.0) -> None:
+        super().__init__(latency)
+        self.path = path
+        self.received = 0
+        return
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        if self.path in url:
+            self.received += 1
+        return super().open(method, url, body, headers, timeout)
+
+
+class ResponseCacheTest(OfflineTest):
+    """
+    Test that responses cached for one User are not returned to another
+    """
+
+    def __init__(self, name='Scope cached responses to their User') -> None:
+        super().__init__(name)
+        self.server = CountingServer('/trees?')
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        ResponseCache.set_shared(ResponseCache())
+        usd = GlobalUnitConstants.USD
+        balance_time = datetime(2019, 1, 1)
+
+        session = self.create_session()
+        entity = Entity.create(session, 'Cache', None)
+        Tree.retrieve(entity, balance_time, usd)
+        assert self.server.received == 1
+
+        # Another Session of the same User may share cached responses
+        other_session = self.create_session()
+        Tree.retrieve(
+            Entity.retrieve(other_session, entity.id_),
+            balance_time,
+            usd
+        )
+        assert self.server.received == 1
+
+        other_user = Session.create_with_user_id(2, 'secret')
+        Tree.retrieve(
+            Entity.retrieve(other_user, entity.id_),
+            balance_time,
+            usd
+        )
+        assert self.server.received == 2
+
+        return
@@ -0,0 +1,82 @@
+"""
+Amatino API Python Bindings
+Retry Test Module
+Author: hugh@amatino.io
+"""
+from email.message import Message
+from typing import Dict
+from typing import List
+from typing import Optional
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Entity
+from amatino import InProcessServer
+from amatino import RetryPolicy
+from amatino import Transport
+
+
+class UnavailableServer(InProcessServer):
+    """
+    An InProcessServer answering the first `failures` requests to a path with
+    503 Service Unavailable and a Retry-After header, recording the
+    signature carried by every request to that path
+    """
+
+    def __init__(self, path: str, failures: int, retry_after: int) -> None:
+        super().__init__()
+        self.path = path
+        self.failures = failures
+        self.retry_after = retry_after
+        self.signatures = list()  # type: List[str]
+        return
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        if self.path not in url:
+            return super().open(method, url, body, headers, timeout)
+        self.signatures.append(headers['X-Signature'])
+        if self.failures < 1:
+            return super().open(method, url, body, headers, timeout)
+        self.failures -= 1
+        response_headers = Message()
+        response_headers['Retry-After'] = str(self.retry_after)
+        return Transport.Response(
+            503,
+            'Service Unavailable',
+            response_headers,
+            b'{}'
+        )
+
+
+class RetryTest(OfflineTest):
+    """Test that retried requests are signed afresh for each attempt"""
+
+    def __init__(self, name='Sign each retried attempt afresh') -> None:
+        super().__init__(name)
+        self.server = UnavailableServer('/entities?', 2, 1)
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        RetryPolicy.set_shared(RetryPolicy())
+
+        session = self.create_session()
+        entity = Entity.create(session, 'Retry', None)
+        retrieved = Entity.retrieve(session, entity.id_)
+
+        assert retrieved.id_ == entity.id_
+        assert len(self.server.signatures) == 3
+
+        # Attempts are separated by Retry-After, at least a second, and so
+        # must each carry a signature over a different timestamp
+        assert len(set(self.server.signatures)) == 3
+
+        return
@@ -0,0 +1,61 @@
+"""
+Amatino API Python Bindings
+Signer Test Module
+Author: hugh@amatino.io
+"""
+import hmac
+import time
+from base64 import b64encode
+from hashlib import sha512
+from amatino.tests.offline.offline import OfflineTest
+from amatino.internal.signer import Signer
+from amatino import Session
+
+API_KEY = 'offline api key'
+
+
+class SignerTest(OfflineTest):
+    """
+    Test that memoised signatures match signatures computed afresh from
+    the API key, and that Signers are retained per API key
+    """
+
+    def __init__(self, name='Sign requests from a retained key') -> None:
+        super().__init__(name)
+        return
+
+    def check(self) -> None:
+
+        signer = Signer(API_KEY)
+        paths = ['/accounts', '/entities', '/accounts']
+
+        # Repeat should the second change between signing and checking
+        while True:
+            second = int(time.time())
+            signatures = [signer.sign(p) for p in paths]
+            expected = [self._signature(second, p) for p in paths]
+            if int(time.time()) == second:
+                break
+
+        assert signatures == expected
+        assert signatures[0] != signatures[1]
+
+        for path in range(Signer._MEMO_SIZE * 2):
+            signer.sign('/entities/' + str(path))
+        assert len(signer._memo[1]) <= Signer._MEMO_SIZE
+
+        session = Session(1, 1, API_KEY)
+        assert session.signer() is session.signer()
+        session._api_key = 'another api key'
+        assert session.signer().api_key == 'another api key'
+
+        return
+
+    @staticmethod
+    def _signature(second: int, path: str) -> str:
+        digest = hmac.new(
+            API_KEY.encode('utf-8'),
+            (str(second) + path).encode('utf-8'),
+            sha512
+        ).digest()
+        return b64encode(digest).decode()
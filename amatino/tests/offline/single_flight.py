@@ -0,0 +1,47 @@
+"""
+Amatino API Python Bindings
+Single Flight Test Module
+Author: hugh@amatino.io
+"""
+from concurrent.futures import ThreadPoolExecutor
+from amatino.tests.offline.offline import OfflineTest
+from amatino.tests.offline.response_cache import CountingServer
+from amatino import Entity
+from amatino import Transport
+
+NAME = 'Coalesce concurrent identical retrievals'
+
+
+class SingleFlightTest(OfflineTest):
+    """
+    Test that concurrent identical GET requests by one Session share a
+    single request, while those by different Sessions do not
+    """
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        self.server = CountingServer('/entities?', latency=0.2)
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        first = self.create_session()
+        second = self.create_session()
+        entity = Entity.create(first, 'Single Flight', None)
+        self.server.received = 0
+
+        sessions = [first, second] * 4
+        with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+            retrieved = list(executor.map(
+                lambda s: Entity.retrieve(s, entity.id_),
+                sessions
+            ))
+
+        assert [e.id_ for e in retrieved] == [entity.id_] * len(sessions)
+        assert [e.session for e in retrieved] == sessions
+        assert self.server.received == 2
+
+        return
@@ -0,0 +1,77 @@
+"""
+Amatino API Python Bindings
+Stream Test Module
+Author: hugh@amatino.io
+"""
+import gc
+from datetime import datetime
+from decimal import Decimal
+from amatino.tests.offline.offline import OfflineTest
+from amatino.tests.offline.loopback import LoopbackServer
+from amatino import Account
+from amatino import AMType
+from amatino import ConnectionPool
+from amatino import Entity
+from amatino import Entry
+from amatino import GlobalUnitConstants
+from amatino import Ledger
+from amatino import Side
+from amatino import Transaction
+from amatino import Transport
+
+NAME = 'Release the connections of abandoned streams'
+
+
+class StreamTest(OfflineTest):
+    """
+    Test that streams dropped before iteration return their connections to
+    the ConnectionPool
+    """
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        self.pool = ConnectionPool(max_per_host=2)
+        return
+
+    def transport(self) -> Transport:
+        self.server = LoopbackServer()
+        self.pool.endpoint = self.server.endpoint
+        return self.pool
+
+    def check(self) -> None:
+
+        try:
+            self._check()
+        finally:
+            self.pool.close()
+            self.server.close()
+
+        return
+
+    def _check(self) -> None:
+
+        usd = GlobalUnitConstants.USD
+        session = self.create_session()
+        entity = Entity.create(session, 'Stream', None)
+        cash = Account.create(entity, 'Cash', AMType.asset, usd)
+        income = Account.create(entity, 'Income', AMType.income, usd)
+        Transaction.create(
+            entity,
+            datetime(2019, 1, 1),
+            [
+                Entry(Side.debit, Decimal(10), cash),
+                Entry(Side.credit, Decimal(10), income)
+            ],
+            usd
+        )
+
+        # As many abandoned streams as the pool allows connections
+        for _ in range(self.pool.max_per_host):
+            Ledger.stream(entity, cash)
+        gc.collect()
+
+        rows = list(Ledger.stream(entity, cash))
+        assert len(rows) == 1
+        assert rows[0].balance == Decimal(10)
+
+        return
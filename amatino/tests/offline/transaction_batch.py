@@ -0,0 +1,113 @@
+"""
+Amatino API Python Bindings
+Transaction Batch Test Module
+Author: hugh@amatino.io
+"""
+from datetime import datetime
+from decimal import Decimal
+from email.message import Message
+from typing import Dict
+from typing import Optional
+from amatino.tests.offline.offline import OfflineTest
+from amatino import Account
+from amatino import AMType
+from amatino import BatchError
+from amatino import Entity
+from amatino import Entry
+from amatino import GlobalUnitConstants
+from amatino import InProcessServer
+from amatino import RetryPolicy
+from amatino import Side
+from amatino import Transaction
+from amatino import Transport
+
+NAME = 'Retry throttled Transaction batches whole'
+
+
+class ThrottlingServer(InProcessServer):
+    """
+    An InProcessServer answering the next `throttled` requests to create
+    Transactions with 429 Too Many Requests, counting the requests to create
+    Transactions it receives
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.throttled = 0
+        self.received = 0
+        return
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Transport.Response:
+        if method != 'POST' or '/transactions?' not in url:
+            return super().open(method, url, body, headers, timeout)
+        self.received += 1
+        if self.throttled < 1:
+            return super().open(method, url, body, headers, timeout)
+        self.throttled -= 1
+        response_headers = Message()
+        response_headers['Retry-After'] = '0'
+        return Transport.Response(
+            429,
+            'Too Many Requests',
+            response_headers,
+            b'{}'
+        )
+
+
+class TransactionBatchTest(OfflineTest):
+    """
+    Test that a throttled batch of Transactions is retried as a whole, and
+    failed as a whole once retries are exhausted, rather than split into one
+    request per Transaction
+    """
+
+    def __init__(self, name=NAME) -> None:
+        super().__init__(name)
+        self.server = ThrottlingServer()
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        usd = GlobalUnitConstants.USD
+        session = self.create_session()
+        entity = Entity.create(session, 'Batch', None)
+        cash = Account.create(entity, 'Cash', AMType.asset, usd)
+        income = Account.create(entity, 'Income', AMType.income, usd)
+        transactions = [
+            (
+                datetime(2019, 1, day),
+                [
+                    Entry(Side.debit, Decimal(day), cash),
+                    Entry(Side.credit, Decimal(day), income)
+                ],
+                usd
+            ) for day in range(1, 4)
+        ]
+
+        RetryPolicy.set_shared(RetryPolicy(max_retries=0))
+        self.server.throttled = 1
+        try:
+            Transaction.create_many(entity, transactions)
+        except BatchError as error:
+            assert len(error.errors) == 3
+        else:
+            raise AssertionError('Throttled batch was created')
+        assert self.server.received == 1
+
+        RetryPolicy.set_shared(RetryPolicy())
+        self.server.throttled = 1
+        created = Transaction.create_many(entity, transactions)
+        assert len(created) == 3
+        assert self.server.received == 3
+
+        return
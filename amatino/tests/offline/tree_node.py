@@ -0,0 +1,121 @@
+"""
+Amatino API Python Bindings
+Tree Node Test Module
+Author: hugh@amatino.io
+"""
+import sys
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from amatino.tests.offline.offline import OfflineTest
+from amatino.tests.offline.response_cache import CountingServer
+from amatino import Account
+from amatino import AccountCache
+from amatino import AMType
+from amatino import Entity
+from amatino import GlobalUnitConstants
+from amatino import Transport
+from amatino import Tree
+from amatino import TreeNode
+
+
+def node_data(
+    account_id: int,
+    depth: int,
+    children: Optional[List[Any]]
+) -> Dict[str, Any]:
+    return {
+        'account_id': account_id,
+        'depth': depth,
+        'account_balance': '1.00',
+        'recursive_balance': '(2.50)',
+        'name': 'Account ' + str(account_id),
+        'type': AMType.asset.value,
+        'children': children
+    }
+
+
+class TreeNodeTest(OfflineTest):
+    """
+    Test that TreeNodes decode hierarchies of any depth in order, and that
+    the Accounts they describe are retrieved in a single batch
+    """
+
+    def __init__(self, name='Decode TreeNodes without recursion') -> None:
+        super().__init__(name)
+        self.server = CountingServer('/accounts?')
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        session = self.create_session()
+        entity = Entity.create(session, 'Nodes', None)
+
+        self._check_hierarchy(entity)
+        self._check_batch(entity)
+
+        return
+
+    @staticmethod
+    def _check_hierarchy(entity: Entity) -> None:
+
+        depth = sys.getrecursionlimit() + 100
+        deepest = node_data(depth, depth, None)
+        for level in reversed(range(1, depth)):
+            deepest = node_data(level, level, [deepest])
+
+        roots = TreeNode.decode_many(entity, [
+            node_data(0, 0, [
+                node_data(-3, 1, []),
+                node_data(-1, 1, None),
+                node_data(-2, 1, [])
+            ]),
+            deepest
+        ])
+
+        assert [r.account_id for r in roots] == [0, 1]
+        children = roots[0].children
+        assert [c.account_id for c in children] == [-3, -1, -2]
+        assert children[0].children == []
+        assert children[0].has_children is False
+        assert children[1].children is None
+        assert children[1].has_children is False
+        assert roots[0].account_balance == Decimal('1.00')
+        assert roots[0].recursive_balance == Decimal('-2.50')
+
+        node = roots[1]
+        levels = 1
+        while node.children is not None:
+            assert len(node.children) == 1
+            assert node.depth == levels
+            node = node.children[0]
+            levels += 1
+        assert levels == depth
+        assert node.account_id == depth
+
+        return
+
+    def _check_batch(self, entity: Entity) -> None:
+
+        usd = GlobalUnitConstants.USD
+        assets = Account.create(entity, 'Assets', AMType.asset, usd)
+        for name in ('Cash', 'Bank', 'Receivables'):
+            Account.create(entity, name, AMType.asset, usd, None, assets)
+        AccountCache.shared().clear()
+        self.server.received = 0
+
+        tree = Tree.retrieve(entity, datetime(2019, 1, 1), usd)
+        nodes = tree.assets + tree.assets[0].children
+        assert len(nodes) == 4
+        for node in nodes:
+            assert node.account.id_ == node.account_id
+
+        assert self.server.received == 1
+
+        return
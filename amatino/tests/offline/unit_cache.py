@@ -0,0 +1,63 @@
+"""
+Amatino API Python Bindings
+Unit Cache Test Module
+Author: hugh@amatino.io
+"""
+from amatino.tests.offline.offline import OfflineTest
+from amatino.tests.offline.response_cache import CountingServer
+from amatino import CustomUnit
+from amatino import Entity
+from amatino import Transport
+from amatino import UnitCache
+
+
+class UnitCacheTest(OfflineTest):
+    """
+    Test that cached Custom Units are served to the Session that retrieved
+    them, and to no other, until they are updated
+    """
+
+    def __init__(self, name='Scope cached Custom Units to their Session'):
+        super().__init__(name)
+        self.server = CountingServer('/custom_units?')
+        return
+
+    def transport(self) -> Transport:
+        return self.server
+
+    def check(self) -> None:
+
+        cache = UnitCache.shared()
+        first = self.create_session()
+        entity = Entity.create(first, 'Units', None)
+        created = CustomUnit.create(
+            entity,
+            'Points',
+            'PTS',
+            2,
+            'Loyalty points',
+            1
+        )
+        self.server.received = 0
+
+        unit = cache.denomination(entity, None, created.id_)
+        assert cache.denomination(entity, None, created.id_) is unit
+        assert self.server.received == 1
+
+        second = self.create_session()
+        other_entity = Entity.retrieve(second, entity.id_)
+        other_unit = cache.denomination(other_entity, None, created.id_)
+        assert other_unit is not unit
+        assert other_unit.session is second
+        assert self.server.received == 2
+
+        updated = unit.update(name='Renamed Points')
+        assert self.server.received == 3
+        assert cache.denomination(entity, None, created.id_) is updated
+
+        # The unit cached for the second Session was discarded on update
+        retrieved = cache.denomination(other_entity, None, created.id_)
+        assert retrieved.name == 'Renamed Points'
+        assert self.server.received == 4
+
+        return
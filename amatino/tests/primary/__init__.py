@@ -1,3 +1,4 @@
 from amatino.tests.primary.entity import EntityTest
 from amatino.tests.primary.account import AccountTest
 from amatino.tests.primary.transaction import TransactionTest
+from amatino.tests.primary.transaction_batch import TransactionBatchTest
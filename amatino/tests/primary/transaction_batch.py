@@ -0,0 +1,95 @@
+"""
+Amatino API Python Bindings
+Transaction Batch Test Module
+Author: hugh@amatino.io
+"""
+from datetime import datetime
+from decimal import Decimal
+from amatino import Side
+from amatino import Entry
+from amatino import Transaction
+from amatino import BatchError
+from amatino.tests.primary.transaction import TransactionTest
+
+NAME = 'Create many Transactions in batches'
+
+
+class TransactionBatchTest(TransactionTest):
+    """Test batched Transaction creation"""
+
+    def __init__(self, name=NAME) -> None:
+
+        super().__init__(name)
+        return
+
+    def transaction_arguments(self, amount: Decimal, description: str):
+        return (
+            datetime.utcnow(),
+            [
+                Entry(Side.debit, amount, self.asset),
+                Entry(Side.credit, amount, self.liability)
+            ],
+            self.usd,
+            description
+        )
+
+    def execute(self) -> None:
+
+        arguments = [
+            self.transaction_arguments(Decimal(i + 1), 'Batch ' + str(i))
+            for i in range(25)
+        ]
+
+        try:
+            transactions = Transaction.create_many(self.entity, arguments)
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        if len(transactions) != 25:
+            self.record_failure('Unexpected number of Transactions created')
+            return
+
+        for index, transaction in enumerate(transactions):
+            if transaction.description != 'Batch ' + str(index):
+                self.record_failure('Transactions returned out of order')
+                return
+
+        ids = [t.id_ for t in transactions]
+
+        try:
+            retrieved = Transaction.retrieve_set(self.entity, ids, self.usd)
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        if len(retrieved.missing_ids) > 0:
+            self.record_failure('Created Transactions reported missing')
+            return
+
+        if sorted(retrieved.transactions.keys()) != sorted(ids):
+            self.record_failure('Unexpected Transactions retrieved')
+            return
+
+        arguments = [
+            self.transaction_arguments(Decimal(1), 'Valid'),
+            (datetime.utcnow(), list(), 'Not a denomination')
+        ]
+
+        try:
+            Transaction.create_many(self.entity, arguments)
+            self.record_failure('Invalid Transaction did not raise')
+            return
+        except BatchError as error:
+            if list(error.errors.keys()) != [1]:
+                self.record_failure('Unexpected failed indexes')
+                return
+            if not isinstance(error.results[0], Transaction):
+                self.record_failure('Valid Transaction not created')
+                return
+        except Exception as error:
+            self.record_failure(error)
+            return
+
+        self.record_success()
+        return
@@ -8,6 +8,7 @@ Provides a constant manifest of tests to execute
 import amatino.tests.primary as primary
 import amatino.tests.ancillary as ancillary
 import amatino.tests.derived as derived
+import amatino.tests.offline as offline
 from amatino.tests.ancillary.custom_unit import CustomUnitTest
 from amatino.tests.ancillary.tx_version_list import TxVersionListTest
 
@@ -19,13 +20,45 @@ SEQUENCE = [
     primary.EntityTest,
     primary.AccountTest,
     primary.TransactionTest,
+    primary.TransactionBatchTest,
     derived.LedgerTest,
+    derived.LedgerIterateTest,
+    derived.LedgerRetrieveAllTest,
+    derived.LedgerStreamTest,
     derived.RecursiveLedgerTest,
     derived.BalanceTest,
     derived.RecursiveBalanceTest,
     derived.PositionTest,
     derived.PerformanceTest,
     derived.TreeTest,
+    derived.TreeIndexTest,
+    derived.ChartOfAccountsTest,
+    derived.AioTest,
     ancillary.UserListTest,
     TxVersionListTest
 ]
+
+OFFLINE_SEQUENCE = [
+    offline.ConnectionPoolTest,
+    offline.RetryTest,
+    offline.RateLimitTest,
+    offline.StreamTest,
+    offline.AccountCacheTest,
+    offline.AccountBatchTest,
+    offline.ResponseCacheTest,
+    offline.TransactionBatchTest,
+    offline.CassetteTest,
+    offline.LedgerIteratorTest,
+    offline.SingleFlightTest,
+    offline.CompressionTest,
+    offline.SignerTest,
+    offline.UnitCacheTest,
+    offline.AmatinoTimeTest,
+    offline.LedgerColumnsTest,
+    offline.LedgerRowTest,
+    offline.InProcessServerTest,
+    offline.InstrumentationTest,
+    offline.TreeNodeTest,
+    offline.AsyncConnectionPoolTest,
+    offline.ProxyTest
+]
@@ -13,18 +13,28 @@ from amatino.denomination import Denomination
 from amatino.internal.encodable import Encodable
 from amatino.internal.constrained_string import ConstrainedString
 from amatino.internal.am_time import AmatinoTime
+from amatino.internal.unit_cache import UnitCache
 from amatino.internal.api_request import ApiRequest
+from amatino.internal.response_cache import ResponseCache
 from amatino.internal.data_package import DataPackage
 from amatino.internal.http_method import HTTPMethod
 from amatino.internal.url_target import UrlTarget
 from amatino.internal.url_parameters import UrlParameters
+from amatino.internal.json_stream import JsonStream
 from amatino.api_error import ApiError
 from amatino.missing_key import MissingKey
+from amatino.internal.errors.not_found import ResourceNotFound
 from amatino.internal.am_amount import AmatinoAmount
 from decimal import Decimal
 from typing import TypeVar, Optional, Type, Any, List, Dict
+from typing import Iterable, Iterator, Tuple
+from urllib.error import HTTPError
+from concurrent.futures import ThreadPoolExecutor
+from amatino.amatino_error import AmatinoError
+from amatino.batch_error import BatchError
 from amatino.internal.immutable import Immutable
 from collections.abc import Sequence
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Transaction')
 
@@ -49,7 +59,9 @@ class Transaction(Sequence):
     """
     _PATH = '/transactions'
     MAX_DESCRIPTION_LENGTH = 1024
+    MAX_BATCH_SIZE = 10
     _URL_KEY = 'transaction_id'
+    _INVALID_STATUSES = (400, 422)
 
     def __init__(
         self,
@@ -111,7 +123,120 @@ class Transaction(Sequence):
             description
         )
 
-        data = DataPackage.from_object(arguments)
+        return cls._create(entity, [arguments])[0]
+
+    @classmethod
+    def create_many(
+        cls: Type[T],
+        entity: Entity,
+        transactions: Iterable[Tuple[Any, ...]],
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 4
+    ) -> List[T]:
+        """
+        Create many Transactions, supplied as an iterable of tuples of
+        (time, entries, denomination, description), where description is
+        optional. Transactions are sent to the API in batches of up to
+        `batch_size`, with up to `max_workers` batches in flight at once.
+
+        Return created Transactions in the order they were supplied. If any
+        Transaction could not be created, raise a BatchError describing
+        which, and holding those that were created.
+        """
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        if (
+                not isinstance(batch_size, int)
+                or not 0 < batch_size <= cls.MAX_BATCH_SIZE
+        ):
+            raise ValueError(
+                'batch_size must be an `int` between 1 and {}'.format(
+                    cls.MAX_BATCH_SIZE
+                )
+            )
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise TypeError('max_workers must be a positive `int`')
+
+        arguments = list()
+        errors = dict()  # type: Dict[int, Exception]
+        count = 0
+
+        for index, transaction in enumerate(transactions):
+            count += 1
+            try:
+                arguments.append((index, cls.CreateArguments(*transaction)))
+            except (TypeError, ValueError, AmatinoError) as error:
+                errors[index] = error
+
+        batches = [
+            arguments[i:i + batch_size]
+            for i in range(0, len(arguments), batch_size)
+        ]
+
+        results = [None] * count  # type: List[Optional[T]]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(
+                lambda b: cls._create_batch(entity, b),
+                batches
+            )
+            for outcome in outcomes:
+                for index, result in outcome:
+                    if isinstance(result, Exception):
+                        errors[index] = result
+                        continue
+                    results[index] = result
+
+        if len(errors) > 0:
+            raise BatchError(results, errors)
+
+        return results
+
+    @classmethod
+    def _create_batch(
+        cls: Type[T],
+        entity: Entity,
+        batch: List[Tuple[int, 'Transaction.CreateArguments']]
+    ) -> List[Tuple[int, Any]]:
+        """
+        Create a batch of Transactions, returning each input index paired
+        with either the created Transaction or the error preventing its
+        creation.
+        """
+        indexes = [b[0] for b in batch]
+
+        try:
+            created = cls._create(entity, [b[1] for b in batch])
+        except HTTPError as error:
+            if len(batch) < 2 or error.code not in cls._INVALID_STATUSES:
+                return [(i, error) for i in indexes]
+            # The API rejected the batch's content, so none of it was
+            # created. Create each Transaction alone to attribute the failure.
+            # Other refusals, such as 429, would only be multiplied.
+            outcomes = list()
+            for item in batch:
+                outcomes.extend(cls._create_batch(entity, [item]))
+            return outcomes
+        except Exception as error:
+            return [(i, error) for i in indexes]
+
+        if len(created) != len(batch):
+            error = ApiError('Unexpected number of Transactions created')
+            return [(i, error) for i in indexes]
+
+        return list(zip(indexes, created))
+
+    @classmethod
+    def _create(
+        cls: Type[T],
+        entity: Entity,
+        arguments: List['Transaction.CreateArguments']
+    ) -> List[T]:
+        """Create Transactions in a single request"""
+
+        data = DataPackage(list_data=arguments)
         parameters = UrlParameters(entity_id=entity.id_)
 
         request = ApiRequest(
@@ -122,9 +247,9 @@ class Transaction(Sequence):
             url_parameters=parameters
         )
 
-        transaction = cls._decode(entity, request.response_data)
+        ResponseCache.entity_changed(entity)
 
-        return transaction
+        return cls.decode_many(entity, request.response_data)
 
     @classmethod
     def retrieve(
@@ -134,17 +259,53 @@ class Transaction(Sequence):
         denomination: Denomination
     ) -> T:
         """Return a retrieved Transaction"""
-        return cls.retrieve_many(entity, [id_], denomination)[0]
+        retrieved = cls.retrieve_set(entity, [id_], denomination)
+        if len(retrieved.missing_ids) > 0:
+            raise ResourceNotFound
+        return retrieved.transactions[id_]
 
     @classmethod
     def retrieve_many(
         cls: Type[T],
         entity: Entity,
         ids: List[int],
-        denomination: Denomination
+        denomination: Denomination,
+        chunk_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 4
     ) -> List[T]:
-        """Return many retrieved Transactions"""
+        """
+        Return many retrieved Transactions, ordered as their ids were
+        supplied. Ids not found are omitted: Use .retrieve_set() to learn
+        which ids they were.
+        """
+        retrieved = cls.retrieve_set(
+            entity,
+            ids,
+            denomination,
+            chunk_size,
+            max_workers
+        )
+        return [
+            retrieved.transactions[i]
+            for i in retrieved.ids
+            if i in retrieved.transactions
+        ]
 
+    @classmethod
+    def retrieve_set(
+        cls: Type[T],
+        entity: Entity,
+        ids: List[int],
+        denomination: Denomination,
+        chunk_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 4
+    ) -> 'Transaction.RetrievedSet':
+        """
+        Return a RetrievedSet of Transactions, keyed by id, along with any
+        ids that were not found. Ids are requested in chunks of up to
+        `chunk_size`, with up to `max_workers` chunks in flight at once.
+        Repeated ids are requested once.
+        """
         if not isinstance(entity, Entity):
             raise TypeError('entity must be of type `Entity`')
 
@@ -154,28 +315,152 @@ class Transaction(Sequence):
         if False in [isinstance(i, int) for i in ids]:
             raise TypeError('ids must be of type `int`')
 
+        if (
+                not isinstance(chunk_size, int)
+                or not 0 < chunk_size <= cls.MAX_BATCH_SIZE
+        ):
+            raise ValueError(
+                'chunk_size must be an `int` between 1 and {}'.format(
+                    cls.MAX_BATCH_SIZE
+                )
+            )
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise TypeError('max_workers must be a positive `int`')
+
+        unique = list(dict.fromkeys(ids))
+        chunks = [
+            unique[i:i + chunk_size]
+            for i in range(0, len(unique), chunk_size)
+        ]
+
+        def retrieve(chunk: List[int]) -> Dict[int, T]:
+            return cls._retrieve_chunk(entity, chunk, denomination)
+
+        if len(chunks) < 2 or max_workers < 2:
+            outcomes = [retrieve(c) for c in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(retrieve, chunks))
+
+        transactions = dict()  # type: Dict[int, T]
+        for outcome in outcomes:
+            transactions.update(outcome)
+
+        missing = [i for i in unique if i not in transactions]
+
+        return Transaction.RetrievedSet(unique, transactions, missing)
+
+    @classmethod
+    def stream(
+        cls: Type[T],
+        entity: Entity,
+        ids: List[int],
+        denomination: Denomination,
+        chunk_size: int = MAX_BATCH_SIZE
+    ) -> Iterator[T]:
+        """
+        Return an iterator over retrieved Transactions, each decoded as it
+        arrives from the Amatino API. Ids are requested in chunks of up to
+        `chunk_size`, one chunk at a time as iteration proceeds, such that
+        memory use is bounded however many ids are supplied. Transactions
+        are yielded in the order the API returns them. Ids not found are
+        skipped.
+        """
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type `Entity`')
+
+        if not isinstance(ids, list):
+            raise TypeError('ids must be of type `list`')
+
+        if False in [isinstance(i, int) for i in ids]:
+            raise TypeError('ids must be of type `int`')
+
+        if (
+                not isinstance(chunk_size, int)
+                or not 0 < chunk_size <= cls.MAX_BATCH_SIZE
+        ):
+            raise ValueError(
+                'chunk_size must be an `int` between 1 and {}'.format(
+                    cls.MAX_BATCH_SIZE
+                )
+            )
+
+        unique = list(dict.fromkeys(ids))
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        def decode(data: Any) -> T:
+            return cls._decode_one(entity, data)
+
+        for start in range(0, len(unique), chunk_size):
+            chunk = unique[start:start + chunk_size]
+            data = DataPackage(list_data=[cls.RetrieveArguments(
+                i, denomination, None
+            ) for i in chunk])
+            try:
+                chunks = ApiRequest.stream(
+                    path=Transaction._PATH,
+                    method=HTTPMethod.GET,
+                    credentials=entity.session,
+                    data=data,
+                    url_parameters=parameters
+                )
+            except ResourceNotFound:
+                found = cls._retrieve_chunk(entity, chunk, denomination)
+                yield from [found[i] for i in chunk if i in found]
+                continue
+            with JsonStream(chunks, decode=decode) as transactions:
+                yield from transactions
+
+        return
+
+    @classmethod
+    def _retrieve_chunk(
+        cls: Type[T],
+        entity: Entity,
+        ids: List[int],
+        denomination: Denomination
+    ) -> Dict[int, T]:
+        """
+        Retrieve a chunk of Transactions in a single request, returning
+        those found keyed by id.
+        """
         parameters = UrlParameters(entity_id=entity.id_)
 
         data = DataPackage(list_data=[cls.RetrieveArguments(
             i, denomination, None
         ) for i in ids])
 
-        request = ApiRequest(
-            path=Transaction._PATH,
-            method=HTTPMethod.GET,
-            credentials=entity.session,
-            data=data,
-            url_parameters=parameters
-        )
+        try:
+            request = ApiRequest(
+                path=Transaction._PATH,
+                method=HTTPMethod.GET,
+                credentials=entity.session,
+                data=data,
+                url_parameters=parameters
+            )
+        except ResourceNotFound:
+            if len(ids) < 2:
+                return dict()
+            # The API may refuse a whole chunk for want of one Transaction.
+            # Halve the chunk until the missing Transactions are isolated.
+            middle = len(ids) // 2
+            found = cls._retrieve_chunk(entity, ids[:middle], denomination)
+            found.update(
+                cls._retrieve_chunk(entity, ids[middle:], denomination)
+            )
+            return found
 
-        transactions = cls.decode_many(
+        if request.response_data == []:
+            return dict()
+
+        return {t.id_: t for t in cls.decode_many(
             entity,
             request.response_data
-        )
-
-        return transactions
+        )}
 
     @classmethod
+    @Instrumentation.decoder
     def _decode(
         cls: Type[T],
         entity: Entity,
@@ -185,6 +470,7 @@ class Transaction(Sequence):
         return cls.decode_many(entity, data)[0]
 
     @classmethod
+    @Instrumentation.decoder
     def decode_many(
         cls: Type[T],
         entity: Entity,
@@ -197,30 +483,33 @@ class Transaction(Sequence):
         if len(data) < 1:
             raise ApiError('Unexpected empty response data')
 
-        def decode(data: dict) -> T:
-            if not isinstance(data, dict):
-                raise ApiError('Unexpected non-dict data returned')
-            try:
-                transaction = cls(
-                    entity=entity,
-                    transaction_id=data['transaction_id'],
-                    transaction_time=AmatinoTime.decode(
-                        data['transaction_time']
-                    ),
-                    version_time=AmatinoTime.decode(data['version_time']),
-                    description=data['description'],
-                    entries=cls._decode_entries(data['entries']),
-                    global_unit_id=data['global_unit_denomination'],
-                    custom_unit_id=data['custom_unit_denomination']
-                )
-            except KeyError as error:
-                raise MissingKey(error.args[0])
+        transactions = [cls._decode_one(entity, t) for t in data]
 
-            return transaction
+        return transactions
 
-        transactions = [decode(t) for t in data]
+    @classmethod
+    def _decode_one(cls: Type[T], entity: Entity, data: Any) -> T:
+
+        if not isinstance(data, dict):
+            raise ApiError('Unexpected non-dict data returned')
+
+        try:
+            transaction = cls(
+                entity=entity,
+                transaction_id=data['transaction_id'],
+                transaction_time=AmatinoTime.decode(
+                    data['transaction_time']
+                ),
+                version_time=AmatinoTime.decode(data['version_time']),
+                description=data['description'],
+                entries=cls._decode_entries(data['entries']),
+                global_unit_id=data['global_unit_denomination'],
+                custom_unit_id=data['custom_unit_denomination']
+            )
+        except KeyError as error:
+            raise MissingKey(error.args[0])
 
-        return transactions
+        return transaction
 
     def update(
         self: T,
@@ -250,6 +539,8 @@ class Transaction(Sequence):
             url_parameters=parameters
         )
 
+        ResponseCache.entity_changed(self.entity)
+
         transaction = Transaction._decode(
             self.entity,
             request.response_data
@@ -277,6 +568,8 @@ class Transaction(Sequence):
             url_parameters=parameters
         )
 
+        ResponseCache.entity_changed(self.entity)
+
         return
 
     def restore(self) -> None:
@@ -291,10 +584,9 @@ class Transaction(Sequence):
 
     def _denomination(self) -> Denomination:
         """Return the Denomination of this Transaction"""
-        if self.global_unit_id is not None:
-            return GlobalUnit.retrieve(self.entity.session, self.global_unit_id)
-        return CustomUnit.retrieve(
+        return UnitCache.shared().denomination(
             self.entity,
+            self.global_unit_id,
             self.custom_unit_id
         )
 
@@ -361,6 +653,29 @@ class Transaction(Sequence):
             }
             return data
 
+    class RetrievedSet:
+        """
+        The outcome of Transaction.retrieve_set(). Retrieved Transactions
+        are available in .transactions, keyed by id, and the ids of any
+        Transactions not found are available in .missing_ids.
+        """
+        def __init__(
+            self,
+            ids: List[int],
+            transactions: Dict[int, 'Transaction'],
+            missing_ids: List[int]
+        ) -> None:
+
+            self._ids = ids
+            self._transactions = transactions
+            self._missing_ids = missing_ids
+
+            return
+
+        ids = Immutable(lambda s: s._ids)
+        transactions = Immutable(lambda s: s._transactions)
+        missing_ids = Immutable(lambda s: s._missing_ids)
+
     class CreateArguments(Encodable):
         def __init__(
             self,
@@ -13,10 +13,13 @@ from datetime import datetime
 from decimal import Decimal
 from amatino.am_type import AMType
 from amatino.denominated import Denominated
+from amatino.node_indexed import NodeIndexed
 from amatino.denomination import Denomination
 from amatino.decodable import Decodable
 from amatino.internal.data_package import DataPackage
 from amatino.internal.api_request import ApiRequest
+from amatino.internal.response_cache import ResponseCache
+from amatino.internal.json_stream import JsonStream
 from amatino.internal.url_parameters import UrlParameters
 from amatino.internal.http_method import HTTPMethod
 from amatino.internal.encodable import Encodable
@@ -28,12 +31,13 @@ from amatino.tree_node import TreeNode
 from amatino.internal.immutable import Immutable
 from amatino.global_unit import GlobalUnit
 from amatino.custom_unit import CustomUnit
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='Tree')
 K = TypeVar('K', bound='Tree.RetrieveArguments')
 
 
-class Tree(Decodable, Denominated):
+class Tree(Decodable, Denominated, NodeIndexed):
     """
     Trees present the entire chart of Accounts of an Entity in a single
     hierarchical object.
@@ -129,6 +133,7 @@ class Tree(Decodable, Denominated):
         return total
 
     @classmethod
+    @Instrumentation.decoder
     def decode(cls: Type[T], entity: Entity, data: Any) -> T:
 
         if not isinstance(data, dict):
@@ -166,20 +171,30 @@ class Tree(Decodable, Denominated):
         return cls._retrieve(entity, arguments)
 
     @classmethod
-    def _retrieve(
+    def stream(
         cls: Type[T],
         entity: Entity,
-        arguments: K
-    ) -> T:
-
+        balance_time: datetime,
+        denomination: Denomination
+    ) -> JsonStream:
+        """
+        Return an iterator over the top level TreeNodes of a Tree, each
+        decoded, along with its children, as it arrives from the Amatino API
+        rather than once the whole Tree has been received. The remaining Tree
+        attributes are available as raw data in the iterator's .fields once
+        iteration has finished. Streamed Trees are not cached.
+        """
         if not isinstance(entity, Entity):
             raise TypeError('entity must be of type Entity')
 
-        assert isinstance(arguments, cls.RetrieveArguments)
+        arguments = cls.RetrieveArguments(
+            balance_time=balance_time,
+            denomination=denomination
+        )
         data = DataPackage(object_data=arguments, override_listing=True)
         parameters = UrlParameters(entity_id=entity.id_)
 
-        request = ApiRequest(
+        chunks = ApiRequest.stream(
             path=cls._PATH,
             method=HTTPMethod.GET,
             credentials=entity.session,
@@ -187,7 +202,50 @@ class Tree(Decodable, Denominated):
             url_parameters=parameters
         )
 
-        return cls.decode(entity, request.response_data)
+        batch = list()  # type: List[int]
+
+        def decode(node_data: Any) -> TreeNode:
+            return TreeNode._decode_forest(entity, [node_data], batch)[0]
+
+        return JsonStream(chunks, 'tree', decode)
+
+    @classmethod
+    def _retrieve(
+        cls: Type[T],
+        entity: Entity,
+        arguments: K
+    ) -> T:
+
+        if not isinstance(entity, Entity):
+            raise TypeError('entity must be of type Entity')
+
+        assert isinstance(arguments, cls.RetrieveArguments)
+        data = DataPackage(object_data=arguments, override_listing=True)
+        parameters = UrlParameters(entity_id=entity.id_)
+
+        def retrieve() -> Any:
+            return ApiRequest(
+                path=cls._PATH,
+                method=HTTPMethod.GET,
+                credentials=entity.session,
+                data=data,
+                url_parameters=parameters
+            ).response_data
+
+        response_data = ResponseCache.fetch(
+            entity,
+            cls._PATH,
+            data,
+            cls._as_of(arguments),
+            retrieve
+        )
+
+        return cls.decode(entity, response_data)
+
+    @classmethod
+    def _as_of(cls: Type[T], arguments: K) -> datetime:
+        """Return the balance time of the Tree the arguments describe"""
+        return arguments._balance_time.raw
 
     class RetrieveArguments(Encodable):
         def __init__(
@@ -8,6 +8,7 @@ from typing import Type
 from typing import Any
 from typing import List
 from typing import Optional
+from typing import Dict
 from amatino.decodable import Decodable
 from amatino.missing_key import MissingKey
 from amatino.am_type import AMType
@@ -17,9 +18,12 @@ from amatino.unexpected_response_type import UnexpectedResponseType
 from amatino.account import Account
 from amatino.internal.am_amount import AmatinoAmount
 from decimal import Decimal
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='TreeNode')
 
+_AM_TYPES = {t.value: t for t in AMType}
+
 
 class TreeNode(Decodable):
     """
@@ -89,47 +93,99 @@ class TreeNode(Decodable):
     account = Immutable(lambda s: s._account())
 
     _node_cached_account = None
+    _node_account_batch = None
 
     def _account(self) -> Account:
         """
         Return the Account this TreeNode describes. Cache it for repeated
-        requests.
+        requests. Accounts described by other TreeNodes decoded alongside
+        this one are retrieved in the same request.
         """
         if isinstance(self._node_cached_account, Account):
             return self._node_cached_account
-        account = Account.retrieve(
-            session=self.entity.session,
+        account = Account.lookup(
             entity=self.entity,
-            account_id=self.account_id
+            account_id=self.account_id,
+            batch=self._node_account_batch
         )
         self._node_cached_account = account
         return account
 
     @classmethod
+    @Instrumentation.decoder
     def decode(cls: Type[T], entity: Entity, data: Any) -> T:
+        return cls._decode_forest(entity, [data])[0]
 
-        if not isinstance(data, dict):
-            raise UnexpectedResponseType(data, dict)
+    @classmethod
+    @Instrumentation.decoder
+    def decode_many(cls: Type[T], entity: Entity, data: Any) -> List[T]:
+        if not isinstance(data, list):
+            raise UnexpectedResponseType(data, list)
+        return cls._decode_forest(entity, data)
+
+    @classmethod
+    def _decode_forest(
+        cls: Type[T],
+        entity: Entity,
+        data: List[Any],
+        batch: Optional[List[int]] = None
+    ) -> List[T]:
+        """
+        Return TreeNodes decoded from a list of raw API node data. Nested
+        nodes are decoded using an explicit stack rather than recursion, such
+        that each node is validated and built exactly once, whatever the
+        depth of the hierarchy. Each node is built with an empty list of
+        children, filled as its children are decoded. Accounts described by
+        the nodes are retrieved in one batch, optionally shared with nodes
+        decoded elsewhere.
+        """
+        roots = list()  # type: List[T]
+        if batch is None:
+            batch = list()
+        amounts = dict()  # type: Dict[str, Decimal]
+        stack = [(d, roots) for d in reversed(data)]
+
+        def amount(string: Any) -> Decimal:
+            if string not in amounts:
+                amounts[string] = AmatinoAmount.decode(string)
+            return amounts[string]
 
         try:
-            children = None
-            if data['children'] is not None:
-                children = [cls.decode(entity, d) for d in data['children']]
-            node = cls(
-                entity=entity,
-                account_id=data['account_id'],
-                depth=data['depth'],
-                account_balance=AmatinoAmount.decode(
-                    data['account_balance']
-                ),
-                recursive_balance=AmatinoAmount.decode(
-                    data['recursive_balance']
-                ),
-                name=data['name'],
-                am_type=AMType(data['type']),
-                children=children
-            )
+            while len(stack) > 0:
+                node_data, siblings = stack.pop()
+
+                if not isinstance(node_data, dict):
+                    raise UnexpectedResponseType(node_data, dict)
+
+                children_data = node_data['children']
+                children = None
+                if children_data is not None:
+                    if not isinstance(children_data, list):
+                        raise UnexpectedResponseType(children_data, list)
+                    children = list()  # type: Optional[List[T]]
+                    stack.extend([
+                        (d, children) for d in reversed(children_data)
+                    ])
+
+                am_type = _AM_TYPES.get(node_data['type'])
+                if am_type is None:
+                    am_type = AMType(node_data['type'])
+
+                node = cls(
+                    entity,
+                    node_data['account_id'],
+                    node_data['depth'],
+                    amount(node_data['account_balance']),
+                    amount(node_data['recursive_balance']),
+                    node_data['name'],
+                    am_type,
+                    children
+                )
+                node._node_account_batch = batch
+                batch.append(node._account_id)
+                siblings.append(node)
+
         except KeyError as error:
             raise MissingKey(error.args[0])
 
-        return node
+        return roots
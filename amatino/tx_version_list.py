@@ -14,6 +14,7 @@ from amatino.api_error import ApiError
 from amatino.missing_key import MissingKey
 from typing import TypeVar, Type, List, Any
 from collections.abc import Sequence
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='TransactionVersionList')
 
@@ -101,6 +102,7 @@ class TransactionVersionList(Sequence):
         return cls._decode(entity, request.response_data)
 
     @classmethod
+    @Instrumentation.decoder
     def _decode(cls: Type[T], entity: Entity, data: Any) -> T:
 
         if not isinstance(data, list):
@@ -13,6 +13,7 @@ from amatino.internal.data_package import DataPackage
 from amatino.unexpected_response_type import UnexpectedResponseType
 from amatino.internal.encodable import Encodable
 from typing import TypeVar, Dict, Type, Optional, List, Any
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='User')
 K = TypeVar('K', bound='User.CreateArguments')
@@ -141,10 +142,12 @@ class User:
         return users
 
     @classmethod
+    @Instrumentation.decoder
     def decode(cls: Type[T], session: Session, data: Any) -> T:
         return cls.decode_many(session, [data])[0]
 
     @classmethod
+    @Instrumentation.decoder
     def decode_many(cls: Type[T], session: Session, data: Any) -> List[T]:
         """Return a list of Users decoded from API response data"""
 
@@ -14,6 +14,7 @@ from amatino.internal.http_method import HTTPMethod
 from amatino.api_error import ApiError
 from amatino.missing_key import MissingKey
 from collections.abc import Sequence
+from amatino.internal.instrumentation import Instrumentation
 
 T = TypeVar('T', bound='UserList')
 
@@ -135,6 +136,7 @@ class UserList(Sequence):
         return cls.decode(session, request.response_data)
 
     @classmethod
+    @Instrumentation.decoder
     def decode(
         cls: Type[T],
         session: Session,
@@ -0,0 +1,71 @@
+"""
+Amatino API Python Bindings
+Benchmark Entrypoint
+Author: hugh@amatino.io
+
+Measures the throughput of the library's hot paths offline, against
+synthetic or recorded payloads and an in-process stand-in server, and emits
+the results as JSON. Options:
+
+--output, -o <path>     Write results to a file rather than stdout
+--only <name>           Run only the named benchmark. May be repeated
+--payloads <directory>  Decode recorded ledger.json, tree.json, and
+                        transactions.json responses where present
+--repeats <n>           Samples taken per benchmark (default 5)
+"""
+import json
+import platform
+import sys
+from datetime import datetime
+
+OUTPUT = None
+ONLY = None
+PAYLOADS = None
+REPEATS = 5
+
+ARGUMENTS = sys.argv[1:]
+i = 0
+for argument in ARGUMENTS:
+    if argument in ('--output', '-o'):
+        OUTPUT = ARGUMENTS[i + 1]
+    if argument == '--only':
+        ONLY = (ONLY or list()) + [ARGUMENTS[i + 1]]
+    if argument == '--payloads':
+        PAYLOADS = ARGUMENTS[i + 1]
+    if argument == '--repeats':
+        REPEATS = int(ARGUMENTS[i + 1])
+    i += 1
+
+if __name__ == '__main__':
+    from amatino.benchmarks import Benchmark
+    from amatino.benchmarks import Payloads
+    from amatino.benchmarks.benchmark_sequence import SEQUENCE
+
+    with open('VERSION', 'r') as version_file:
+        version = version_file.read().strip()
+
+    Payloads.load(PAYLOADS)
+
+    results = list()
+    for benchmark in Benchmark.select(SEQUENCE, ONLY):
+        results.append(benchmark.execute(repeats=REPEATS))
+        print(
+            '{name}: {operations_per_second:,.0f} ops/s'.format(**results[-1]),
+            file=sys.stderr
+        )
+
+    report = json.dumps({
+        'version': version,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'time': datetime.utcnow().isoformat(),
+        'payloads': PAYLOADS or 'synthetic',
+        'results': results
+    }, indent=2)
+
+    if OUTPUT is None:
+        print(report)
+    else:
+        with open(OUTPUT, 'w') as output_file:
+            output_file.write(report + '\n')
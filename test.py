@@ -6,6 +6,10 @@ ONE_ONLY = False
 if '--single' in sys.argv[1:] or '-s' in sys.argv[1:]:
     ONE_ONLY = True
 
+OFFLINE = False
+if '--offline' in sys.argv[1:] or '-o' in sys.argv[1:]:
+    OFFLINE = True
+
 START_INDEX = 0
 i = 0
 for argument in sys.argv[1:]:
@@ -16,6 +20,9 @@ for argument in sys.argv[1:]:
 
 if __name__ == '__main__':
     from amatino.tests.test_sequence import SEQUENCE
+    from amatino.tests.test_sequence import OFFLINE_SEQUENCE
+    if OFFLINE:
+        SEQUENCE = OFFLINE_SEQUENCE
     print(EXECUTION_MESSAGE)
     i = -1
     for test in SEQUENCE: